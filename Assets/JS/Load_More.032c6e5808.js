@@ -0,0 +1,39 @@
+// Appends older articles to the blog listing in place, from the card shards
+// written by generate_article.py (blog-data/<page>.json). Each shard holds the
+// cards of one archive page and the URL of the next older shard. Cards already
+// on the page are skipped. The pagination links stay for crawlers and for
+// visitors without JavaScript.
+(function () {
+  const button = document.getElementById('blog-load-more');
+  const container = document.querySelector('.blog-container');
+  if (!button || !container || !window.fetch) return;
+  let next = button.dataset.shard;
+
+  function shown(href) {
+    return Array.from(container.querySelectorAll('a')).some(link => link.getAttribute('href') === href);
+  }
+
+  function loadMore() {
+    button.disabled = true;
+    fetch(next)
+      .then(response => {
+        if (!response.ok) throw new Error(`${response.status} ${next}`);
+        return response.json();
+      })
+      .then(shard => {
+        shard.cards.filter(card => !shown(card.href)).forEach(card => {
+          container.insertAdjacentHTML('beforeend', card.html);
+        });
+        next = shard.next;
+        button.disabled = false;
+        button.hidden = !next;
+      })
+      .catch(() => {
+        // Fall back to the archive pages
+        button.hidden = true;
+      });
+  }
+
+  button.addEventListener('click', loadMore);
+  button.hidden = false;
+})();
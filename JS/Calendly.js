@@ -0,0 +1,82 @@
+// Opens booking links (<a data-calendly href="https://calendly.com/...">) in the
+// Calendly popup. The widget is fetched the first time a visitor hovers, focuses
+// or touches one of them, or right away when this script has data-load="eager".
+// Without JavaScript, or if the widget fails to load, the link opens Calendly.
+// With data-badge-url set, a floating badge link is drawn in the corner as well.
+// Inline schedulers (<div class="calendly-inline-widget" data-url="...">) load
+// the widget when they are about to scroll into view.
+(function () {
+  const WIDGET = 'https://assets.calendly.com/assets/external/widget';
+  const options = document.currentScript ? document.currentScript.dataset : {};
+  let widget = null;
+
+  function loadWidget() {
+    if (!widget) {
+      widget = new Promise((resolve, reject) => {
+        const style = document.createElement('link');
+        style.rel = 'stylesheet';
+        style.href = `${WIDGET}.css`;
+        document.head.appendChild(style);
+        const script = document.createElement('script');
+        script.src = `${WIDGET}.js`;
+        script.async = true;
+        script.onload = resolve;
+        script.onerror = reject;
+        document.head.appendChild(script);
+      });
+    }
+    return widget;
+  }
+
+  function addBadge() {
+    const badge = document.createElement('a');
+    badge.href = options.badgeUrl;
+    badge.textContent = options.badgeText || 'Schedule a Call';
+    badge.dataset.calendly = '';
+    badge.style.cssText = 'position:fixed;right:20px;bottom:15px;z-index:9998;padding:10px 17px;'
+      + 'border-radius:25px;box-shadow:0 2px 5px rgba(0,0,0,.25);font:700 14px Arial,sans-serif;'
+      + `text-decoration:none;background:${options.badgeColor};color:${options.badgeTextColor};`;
+    document.body.appendChild(badge);
+  }
+
+  if (options.badgeUrl) {
+    addBadge();
+  }
+
+  document.querySelectorAll('a[data-calendly]').forEach(link => {
+    ['pointerenter', 'focus', 'touchstart'].forEach(type => {
+      link.addEventListener(type, loadWidget, { once: true, passive: true });
+    });
+    link.addEventListener('click', event => {
+      event.preventDefault();
+      loadWidget().then(
+        () => Calendly.initPopupWidget({ url: link.href }),
+        () => { window.location.href = link.href; }
+      );
+    });
+  });
+
+  function initInline(element) {
+    // widget.js fills in the schedulers on the page when it first runs
+    if (!element.querySelector('iframe')) {
+      Calendly.initInlineWidget({ url: element.dataset.url, parentElement: element });
+    }
+  }
+
+  const inline = document.querySelectorAll('.calendly-inline-widget[data-url]');
+  if (inline.length && 'IntersectionObserver' in window) {
+    const observer = new IntersectionObserver(entries => {
+      entries.filter(entry => entry.isIntersecting).forEach(entry => {
+        observer.unobserve(entry.target);
+        loadWidget().then(() => initInline(entry.target), () => {});
+      });
+    }, { rootMargin: '400px' });
+    inline.forEach(element => observer.observe(element));
+  } else if (inline.length) {
+    loadWidget().then(() => inline.forEach(initInline), () => {});
+  }
+
+  if (options.load === 'eager') {
+    loadWidget();
+  }
+})();
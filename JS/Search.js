@@ -0,0 +1,113 @@
+// Client-side article search over the index built by generate_search_index.py.
+// The index is only fetched once the reader focuses the search box.
+(function () {
+  const form = document.getElementById('blog-search');
+  if (!form) return;
+  const input = document.getElementById('blog-search-input');
+  const results = document.getElementById('blog-search-results');
+  const status = document.getElementById('blog-search-status');
+  let index = null;
+  let loading = null;
+
+  const stopWords = new Set((
+    'a about after all also an and any are as at be been but by can could do does for from had has ' +
+    'have how i if in into is it its just more most my no not of on one or our out so some such than ' +
+    'that the their them then there these they this to up us was we were what when which who why will ' +
+    'with would you your').split(' '));
+
+  // Same rules as stem() in generate_search_index.py
+  function stem(word) {
+    if (word.length <= 3) return word;
+    if (word.endsWith('ies') && word.length > 4) {
+      word = word.slice(0, -3) + 'y';
+    } else if (word.endsWith('s') && !/(ss|us|is)$/.test(word)) {
+      word = word.slice(0, -1);
+    }
+    for (const suffix of ['ing', 'ed', 'ly']) {
+      if (word.endsWith(suffix) && word.length - suffix.length >= 3) {
+        word = word.slice(0, -suffix.length);
+        const last = word[word.length - 1];
+        if (last === word[word.length - 2] && !'lsz'.includes(last)) word = word.slice(0, -1);
+        break;
+      }
+    }
+    if (word.endsWith('e') && word.length > 3) word = word.slice(0, -1);
+    return word;
+  }
+
+  function tokenize(text) {
+    const words = text.toLowerCase().replace(/['’]/g, '').match(/[a-z0-9]+/g) || [];
+    return words.filter(word => !stopWords.has(word)).map(stem);
+  }
+
+  function loadIndex() {
+    if (!loading) {
+      loading = fetch(form.dataset.index)
+        .then(response => response.json())
+        .then(data => {
+          index = data;
+          index.termList = Object.keys(data.terms);
+        });
+    }
+    return loading;
+  }
+
+  // Every word must match; the last one also matches as a prefix while typing
+  function search(query) {
+    const words = tokenize(query);
+    if (!words.length) return [];
+    let scores = null;
+    words.forEach((word, position) => {
+      const postingLists = position === words.length - 1
+        ? index.termList.filter(term => term.startsWith(word)).map(term => index.terms[term])
+        : [index.terms[word] || []];
+      const wordScores = new Map();
+      for (const postings of postingLists) {
+        for (let i = 0; i < postings.length; i += 2) {
+          wordScores.set(postings[i], (wordScores.get(postings[i]) || 0) + postings[i + 1]);
+        }
+      }
+      if (scores === null) {
+        scores = wordScores;
+      } else {
+        for (const [doc, score] of scores) {
+          if (wordScores.has(doc)) scores.set(doc, score + wordScores.get(doc));
+          else scores.delete(doc);
+        }
+      }
+    });
+    return [...scores.keys()].sort((a, b) => scores.get(b) - scores.get(a) || a - b);
+  }
+
+  function render(query) {
+    results.innerHTML = '';
+    if (!query.trim()) {
+      status.textContent = '';
+      return;
+    }
+    const matches = search(query);
+    status.textContent = matches.length
+      ? `${matches.length} article${matches.length === 1 ? '' : 's'} found`
+      : 'No articles found';
+    for (const doc of matches.slice(0, 10)) {
+      const [safeTitle, title, date, summary] = index.docs[doc];
+      const item = document.createElement('li');
+      const link = document.createElement('a');
+      link.href = `/Articles/Article_HTMLs/${safeTitle}`;
+      link.textContent = title;
+      const meta = document.createElement('span');
+      meta.textContent = date;
+      const text = document.createElement('p');
+      text.textContent = summary;
+      item.append(link, meta, text);
+      results.appendChild(item);
+    }
+  }
+
+  input.addEventListener('focus', loadIndex, { once: true });
+  input.addEventListener('input', () => loadIndex().then(() => render(input.value)));
+  form.addEventListener('submit', event => {
+    event.preventDefault();
+    loadIndex().then(() => render(input.value));
+  });
+})();
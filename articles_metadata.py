@@ -0,0 +1,119 @@
+import os
+import sys
+import json
+import bisect
+
+from build_manifest import write_if_changed
+
+METADATA_NAME = "articles_metadata.json"
+
+def sort_key(article):
+    """Sort key for a metadata record: ISO dates sort the same as the dates themselves."""
+    return (article["parsed_date"], article["safe_title"])
+
+def title_key(safe_title):
+    """Normalize a safe_title: older records and --delete arguments may end in .html."""
+    return safe_title.removesuffix(".html")
+
+class MetadataStore:
+    """articles_metadata.json held sorted by date and indexed by safe_title.
+
+    Records keep parsed_date as an ISO string, so nothing is re-parsed on
+    load. The file is written newest first, which is the order every page
+    lists articles in; a file in any other order is sorted once on load.
+    Legacy safe_titles ending in .html are migrated on load too.
+    """
+
+    def __init__(self, articles_dir):
+        self.path = os.path.join(articles_dir, METADATA_NAME)
+        self.keys = []     # sort keys, oldest first, for bisect
+        self.records = []  # records in the same order as keys
+        self.by_title = {}
+        self.dirty = False
+
+    def load(self):
+        """Read the metadata file. Returns self."""
+        print(f"📂 Attempting to load: {self.path}")
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                articles = json.load(f)
+        except Exception as e:
+            print(f"❌ Error reading {self.path}: {e}")
+            sys.exit(1)
+
+        articles.reverse()
+        for article in articles:
+            if article["safe_title"] != title_key(article["safe_title"]):
+                article["safe_title"] = title_key(article["safe_title"])
+                self.dirty = True
+        keys = [sort_key(a) for a in articles]
+        if any(keys[i] > keys[i + 1] for i in range(len(keys) - 1)):
+            order = sorted(range(len(articles)), key=keys.__getitem__)
+            articles = [articles[i] for i in order]
+            keys = [keys[i] for i in order]
+            self.dirty = True
+        self.records, self.keys = articles, keys
+        self.by_title = {a["safe_title"]: a for a in articles}
+        print(f"✅ Loaded {len(articles)} articles from {self.path}")
+        return self
+
+    def __len__(self):
+        return len(self.records)
+
+    def __contains__(self, safe_title):
+        return title_key(safe_title) in self.by_title
+
+    def get(self, safe_title):
+        """Return the record for safe_title, or None."""
+        return self.by_title.get(title_key(safe_title))
+
+    def newest_first(self):
+        """Return every record, newest first."""
+        return self.records[::-1]
+
+    def _remove(self, article):
+        position = bisect.bisect_left(self.keys, sort_key(article))
+        del self.keys[position]
+        del self.records[position]
+
+    def upsert(self, article):
+        """Insert or replace a record by safe_title. Returns "added", "updated" or "unchanged"."""
+        article = dict(article, safe_title=title_key(article["safe_title"]))
+        existing = self.by_title.get(article["safe_title"])
+        if existing == article:
+            return "unchanged"
+        if existing is not None:
+            self._remove(existing)
+        key = sort_key(article)
+        position = bisect.bisect_right(self.keys, key)
+        self.keys.insert(position, key)
+        self.records.insert(position, article)
+        self.by_title[article["safe_title"]] = article
+        self.dirty = True
+        return "added" if existing is None else "updated"
+
+    def delete(self, safe_title):
+        """Remove a record by safe_title. Returns True if it existed."""
+        existing = self.by_title.pop(title_key(safe_title), None)
+        if existing is None:
+            return False
+        self._remove(existing)
+        self.dirty = True
+        return True
+
+    def save(self):
+        """Write the metadata back, newest first, if anything changed.
+
+        The file is replaced atomically, so a crash mid-write never leaves
+        it truncated.
+        """
+        if not self.dirty:
+            return
+        print(f"📝 Saving metadata to: {self.path}")
+        try:
+            write_if_changed(self.path, json.dumps(self.newest_first(), indent=2))
+        except Exception as e:
+            print(f"❌ Error writing {self.path}: {e}")
+            sys.exit(1)
+        self.dirty = False
+        print(f"✅ Updated {METADATA_NAME} with {len(self)} articles")
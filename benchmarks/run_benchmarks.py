@@ -0,0 +1,248 @@
+#python benchmarks/run_benchmarks.py
+#python benchmarks/run_benchmarks.py --sizes 100,10000 --baseline benchmarks/baseline.json
+#python benchmarks/run_benchmarks.py --save-baseline
+
+import os
+import sys
+import json
+import time
+import shutil
+import platform
+import tempfile
+import argparse
+import contextlib
+import subprocess
+import tracemalloc
+from datetime import datetime, timezone
+
+try:
+    import resource
+except ImportError:  # Not available on Windows; peak memory is left out there
+    resource = None
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARKS_DIR))
+
+from synthetic_corpus import generate_corpus
+
+DEFAULT_SIZES = [100, 10000, 100000]
+DEFAULT_OUTPUT = os.path.join(BENCHMARKS_DIR, "results.json")
+DEFAULT_BASELINE = os.path.join(BENCHMARKS_DIR, "baseline.json")
+# Rendering cost per article doesn't depend on the corpus size, so by
+# default only this many pages are rendered and timed per size
+DEFAULT_RENDER_SAMPLE = 1000
+# A stage is a regression when it is this much slower (or bigger) per item
+# than the baseline, and slower by more than the noise floor overall
+DEFAULT_THRESHOLD = 0.25
+NOISE_FLOOR = 0.05  # seconds
+
+def peak_rss():
+    """Peak resident memory of this process in bytes, or None where it can't be read."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # Linux reports KiB
+
+@contextlib.contextmanager
+def stage(stages, name, items):
+    """Time the block with the build's progress prints silenced and record it in stages.
+
+    process_peak_rss_bytes is the process high-water mark once the stage is
+    done, so it includes every earlier stage. When tracemalloc is tracing
+    (--trace-memory), peak_alloc_bytes is the stage's own peak: the most
+    Python memory allocated at once during the stage, above what was
+    allocated when it started.
+    """
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.reset_peak()
+        allocated = tracemalloc.get_traced_memory()[0]
+    with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        yield
+        seconds = time.perf_counter() - start
+    stages[name] = {"seconds": seconds, "items": items, "process_peak_rss_bytes": peak_rss()}
+    memory = ""
+    if tracing:
+        stages[name]["peak_alloc_bytes"] = tracemalloc.get_traced_memory()[1] - allocated
+        memory = f"  {stages[name]['peak_alloc_bytes'] / 1e6:9.1f} MB"
+    print(f"   {name:<20} {seconds:9.3f}s  {items:>7} item(s){memory}", flush=True)
+
+def run_size(size, render_sample, seed):
+    """Build a synthetic site of size articles in the current folder and time each stage."""
+    # Imported here so the modules' cwd-based defaults point at the corpus
+    from generate_article import (
+        blog_pages, build_context, generate_article_html, generate_blog_html, load_articles_metadata,
+        parse_article_metadata,
+    )
+    from generate_sitemap import generate_sitemap
+    from articles_metadata import MetadataStore
+    from build_manifest import BuildManifest
+
+    articles_dir = "Articles"
+    stages = {}
+    with stage(stages, "generate corpus", size):
+        paths = generate_corpus(size, ".", seed)
+        paths = [os.path.relpath(path) for path in paths]
+
+    with stage(stages, "parse metadata", size):
+        records = [parse_article_metadata(path) for path in paths]
+
+    with stage(stages, "save metadata", size):
+        store = MetadataStore(articles_dir)
+        for record in records:
+            store.upsert(record)
+        store.save()
+
+    with stage(stages, "load metadata", size):
+        articles = load_articles_metadata(articles_dir).newest_first()
+
+    with stage(stages, "build context", 1):
+        context = build_context("")
+
+    sample = paths[:render_sample] if render_sample else paths
+    with stage(stages, "render articles", len(sample)):
+        for path in sample:
+            generate_article_html(path, context=context)
+
+    with stage(stages, "blog pagination", len(blog_pages(articles))):
+        generate_blog_html(articles, "", context=context)
+
+    with stage(stages, "sitemap", len(articles)):
+        generate_sitemap(articles, BuildManifest(articles_dir), "sitemap.xml", os.getcwd())
+
+    return {"articles": size, "stages": stages, "peak_rss_bytes": peak_rss()}
+
+def run_in_subprocess(size, render_sample, seed, keep, trace_memory=False):
+    """Run one size in a fresh interpreter and temp folder, so peak memory is per size."""
+    root = tempfile.mkdtemp(prefix=f"provision-bench-{size}-")
+    result_file = os.path.join(root, "result.json")
+    print(f"📊 Benchmarking {size} articles in: {root}", flush=True)
+    try:
+        command = [sys.executable, os.path.abspath(__file__), "--worker", str(size), result_file,
+                   "--render-sample", str(render_sample), "--seed", str(seed)]
+        if trace_memory:
+            command.append("--trace-memory")
+        subprocess.run(command, cwd=root, check=True)
+        with open(result_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (subprocess.CalledProcessError, OSError, ValueError) as e:
+        print(f"❌ Error benchmarking {size} articles: {e}")
+        sys.exit(1)
+    finally:
+        if not keep:
+            shutil.rmtree(root, ignore_errors=True)
+
+def per_item(entry):
+    return entry["seconds"] / max(entry["items"], 1)
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """Print each stage against the baseline and return the regressions found.
+
+    Stages are compared per item, so a run with a different render sample
+    still compares fairly.
+    """
+    regressions = []
+    print(f"📈 Comparing against baseline from {baseline.get('created', 'unknown date')}:")
+    if results.get("trace_memory") != baseline.get("trace_memory"):
+        print("⚠️ Only one of the runs traced memory (--trace-memory), so timings aren't comparable")
+    for size, run in results["sizes"].items():
+        base = baseline.get("sizes", {}).get(size)
+        if base is None:
+            print(f"   {size} articles: no baseline, skipped")
+            continue
+        for name, entry in run["stages"].items():
+            old = base["stages"].get(name)
+            if old is None:
+                continue
+            ratio = per_item(entry) / per_item(old) if per_item(old) else float("inf")
+            slower = entry["seconds"] - old["seconds"] * entry["items"] / max(old["items"], 1)
+            regressed = ratio > 1 + threshold and slower > NOISE_FLOOR
+            print(f"   {'❌' if regressed else '✅'} {size:>7} {name:<20} {ratio:6.2f}x")
+            if regressed:
+                regressions.append(f"{size} articles, {name}: {ratio:.2f}x slower")
+            if entry.get("peak_alloc_bytes") and old.get("peak_alloc_bytes"):
+                ratio = entry["peak_alloc_bytes"] / old["peak_alloc_bytes"]
+                regressed = ratio > 1 + threshold
+                print(f"   {'❌' if regressed else '✅'} {size:>7} {name + ' memory':<20} {ratio:6.2f}x")
+                if regressed:
+                    regressions.append(f"{size} articles, {name} memory: {ratio:.2f}x larger")
+        if run["peak_rss_bytes"] and base.get("peak_rss_bytes"):
+            ratio = run["peak_rss_bytes"] / base["peak_rss_bytes"]
+            regressed = ratio > 1 + threshold
+            print(f"   {'❌' if regressed else '✅'} {size:>7} {'peak memory':<20} {ratio:6.2f}x")
+            if regressed:
+                regressions.append(f"{size} articles, peak memory: {ratio:.2f}x larger")
+    return regressions
+
+def write_json(path, data):
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+            f.write("\n")
+    except Exception as e:
+        print(f"❌ Error writing {path}: {e}")
+        sys.exit(1)
+    print(f"✅ Results written to: {path}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the build pipeline on synthetic article corpora.")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help=f"comma-separated corpus sizes (default: {','.join(map(str, DEFAULT_SIZES))})")
+    parser.add_argument("--render-sample", type=int, default=DEFAULT_RENDER_SAMPLE, metavar="N",
+                        help=f"article pages rendered per size, 0 for all (default: {DEFAULT_RENDER_SAMPLE})")
+    parser.add_argument("--seed", type=int, default=0, help="corpus random seed (default: 0)")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="where to write the results JSON")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE,
+                        help="baseline JSON to compare against, if it exists")
+    parser.add_argument("--save-baseline", action="store_true", help="also store the results as the baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"allowed slowdown before a stage counts as a regression (default: {DEFAULT_THRESHOLD})")
+    parser.add_argument("--keep", action="store_true", help="keep the generated corpora")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="record each stage's own peak allocation with tracemalloc (slows every stage down,"
+                             " so compare timings only against baselines recorded the same way)")
+    parser.add_argument("--worker", nargs=2, metavar=("SIZE", "RESULT_FILE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        size, result_file = args.worker
+        if args.trace_memory:
+            tracemalloc.start()
+        write_json(result_file, run_size(int(size), args.render_sample, args.seed))
+        return
+
+    try:
+        sizes = [int(size) for size in args.sizes.split(",")]
+    except ValueError:
+        print(f"❌ Error: --sizes must be comma-separated integers, got: {args.sizes}")
+        sys.exit(1)
+
+    results = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "render_sample": args.render_sample,
+        "trace_memory": args.trace_memory,
+        "sizes": {},
+    }
+    for size in sizes:
+        results["sizes"][str(size)] = run_in_subprocess(
+            size, args.render_sample, args.seed, args.keep, args.trace_memory
+        )
+    write_json(args.output, results)
+
+    regressions = []
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.threshold)
+    if args.save_baseline:
+        write_json(args.baseline, results)
+    if regressions:
+        print(f"❌ {len(regressions)} regression(s) against {args.baseline}:")
+        for regression in regressions:
+            print(f"   {regression}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
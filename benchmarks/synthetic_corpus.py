@@ -0,0 +1,93 @@
+#python benchmarks/synthetic_corpus.py 10000 /tmp/corpus
+
+import os
+import sys
+import random
+import shutil
+import argparse
+from datetime import date, timedelta
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Site folders a build reads besides the articles themselves; generated
+# outputs inside them are left behind
+SITE_FOLDERS = ["Templates", "Styles", "JS", "Images", "Articles/Article_Images"]
+SKIPPED_OUTPUTS = shutil.ignore_patterns("Bundles", "Responsive", "*.gz", "*.br")
+
+WORDS = (
+    "bookkeeping account balance ledger payroll invoice expense revenue reconcile quarterly "
+    "statement cash flow budget owner business tax deduction depreciation asset liability "
+    "equity vendor client receipt audit compliance report forecast margin profit loss "
+    "contractor employee property construction interest capital review monthly annual "
+    "system process software cloud entry journal category class location project"
+).split()
+
+FIRST_DATE = date(2015, 1, 1)
+
+def sentence(rng, low=8, high=20):
+    words = rng.choices(WORDS, k=rng.randint(low, high))
+    return " ".join(words).capitalize() + "."
+
+def paragraph(rng, sentences=3):
+    return " ".join(sentence(rng) for _ in range(sentences))
+
+def article_text(index, rng, images):
+    """Return one article in the new_article.txt format, sized like the real ones."""
+    title = f"{' '.join(rng.choices(WORDS, k=5)).title()} {index}"
+    published = FIRST_DATE + timedelta(days=rng.randint(0, 365 * 10))
+    lines = [
+        f"Title: {title}",
+        "Author: Matthew Jacob",
+        f"Date: {published.strftime('%B')} {published.day}, {published.year}",
+        f"ReadTime: {rng.randint(3, 15)} min",
+        f"Image: {rng.choice(images)}",
+        "",
+        "Summary:",
+        paragraph(rng, 4),
+        "",
+    ]
+    for _ in range(rng.randint(3, 6)):
+        lines.append(f"Section:{sentence(rng, 4, 8).rstrip('.')}")
+        lines.extend(paragraph(rng) for _ in range(rng.randint(3, 7)))
+        lines.append("")
+    lines += ["Final:", "Final Thoughts", paragraph(rng), paragraph(rng), ""]
+    return "\n".join(lines)
+
+def copy_site(root):
+    """Copy the templates, styles, scripts and images a build needs into root."""
+    for folder in SITE_FOLDERS:
+        source = os.path.join(REPO_ROOT, *folder.split("/"))
+        shutil.copytree(source, os.path.join(root, *folder.split("/")), ignore=SKIPPED_OUTPUTS, dirs_exist_ok=True)
+    os.makedirs(os.path.join(root, "Articles", "Article_HTMLs"), exist_ok=True)
+
+def generate_corpus(size, root, seed=0):
+    """Write a site with size synthetic articles into root. Returns the .txt paths.
+
+    The same size and seed always produce the same corpus.
+    """
+    copy_site(root)
+    images = sorted(
+        name for name in os.listdir(os.path.join(root, "Articles", "Article_Images"))
+        if os.path.isfile(os.path.join(root, "Articles", "Article_Images", name))
+    )
+    rng = random.Random(seed)
+    paths = []
+    for index in range(size):
+        path = os.path.join(root, "Articles", f"article_{index:06d}.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(article_text(index, rng, images))
+        paths.append(path)
+    return paths
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write a site with a synthetic article corpus.")
+    parser.add_argument("size", type=int, help="number of articles")
+    parser.add_argument("root", help="folder to write the site into")
+    parser.add_argument("--seed", type=int, default=0, help="random seed (default: 0)")
+    args = parser.parse_args()
+
+    if os.path.exists(args.root) and os.listdir(args.root):
+        print(f"❌ Error: {args.root} is not empty")
+        sys.exit(1)
+    paths = generate_corpus(args.size, args.root, args.seed)
+    print(f"✅ Wrote {len(paths)} articles to: {os.path.join(args.root, 'Articles')}")
@@ -0,0 +1,152 @@
+import os
+import sys
+import json
+import hashlib
+
+MANIFEST_NAME = ".build_manifest.json"
+
+def hash_bytes(data):
+    """Return the sha256 hex digest of some bytes or text."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+def hash_file(path):
+    """Return the sha256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class HashingWriter:
+    """Write-only text stream that UTF-8 encodes into a binary file while hashing."""
+
+    def __init__(self, f):
+        self.f = f
+        self.digest = hashlib.sha256()
+
+    def write(self, text):
+        data = text.encode("utf-8")
+        self.digest.update(data)
+        self.f.write(data)
+
+def replace_if_changed(tmp_path, path, content_hash=None):
+    """Move a finished temp file over path only if its content differs; otherwise delete it.
+
+    Returns (content_hash, written). Unchanged files keep their mtime.
+    """
+    content_hash = content_hash or hash_file(tmp_path)
+    if os.path.exists(path) and hash_file(path) == content_hash:
+        os.remove(tmp_path)
+        return content_hash, False
+    os.replace(tmp_path, path)
+    return content_hash, True
+
+def render_if_changed(path, render):
+    """Stream render(out) into a temp file and move it over path only if the content changed.
+
+    Returns (content_hash, written). Unchanged files keep their mtime.
+    """
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            out = HashingWriter(f)
+            render(out)
+        return replace_if_changed(tmp_path, path, out.digest.hexdigest())
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def write_if_changed(path, content):
+    """Write text to path unless the file already holds exactly that content."""
+    return render_if_changed(path, lambda out: out.write(content))
+
+class BuildManifest:
+    """Content hashes of build inputs and outputs, stored in Articles/.build_manifest.json.
+
+    Output paths are keyed relative to the site root so the manifest is
+    portable between checkouts. An output is current when the hash of its
+    inputs matches the recorded one and the file on disk is unchanged.
+    Without a template_version the recorded one is kept, for tools that
+    only read or annotate the manifest (e.g. generate_sitemap).
+    """
+
+    def __init__(self, articles_dir, template_version=None):
+        self.articles_dir = articles_dir
+        self.root = os.path.dirname(articles_dir)
+        self.path = os.path.join(articles_dir, MANIFEST_NAME)
+        self.template_version = template_version
+        self.data = {"template_version": template_version, "sources": {}, "outputs": {}}
+        self.written = []
+        self.skipped = []
+
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self.data.update(json.load(f))
+            except Exception as e:
+                print(f"⚠️ Warning: Could not read {self.path}: {e}. Rebuilding everything.")
+        if template_version is None:
+            self.template_version = self.data["template_version"] or ""
+        else:
+            self.data["template_version"] = template_version
+
+    def set_template_version(self, template_version):
+        """Change the version mixed into every inputs hash, e.g. once shared assets are built."""
+        self.template_version = template_version
+        self.data["template_version"] = template_version
+
+    def key(self, path):
+        """Return the manifest key for a path (relative to the site root, forward slashes)."""
+        return os.path.relpath(path, self.root or ".").replace(os.sep, "/")
+
+    def hash_source(self, path):
+        """Hash a source file, record it, and return the hash."""
+        source_hash = hash_file(path)
+        self.data["sources"][self.key(path)] = source_hash
+        return source_hash
+
+    def inputs_hash(self, *parts):
+        """Combine input hashes/values with the template version into one hash."""
+        return hash_bytes("\0".join([self.template_version, *map(str, parts)]))
+
+    def is_current(self, path, inputs):
+        """True when path was built from these inputs and hasn't changed on disk since."""
+        entry = self.data["outputs"].get(self.key(path))
+        if not entry or entry.get("inputs") != inputs or not os.path.exists(path):
+            return False
+        return hash_file(path) == entry.get("hash")
+
+    def skip(self, path):
+        """Record that an output was left untouched."""
+        self.skipped.append(path)
+
+    def record(self, path, inputs, content_hash, written):
+        """Record an output built from inputs, e.g. by a worker process."""
+        self.data["outputs"][self.key(path)] = {"inputs": inputs, "hash": content_hash}
+        (self.written if written else self.skipped).append(path)
+
+    def write_output(self, path, render, inputs):
+        """Stream render(out) to path unless the file already holds exactly that content.
+
+        Returns True if the file was (re)written. Either way the output is
+        recorded against its inputs so the next build can skip it.
+        """
+        content_hash, written = render_if_changed(path, render)
+        self.record(path, inputs, content_hash, written)
+        return written
+
+    def save(self):
+        """Write the manifest back to disk if anything in it changed.
+
+        The file is replaced atomically, so a crash mid-write never leaves
+        it truncated (which would force a full rebuild).
+        """
+        content = json.dumps(self.data, indent=2, sort_keys=True) + "\n"
+        try:
+            if write_if_changed(self.path, content)[1]:
+                print(f"✅ Build manifest written to: {self.path}")
+        except Exception as e:
+            print(f"❌ Error writing {self.path}: {e}")
+            sys.exit(1)
@@ -0,0 +1,128 @@
+import os
+import sys
+import json
+import time
+import cProfile
+import threading
+import contextlib
+
+class BuildMetrics:
+    """Per-stage timers and named counters for one build run.
+
+    Stages are timed in the order they run and printed as a timing table
+    or a single summary line. Spans recorded from other threads (e.g.
+    network requests) only show up in the Chrome trace.
+    """
+
+    def __init__(self, name="build"):
+        self.name = name
+        self.origin = time.perf_counter()
+        self.stages = []    # (name, start offset, seconds)
+        self.spans = []     # (name, start offset, seconds, thread id)
+        self.counters = {}
+        self.profiler = None
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """Time the block as one build stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages.append((name, start - self.origin, time.perf_counter() - start))
+
+    def span(self, name, start, seconds, thread_id=None):
+        """Record something timed elsewhere; start is a time.perf_counter() value."""
+        self.spans.append((name, start - self.origin, seconds, thread_id or threading.get_ident()))
+
+    def count(self, name, n=1):
+        """Add n to a counter."""
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def total_seconds(self):
+        return sum(seconds for _, _, seconds in self.stages)
+
+    def print_summary(self):
+        """Print how long each stage took, then the counters."""
+        print("⏱️ Timing summary:")
+        for name, _, seconds in self.stages:
+            print(f"   {name:<20} {seconds:8.3f}s")
+        print(f"   {'total':<20} {self.total_seconds():8.3f}s")
+        for name, value in self.counters.items():
+            print(f"   {name:<20} {value:>9}")
+
+    def summary_line(self):
+        """Return every stage and counter on one key=value line, for logs and scripts."""
+        fields = [f"total={self.total_seconds():.3f}s"]
+        fields += [f"{name.replace(' ', '_')}={seconds:.3f}s" for name, _, seconds in self.stages]
+        fields += [f"{name}={value}" for name, value in self.counters.items()]
+        return f"📊 {self.name} {' '.join(fields)}"
+
+    def start_profile(self):
+        """Start collecting cProfile stats for this thread."""
+        self.profiler = cProfile.Profile()
+        self.profiler.enable()
+
+    def write_profile(self, prefix):
+        """Stop profiling and write prefix.prof (cProfile stats) and prefix.trace.json.
+
+        The trace opens in chrome://tracing or Perfetto: stages on the main
+        thread's track, spans on the track of the thread that ran them.
+        """
+        if self.profiler is not None:
+            self.profiler.disable()
+            self.profiler.dump_stats(f"{prefix}.prof")
+            print(f"📊 cProfile stats written to: {prefix}.prof")
+
+        pid = os.getpid()
+        main_thread = threading.main_thread().ident
+        events = [
+            {"name": name, "cat": "stage", "ph": "X", "pid": pid, "tid": main_thread,
+             "ts": round(start * 1e6), "dur": round(seconds * 1e6)}
+            for name, start, seconds in self.stages
+        ]
+        events += [
+            {"name": name, "cat": "span", "ph": "X", "pid": pid, "tid": thread_id,
+             "ts": round(start * 1e6), "dur": round(seconds * 1e6)}
+            for name, start, seconds, thread_id in self.spans
+        ]
+        end = max((event["ts"] + event["dur"] for event in events), default=0)
+        events.append({"name": "counters", "ph": "C", "pid": pid, "tid": main_thread, "ts": end,
+                       "args": self.counters})
+        try:
+            with open(f"{prefix}.trace.json", "w", encoding="utf-8") as f:
+                json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        except Exception as e:
+            print(f"❌ Error writing {prefix}.trace.json: {e}")
+            sys.exit(1)
+        print(f"📊 Chrome trace written to: {prefix}.trace.json")
+
+# Lines that still get through in quiet mode
+QUIET_PASSTHROUGH = ("❌", "⚠️", "ERROR", "WARNING")
+
+class QuietStream:
+    """Text stream that drops progress lines and passes errors and warnings through."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.line = ""
+
+    def write(self, text):
+        self.line += text
+        *lines, self.line = self.line.split("\n")
+        for line in lines:
+            if line.lstrip().startswith(QUIET_PASSTHROUGH):
+                self.stream.write(f"{line}\n")
+        return len(text)
+
+    def flush(self):
+        self.stream.flush()
+
+@contextlib.contextmanager
+def quiet_output(quiet=True):
+    """Silence per-file progress prints inside the block when quiet is set."""
+    if not quiet:
+        yield
+        return
+    with contextlib.redirect_stdout(QuietStream(sys.stdout)):
+        yield
@@ -0,0 +1,171 @@
+#python check_page_weight.py
+#python check_page_weight.py --max-bytes 800000 --max-requests 25
+
+import os
+import re
+import sys
+import argparse
+from urllib.parse import unquote, urlsplit
+
+from build_manifest import BuildManifest
+
+# Default budgets per page, counting the page itself and every local
+# stylesheet, script, icon and image it loads. They assume images are served
+# as the AVIF/WebP variants generate_images.py makes, which needs Pillow;
+# without it the build only warns (see generate_article.py).
+MAX_PAGE_BYTES = 1_000_000
+MAX_PAGE_REQUESTS = 30
+
+# <link> rels that make the browser download the file
+DOWNLOADED_RELS = {"stylesheet", "preload", "modulepreload", "icon", "shortcut", "apple-touch-icon"}
+
+RESOURCE_TAG = re.compile(r"<(/?picture|link|script|img|source)\b([^>]*)>", re.I)
+ATTRIBUTE = re.compile(r'([\w-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\')')
+SRCSET_CANDIDATE = re.compile(r"\s*(\S+)(?:\s+(\d+)w)?\s*(?:,|$)")
+
+def attributes(text):
+    return {m.group(1).lower(): m.group(2) if m.group(2) is not None else m.group(3)
+            for m in ATTRIBUTE.finditer(text)}
+
+def largest_candidate(srcset):
+    """The srcset URL a wide, high-density screen would pick: the widest one."""
+    candidates = [(int(m.group(2) or 0), m.group(1)) for m in SRCSET_CANDIDATE.finditer(srcset) if m.group(1)]
+    return max(candidates)[1] if candidates else None
+
+def page_references(html):
+    """Return the URLs of every file a page makes the browser download, in order, once each.
+
+    Inside a <picture> only one image is fetched; it is counted as the
+    widest candidate of the first <source>, or the <img> without sources.
+    """
+    urls = []
+    picture_source = None
+    in_picture = False
+    for match in RESOURCE_TAG.finditer(html):
+        tag, attrs = match.group(1).lower(), attributes(match.group(2))
+        url = None
+        if tag == "picture":
+            in_picture, picture_source = True, None
+        elif tag == "/picture":
+            in_picture = False
+        elif tag == "source" and in_picture:
+            if picture_source is None and attrs.get("srcset"):
+                picture_source = largest_candidate(attrs["srcset"])
+                url = picture_source
+        elif tag == "img":
+            if not (in_picture and picture_source):
+                url = largest_candidate(attrs["srcset"]) if attrs.get("srcset") else attrs.get("src")
+        elif tag == "script":
+            url = attrs.get("src")
+        elif tag == "link" and DOWNLOADED_RELS & set(attrs.get("rel", "").lower().split()):
+            url = attrs.get("href")
+        if url and url not in urls:
+            urls.append(url)
+    return urls
+
+class ResourceSizes:
+    """Transfer sizes of local files, cached across pages.
+
+    A file with a .br or .gz sibling is counted at the smallest size the
+    host can serve it at.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.sizes = {}
+
+    def resolve(self, url, page_dir):
+        """Return the local path a URL refers to, or None for external URLs."""
+        parts = urlsplit(url)
+        if parts.scheme or parts.netloc or url.startswith("data:"):
+            return None
+        path = unquote(parts.path)
+        if path.startswith("/"):
+            return os.path.normpath(os.path.join(self.root, *path.lstrip("/").split("/")))
+        return os.path.normpath(os.path.join(page_dir, *path.split("/")))
+
+    def size(self, path):
+        """Transfer size of a local file in bytes, or None if it is missing."""
+        if path not in self.sizes:
+            sizes = [os.path.getsize(p) for p in (path, f"{path}.br", f"{path}.gz") if os.path.isfile(p)]
+            if not sizes and not os.path.splitext(path)[1] and os.path.isfile(f"{path}.html"):
+                return self.size(f"{path}.html")  # Extensionless page URL
+            self.sizes[path] = min(sizes) if os.path.isfile(path) else None
+        return self.sizes[path]
+
+def page_weight(page, sizes):
+    """Return (transfer bytes, requests, missing local URLs) for one page."""
+    with open(page, "r", encoding="utf-8", errors="replace") as f:
+        html = f.read()
+    total = sizes.size(page) or 0
+    requests = 1
+    missing = []
+    page_dir = os.path.dirname(page)
+    for url in page_references(html):
+        path = sizes.resolve(url, page_dir)
+        if path is None:
+            continue
+        size = sizes.size(path)
+        if size is None:
+            missing.append(url)
+            continue
+        total += size
+        requests += 1
+    return total, requests, missing
+
+def find_pages(manifest):
+    """Return every HTML page the build generated (article pages and listings), sorted.
+
+    Hand-written pages in the same folders aren't in the build manifest
+    and aren't checked.
+    """
+    pages = (
+        os.path.join(manifest.root, *key.split("/")) for key in manifest.data["outputs"] if key.endswith(".html")
+    )
+    return sorted(page for page in pages if os.path.isfile(page))
+
+def check_page_weights(manifest, max_bytes=MAX_PAGE_BYTES, max_requests=MAX_PAGE_REQUESTS, enforce=True):
+    """Check every generated page against the budgets and report missing references.
+
+    Sizes are resolved once per file across all pages. With enforce, any
+    page over budget fails the build. Returns (pages checked, pages over
+    budget, missing references).
+    """
+    sizes = ResourceSizes(manifest.root or ".")
+    pages = find_pages(manifest)
+    over = []
+    missing = {}
+    heaviest = (0, 0, None)
+    for page in pages:
+        total, requests, page_missing = page_weight(page, sizes)
+        heaviest = max(heaviest, (total, requests, page))
+        if total > max_bytes or requests > max_requests:
+            over.append((page, total, requests))
+        for url in page_missing:
+            missing.setdefault(url, []).append(page)
+
+    for url, referrers in sorted(missing.items()):
+        more = f" and {len(referrers) - 1} more" if len(referrers) > 1 else ""
+        print(f"⚠️ Missing file {url}, referenced by {referrers[0]}{more}")
+    for page, total, requests in over:
+        print(f"{'❌' if enforce else '⚠️'} Over budget: {page}: {total} bytes"
+              f" (budget {max_bytes}), {requests} requests (budget {max_requests})")
+    if heaviest[2]:
+        print(f"📦 Page weight: {len(pages)} pages checked, heaviest {heaviest[2]}"
+              f" at {heaviest[0]} bytes in {heaviest[1]} requests")
+    if over and enforce:
+        print(f"❌ {len(over)} page(s) over the page-weight budget")
+        sys.exit(1)
+    print(f"✅ Page weight: {len(pages) - len(over)}/{len(pages)} pages within budget")
+    return len(pages), len(over), sum(len(referrers) for referrers in missing.values())
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check generated pages against page-weight budgets.")
+    parser.add_argument("articles_dir", nargs="?", default="Articles",
+                        help="folder holding the build manifest (default: Articles)")
+    parser.add_argument("--max-bytes", type=int, default=MAX_PAGE_BYTES,
+                        help=f"transfer bytes allowed per page (default: {MAX_PAGE_BYTES})")
+    parser.add_argument("--max-requests", type=int, default=MAX_PAGE_REQUESTS,
+                        help=f"local requests allowed per page (default: {MAX_PAGE_REQUESTS})")
+    args = parser.parse_args()
+    check_page_weights(BuildManifest(os.path.normpath(args.articles_dir)), args.max_bytes, args.max_requests)
@@ -0,0 +1,98 @@
+import os
+import sys
+import glob
+import gzip
+import concurrent.futures
+
+from build_manifest import hash_file
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; without it only .gz siblings are written
+    brotli = None
+
+# Site-relative glob patterns for the files the host can serve precompressed
+COMPRESSIBLE_OUTPUTS = [
+    "*.html", "*.xml", "*.json",
+    "Articles/Article_HTMLs/*.html",
+    "tags/*.html", "archive/*.html", "blog-data/*.json",
+    "Styles/*.css", "Styles/Bundles/*.css",
+    "JS/*.js",
+    "Assets/**/*.css", "Assets/**/*.js",
+]
+# Below this size the compressed sibling saves less than the response overhead
+MIN_COMPRESS_BYTES = 256
+
+def find_compressible_outputs(root):
+    """Return every existing file matched by COMPRESSIBLE_OUTPUTS, sorted."""
+    paths = set()
+    for pattern in COMPRESSIBLE_OUTPUTS:
+        paths.update(glob.glob(os.path.join(root or ".", *pattern.split("/")), recursive=True))
+    return sorted(path for path in paths if os.path.isfile(path))
+
+def write_sibling(path, data):
+    """Write a compressed sibling through a temp file so readers never see half of it."""
+    with open(f"{path}.tmp", "wb") as f:
+        f.write(data)
+    os.replace(f"{path}.tmp", path)
+
+def compress_file(path):
+    """Write path.gz, and path.br when brotli is installed. Returns (path, original, gzip, brotli sizes)."""
+    with open(path, "rb") as f:
+        data = f.read()
+    gzipped = gzip.compress(data, compresslevel=9, mtime=0)
+    write_sibling(f"{path}.gz", gzipped)
+    brotli_size = None
+    if brotli is not None:
+        compressed = brotli.compress(data, quality=11)
+        write_sibling(f"{path}.br", compressed)
+        brotli_size = len(compressed)
+    return path, len(data), len(gzipped), brotli_size
+
+def compress_outputs(paths, manifest, force=False, jobs=1):
+    """Precompress files whose content changed since they were last compressed.
+
+    The content hash each sibling was made from is kept in the build
+    manifest, so unchanged files (and ones whose siblings are still in
+    place) are skipped. Compression runs across jobs processes.
+    """
+    if brotli is None:
+        print("⚠️ brotli not installed, writing .gz siblings only")
+    cache = manifest.data.setdefault("compressed", {})
+    extensions = (".gz", ".br") if brotli is not None else (".gz",)
+
+    pending = []
+    hashes = {}
+    for path in paths:
+        if os.path.getsize(path) < MIN_COMPRESS_BYTES:
+            continue
+        key = manifest.key(path)
+        hashes[key] = hash_file(path)
+        siblings_exist = all(os.path.exists(f"{path}{ext}") for ext in extensions)
+        if force or cache.get(key) != hashes[key] or not siblings_exist:
+            pending.append(path)
+
+    try:
+        if jobs > 1 and len(pending) > 1:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=min(jobs, len(pending))) as executor:
+                results = list(executor.map(compress_file, pending, chunksize=max(1, len(pending) // (jobs * 4))))
+        else:
+            results = list(map(compress_file, pending))
+    except Exception as e:
+        print(f"❌ Error compressing outputs: {e}")
+        sys.exit(1)
+
+    original = compressed_gz = compressed_br = 0
+    for path, size, gz_size, br_size in results:
+        cache[manifest.key(path)] = hashes[manifest.key(path)]
+        original += size
+        compressed_gz += gz_size
+        compressed_br += br_size or 0
+
+    summary = f"✅ Compressed {len(results)} file(s), {len(hashes) - len(results)} unchanged"
+    if results:
+        summary += f": {original} → {compressed_gz} bytes gzip"
+        if brotli is not None:
+            summary += f", {compressed_br} bytes brotli"
+    print(summary)
+    return [path for path, *_ in results]
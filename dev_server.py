@@ -0,0 +1,99 @@
+import os
+import threading
+import functools
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+# Endpoint the injected script listens on for reload events
+LIVE_RELOAD_PATH = "/__livereload"
+LIVE_RELOAD_SCRIPT = (
+    f"<script>new EventSource('{LIVE_RELOAD_PATH}').onmessage = () => location.reload();</script>"
+)
+
+class ReloadNotifier:
+    """Counts rebuilds and wakes every waiting browser connection on each one."""
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.version = 0
+
+    def notify(self):
+        """Tell every connected browser to reload."""
+        with self.condition:
+            self.version += 1
+            self.condition.notify_all()
+
+    def wait(self, version, timeout):
+        """Block until the version moves past version or timeout passes. Returns the current version."""
+        with self.condition:
+            self.condition.wait_for(lambda: self.version != version, timeout)
+            return self.version
+
+class DevRequestHandler(SimpleHTTPRequestHandler):
+    """Serves the site like the live host does, plus live reload.
+
+    Extensionless URLs such as /blog resolve to blog.html, and every HTML
+    page gets a script that reloads it when the notifier fires.
+    """
+
+    def __init__(self, *args, notifier, **kwargs):
+        self.notifier = notifier
+        super().__init__(*args, **kwargs)
+
+    def log_message(self, format, *args):
+        # Rebuild output is what matters in the terminal, not every request
+        pass
+
+    def do_GET(self):
+        if self.path == LIVE_RELOAD_PATH:
+            self.stream_reloads()
+            return
+        path = self.translate_path(self.path)
+        if not os.path.exists(path) and os.path.exists(f"{path}.html"):
+            path = f"{path}.html"
+        elif os.path.isdir(path) and os.path.exists(os.path.join(path, "index.html")):
+            path = os.path.join(path, "index.html")
+        if path.endswith(".html") and os.path.isfile(path):
+            self.send_html(path)
+            return
+        super().do_GET()
+
+    def send_html(self, path):
+        """Send an HTML page with the live reload script injected."""
+        with open(path, "rb") as f:
+            html = f.read()
+        script = LIVE_RELOAD_SCRIPT.encode("utf-8")
+        head, body_end, tail = html.rpartition(b"</body>")
+        html = head + script + body_end + tail if body_end else html + script
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(html)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(html)
+
+    def stream_reloads(self):
+        """Hold a server-sent events connection open and send a message per rebuild."""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        version = self.notifier.version
+        try:
+            while True:
+                current = self.notifier.wait(version, timeout=15)
+                # A comment line on timeout keeps idle connections from being dropped
+                self.wfile.write(b"data: reload\n\n" if current != version else b": ping\n\n")
+                self.wfile.flush()
+                version = current
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+def start_dev_server(root, port=8000):
+    """Serve root on localhost:port from a background thread. Returns (server, notifier)."""
+    notifier = ReloadNotifier()
+    handler = functools.partial(DevRequestHandler, directory=root or ".", notifier=notifier)
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"🌐 Serving {root or '.'} at http://localhost:{port}/blog")
+    return server, notifier
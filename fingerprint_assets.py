@@ -0,0 +1,228 @@
+import os
+import re
+import sys
+import json
+import shutil
+import posixpath
+from urllib.parse import unquote
+
+from build_manifest import hash_bytes, hash_file, write_if_changed
+
+# Fingerprinted copies live here under their source path, e.g.
+# Styles/Header.css -> Assets/Styles/Header.<hash>.css
+ASSETS_DIR = "Assets"
+ASSET_MANIFEST_NAME = "asset_manifest.json"
+FINGERPRINT_LENGTH = 10
+
+# Folders whose files are fingerprinted, and whether to walk their subfolders.
+# Styles/Bundles is left out: bundles are already named by their content hash.
+ASSET_FOLDERS = [
+    ("Images", False),
+    ("Images/Responsive", False),  # Variants of the site pages' images
+    ("Articles/Article_Images", True),
+    ("JS", False),
+    ("Styles", False),
+    ("Fonts", False),
+]
+ASSET_EXTENSIONS = {
+    ".css", ".js", ".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp", ".avif", ".ico",
+    ".woff", ".woff2",
+}
+
+ASSET_ATTR = re.compile(r'\b(src|href|srcset)="([^"{}]*)"')
+CSS_URL = re.compile(r'url\(\s*([\'"]?)([^\'")]+)\1\s*\)')
+# Strips the fingerprint from an earlier build's URL: Assets/x/Name.<hash>.ext -> x/Name.ext
+FINGERPRINTED_NAME = re.compile(rf'^{ASSETS_DIR}/(.+)\.[0-9a-f]{{{FINGERPRINT_LENGTH}}}(\.[^./]+)$')
+
+def fingerprinted_path(source_path, content_hash):
+    """Return where the fingerprinted copy of a site-relative asset goes."""
+    stem, ext = posixpath.splitext(source_path)
+    return f"{ASSETS_DIR}/{stem}.{content_hash[:FINGERPRINT_LENGTH]}{ext}"
+
+def find_asset_sources(root):
+    """Return the site-relative path of every asset that gets fingerprinted."""
+    sources = [
+        name for name in os.listdir(root or ".")
+        if os.path.isfile(os.path.join(root, name)) and os.path.splitext(name)[1].lower() in ASSET_EXTENSIONS
+    ]
+    for folder, recursive in ASSET_FOLDERS:
+        base = os.path.join(root, *folder.split("/"))
+        if not os.path.isdir(base):
+            continue
+        for dirpath, dirs, files in os.walk(base):
+            if not recursive:
+                dirs.clear()
+            rel_dir = os.path.relpath(dirpath, root or ".").replace(os.sep, "/")
+            sources += [
+                f"{rel_dir}/{name}" for name in files
+                if os.path.splitext(name)[1].lower() in ASSET_EXTENSIONS
+            ]
+    return sorted(sources)
+
+def asset_source(reference, base_dir):
+    """Resolve an href/src/url() to a site-relative source path, or None if it isn't local.
+
+    Relative references resolve against base_dir like a browser would, and
+    URLs of earlier fingerprinted copies map back to their source.
+    """
+    if not reference or reference.startswith(("#", "data:", "mailto:", "tel:", "javascript:", "//")) \
+            or re.match(r'^[a-zA-Z][\w+.-]*:', reference):
+        return None
+    path = unquote(reference.split("#", 1)[0].split("?", 1)[0])
+    if not path:
+        return None
+    path = posixpath.normpath(path.lstrip("/") if path.startswith("/") else posixpath.join(base_dir, path))
+    # The server clamps ../ at the site root, so the resolver does too
+    while path.startswith("../"):
+        path = path[3:]
+    match = FINGERPRINTED_NAME.match(path)
+    return match.group(1) + match.group(2) if match else path
+
+def rewrite_asset_references(html, page_dir, assets):
+    """Point src/href/srcset attributes at fingerprinted assets.
+
+    page_dir is the page's folder relative to the site root. Running this
+    over already rewritten markup only changes references whose asset did.
+    """
+    def rewrite_url(url):
+        source = asset_source(url, page_dir)
+        if source not in assets:
+            return url
+        suffix = url[len(url.split("#", 1)[0].split("?", 1)[0]):]
+        return f"/{assets[source]}{suffix}"
+
+    def rewrite(match):
+        attr, value = match.groups()
+        if attr == "srcset":
+            candidates = []
+            for candidate in value.split(","):
+                url, _, descriptor = candidate.strip().partition(" ")
+                candidates.append(f"{rewrite_url(url)} {descriptor}".strip())
+            value = ", ".join(candidates)
+        else:
+            value = rewrite_url(value)
+        return f'{attr}="{value}"'
+
+    return ASSET_ATTR.sub(rewrite, html)
+
+def referenced_assets(html, page_dir, assets):
+    """Return the source path of every asset in assets that the markup's src/href/srcset refer to."""
+    sources = set()
+    for attr, value in ASSET_ATTR.findall(html):
+        urls = [candidate.strip().partition(" ")[0] for candidate in value.split(",")] if attr == "srcset" else [value]
+        sources.update(source for source in (asset_source(url, page_dir) for url in urls) if source in assets)
+    return sources
+
+def rewrite_css_urls(css, css_dir, assets):
+    """Point url() references in a stylesheet at fingerprinted assets."""
+    def rewrite(match):
+        quote, url = match.groups()
+        source = asset_source(url.strip(), css_dir)
+        if source not in assets:
+            return match.group(0)
+        return f"url({quote}/{assets[source]}{quote})"
+
+    return CSS_URL.sub(rewrite, css)
+
+class AssetManifest:
+    """Maps source assets to their fingerprinted copies, stored in Assets/asset_manifest.json.
+
+    Each entry records the source's size and mtime next to its hash, so
+    unchanged files aren't re-read on every build.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.path = os.path.join(root, ASSETS_DIR, ASSET_MANIFEST_NAME)
+        self.entries = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self.entries = json.load(f)
+            except Exception as e:
+                print(f"⚠️ Warning: Could not read {self.path}: {e}. Re-fingerprinting every asset.")
+
+    def file(self, rel_path):
+        """Return the filesystem path of a site-relative path."""
+        return os.path.join(self.root, *rel_path.split("/"))
+
+    def remove(self, rel_path):
+        """Delete an outdated fingerprinted copy along with its compressed siblings."""
+        for path in (self.file(rel_path), f"{self.file(rel_path)}.gz", f"{self.file(rel_path)}.br"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def source_hash(self, source_path, stat):
+        """Return a source's content hash, reusing the recorded one if size and mtime match."""
+        entry = self.entries.get(source_path)
+        if entry and entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+            return entry["hash"]
+        return hash_file(self.file(source_path))
+
+    def fingerprint(self, source_path, assets):
+        """Copy one asset to its fingerprinted name if needed. Returns True if copied.
+
+        Stylesheets have their url() references rewritten first, so a
+        stylesheet's fingerprint changes whenever an image it uses does.
+        """
+        source_file = self.file(source_path)
+        stat = os.stat(source_file)
+        content = None
+        if source_path.endswith(".css"):
+            with open(source_file, "r", encoding="utf-8", newline="") as f:
+                content = rewrite_css_urls(f.read(), posixpath.dirname(source_path), assets)
+            content_hash = hash_bytes(content)
+        else:
+            content_hash = self.source_hash(source_path, stat)
+
+        target = fingerprinted_path(source_path, content_hash)
+        previous = self.entries.get(source_path, {}).get("path")
+        self.entries[source_path] = {
+            "path": target, "hash": content_hash, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns,
+        }
+        assets[source_path] = target
+        if previous and previous != target:
+            self.remove(previous)
+        if os.path.exists(self.file(target)):
+            return False
+
+        os.makedirs(os.path.dirname(self.file(target)), exist_ok=True)
+        if content is None:
+            shutil.copyfile(source_file, self.file(target))
+        else:
+            write_if_changed(self.file(target), content)
+        return True
+
+    def fingerprint_all(self):
+        """Fingerprint every asset under the site root. Returns {source_path: fingerprinted_path}."""
+        sources = find_asset_sources(self.root)
+        assets = {}
+        copied = 0
+        try:
+            # Stylesheets last, so their url()s see every other asset's fingerprint
+            for source_path in sorted(sources, key=lambda p: (p.endswith(".css"), p)):
+                copied += self.fingerprint(source_path, assets)
+        except Exception as e:
+            print(f"❌ Error fingerprinting assets: {e}")
+            sys.exit(1)
+
+        for source_path in set(self.entries) - set(assets):
+            self.remove(self.entries.pop(source_path)["path"])
+        print(f"✅ Assets: {copied} copied, {len(assets) - copied} unchanged")
+        return assets
+
+    def save(self):
+        """Write the asset manifest back to disk if it changed."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        try:
+            write_if_changed(self.path, json.dumps(self.entries, indent=2, sort_keys=True) + "\n")
+        except Exception as e:
+            print(f"❌ Error writing {self.path}: {e}")
+            sys.exit(1)
+
+def fingerprint_site_assets(root):
+    """Fingerprint every asset and save the asset manifest. Returns {source_path: fingerprinted_path}."""
+    manifest = AssetManifest(root)
+    assets = manifest.fingerprint_all()
+    manifest.save()
+    return assets
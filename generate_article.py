@@ -1,356 +1,457 @@
 #python generate_article.py "Articles/new_article.txt"
+#python generate_article.py --all Articles
 
 import os
 import sys
+import re
 import json
+import io
+import glob
 import uuid
+import time
+import argparse
+import functools
+import concurrent.futures
+from dataclasses import dataclass, field
 from datetime import datetime
 import math
 
-def parse_article_metadata(txt_file):
-    """Parse metadata from a single article text file."""
-    if not os.path.exists(txt_file):
-        print(f"❌ Error: Input file {txt_file} not found")
-        sys.exit(1)
+import page_templates
+import generate_images
+import generate_css_bundles
+import fingerprint_assets
+import minify_html
+import third_party
+from articles_metadata import MetadataStore, title_key
+from build_manifest import BuildManifest, hash_bytes, hash_file, render_if_changed
+from page_templates import load_template, read_template_source, template_includes, templates_version
+from generate_images import (
+    ARTICLE_IMAGE_SIZES, BLOG_CARD_IMAGE_SIZES, SITE_PAGE_IMAGE_SIZES, generate_image_variants, image_info_key,
+    render_picture, supported_formats, wrap_picture,
+)
+from generate_css_bundles import PAGE_TEMPLATES, build_css_bundles, render_stylesheets
+from generate_search_index import generate_search_index
+from generate_feeds import generate_feeds
+from generate_sitemap import generate_sitemap, notify_changed, queue_notifications
+from dev_server import start_dev_server
+from compress_outputs import compress_outputs, find_compressible_outputs
+from fingerprint_assets import asset_source, fingerprint_site_assets, referenced_assets, rewrite_asset_references
+from minify_html import format_savings, minifying
+from build_metrics import BuildMetrics, quiet_output
+from third_party import DEFAULT_STRATEGY, LOADING_STRATEGIES, resolve_strategy, third_party_html
+from check_page_weight import MAX_PAGE_BYTES, MAX_PAGE_REQUESTS, check_page_weights
+from site_config import SITE_PAGES
 
-    print(f"📄 Parsing metadata from: {txt_file}")
-    title = ""
-    summary = ""
-    author = ""
-    date = ""
-    mins = ""
-    image = ""
-    in_summary = False
+# Where article pages live, relative to the site root
+ARTICLE_PAGES_DIR = "Articles/Article_HTMLs"
 
-    try:
-        with open(txt_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-    except Exception as e:
-        print(f"❌ Error reading {txt_file}: {e}")
-        sys.exit(1)
+# Articles listed on blog.html and on each archive page
+ARTICLES_PER_PAGE = 6
+# Folders, relative to the site root, of the per-tag and per-month listings
+TAGS_DIR = "tags"
+ARCHIVE_DIR = "archive"
+# Cards in the first row of a blog page are above the fold and load eagerly
+EAGER_BLOG_CARDS = 2
+# Folder, relative to the site root, of the blog's card shards: one JSON file
+# per archive page, which JS/Load_More.js appends to blog.html in place
+BLOG_SHARDS_DIR = "blog-data"
+BLOG_SHARD_TEMPLATES = ["blog_card.html", "partials/tag_link.html"]
 
-    for line in lines:
-        line = line.strip()
-        if line.startswith("Title:"):
-            title = line.replace("Title:", "").strip()
-        elif line.startswith("Summary:"):
-            in_summary = True
-            summary = line.replace("Summary:", "").strip()
-        elif line.startswith("Author:"):
-            in_summary = False
-            author = line.replace("Author:", "").strip()
-        elif line.startswith("Date:"):
-            in_summary = False
-            date = line.replace("Date:", "").strip()
-        elif line.startswith("ReadTime:"):
-            in_summary = False
-            mins = line.replace("ReadTime:", "").strip()
-        elif line.startswith("Image:"):
-            in_summary = False
-            image = line.replace("Image:", "").strip()
-        elif in_summary and line:
-            summary += " " + line
+# Hand-maintained pages are rendered from Templates/pages/ (see site_config.SITE_PAGES)
+SITE_PAGES_TEMPLATES_DIR = "pages"
+# <img> tags on those pages get responsive variants when their src is one of
+# these and their class has a sizes hint in SITE_PAGE_IMAGE_SIZES
+IMG_TAG = re.compile(r'<img\b[^>]*?\bsrc="([^"{}]+)"[^>]*>')
+IMG_CLASS = re.compile(r'\bclass="([^"]*)"')
+RESPONSIVE_EXTENSIONS = (".png", ".jpg", ".jpeg")
 
-    # Truncate summary to 1-2 sentences for blog.html
-    summary_sentences = summary.split(". ")
-    short_summary = ". ".join(summary_sentences[:2]).strip()
-    if short_summary and not short_summary.endswith("."):
-        short_summary += "."
+# Every page depends on the code that fills templates in, so editing it
+# invalidates them all. Templates, assets and stylesheet bundles are tracked
+# per page (see BuildContext.page_dependencies), so editing one of those only
+# rebuilds the pages that use it.
+RENDER_MODULES = [__file__, page_templates.__file__, generate_images.__file__, generate_css_bundles.__file__,
+                  fingerprint_assets.__file__, minify_html.__file__, third_party.__file__]
+TEMPLATE_VERSION = hash_bytes("".join(hash_file(os.path.abspath(m)) for m in RENDER_MODULES))
 
-    try:
-        # Parse date for sorting (format: Month DD, YYYY)
-        parsed_date = datetime.strptime(date, "%B %d, %Y")
-    except ValueError:
-        print(f"⚠️ Warning: Invalid date format in {txt_file}: {date}. Using fallback date.")
-        parsed_date = datetime.min
-
-    metadata = {
-        "title": title,
-        "summary": short_summary,
-        "author": author,
-        "date": date,
-        "parsed_date": parsed_date,
-        "mins": mins,
-        "image": f"Articles/Article_Images/{image}",
-        "safe_title": title.replace(" ", "_").replace(":", "").replace("/", "_")  # Removed .html
+@dataclass
+class BuildContext:
+    """Site-wide build outputs that every rendered page refers to.
+
+    Built once in the parent process and handed to render workers; watch
+    mode keeps it between rebuilds until a template or asset changes.
+    With minify set, every page is minified on the way to disk.
+    third_party maps each page type to the <head> tags that load its fonts,
+    analytics and Calendly, rendered once for the chosen loading strategy.
+    """
+    css_bundles: dict = field(default_factory=dict)
+    assets: dict = field(default_factory=dict)
+    minify: bool = False
+    third_party: dict = field(default_factory=dict)
+    templates: dict = field(default_factory=dict, repr=False)
+    dependencies: dict = field(default_factory=dict, repr=False)
+
+    def version(self):
+        """Hash of what every rendered page depends on, whatever its templates."""
+        return hash_bytes("minify" if self.minify else "")
+
+    def page_dependencies(self, templates, page_dir="", page_type=None):
+        """Return the templates, assets and stylesheet bundle a page is rendered from.
+
+        templates are the page's root templates; every template they include
+        is listed too. assets maps each asset the templates refer to onto its
+        fingerprinted copy, bundle identifies page_type's stylesheets and
+        third_party its <head> tags for fonts, analytics and Calendly.
+        """
+        key = (tuple(templates), page_dir, page_type)
+        if key not in self.dependencies:
+            names = list(dict.fromkeys(name for template in templates for name in template_includes(template)))
+            source = "".join(read_template_source(template) for template in templates)
+            bundle = self.css_bundles.get(page_type)
+            self.dependencies[key] = {
+                "templates": names,
+                "templates_hash": templates_version(names),
+                "assets": {src: self.assets[src] for src in sorted(referenced_assets(source, page_dir, self.assets))},
+                "bundle": bundle.content_hash + hash_bytes(bundle.critical_css) if bundle else "",
+                "third_party": hash_bytes(self.third_party.get(page_type, "")),
+            }
+        return self.dependencies[key]
+
+    def page_inputs(self, templates, page_dir="", page_type=None):
+        """Hash of page_dependencies, for a page's manifest inputs."""
+        return hash_bytes(json.dumps(self.page_dependencies(templates, page_dir, page_type), sort_keys=True))
+
+    def asset_url(self, path):
+        """Return the URL of a site-relative asset, fingerprinted if it has a copy."""
+        return f"/{self.assets.get(path, path)}"
+
+    def template(self, name, page_dir="", images=None):
+        """Load a template with its asset references pointed at fingerprinted copies.
+
+        page_dir is the folder the rendered page lives in, relative to the site
+        root. With images (see generate_images), hand-written content images
+        (see site_image_sizes) with responsive variants are wrapped in a <picture>.
+        """
+        key = (name, page_dir, images is not None)
+        if key not in self.templates:
+            def wrap(match):
+                sizes = site_image_sizes(match.group(0))
+                if sizes is None:
+                    return match.group(0)
+                return wrap_picture(match.group(0), images.get(asset_source(match.group(1), page_dir)), sizes)
+
+            def rewrite(literal):
+                if images is not None:
+                    literal = IMG_TAG.sub(wrap, literal)
+                return rewrite_asset_references(literal, page_dir, self.assets)
+            self.templates[key] = load_template(name).map_literals(rewrite)
+        return self.templates[key]
+
+    def page_renderer(self, render, sizes):
+        """Return render, minifying its output when the build minifies; sizes collects (before, after) bytes."""
+        return minifying(render, sizes) if self.minify else render
+
+def build_context(output_dir, minify=False, third_party=DEFAULT_STRATEGY):
+    """Fingerprint the site's assets, build the stylesheet bundles and return a BuildContext.
+
+    third_party names one of third_party.LOADING_STRATEGIES.
+    """
+    assets = fingerprint_site_assets(output_dir)
+    context = BuildContext(
+        css_bundles=build_css_bundles(output_dir, assets), assets=assets, minify=minify,
+    )
+    choices = resolve_strategy(third_party, assets)
+    context.third_party = {
+        page_type: third_party_html(choices, context.asset_url, bundle.font_families)
+        for page_type, bundle in context.css_bundles.items()
     }
-    print(f"✅ Parsed metadata: {metadata}")
-    return metadata
+    return context
 
-def generate_article_html(txt_file):
-    """Generate HTML for a single article."""
-    if not os.path.exists(txt_file):
-        print(f"❌ Error: Input file {txt_file} not found")
-        sys.exit(1)
+def print_minify_savings(output_file, sizes):
+    """Print the bytes minification saved on one page."""
+    for before, after in sizes:
+        print(f"🗜️ Minified {output_file}: {format_savings(before, after)}")
 
-    print(f"📝 Generating article HTML for: {txt_file}")
-    try:
-        with open(txt_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-    except Exception as e:
-        print(f"❌ Error reading {txt_file}: {e}")
-        sys.exit(1)
+@dataclass
+class ArticleSection:
+    """One "Section:" block of an article: its heading and paragraph lines."""
+    title: str
+    paragraphs: list = field(default_factory=list)
+
+@dataclass
+class Article:
+    """An article parsed from its .txt source."""
+    title: str = ""
+    summary: str = ""
+    author: str = ""
+    date: str = ""
+    mins: str = ""
+    image: str = ""
+    tags: list = field(default_factory=list)
+    sections: list = field(default_factory=list)
+    final: list = field(default_factory=list)
+    source: str = ""
+
+    @property
+    def safe_title(self):
+        """File name for the article page, without .html."""
+        return self.title.replace(" ", "_").replace(":", "").replace("/", "_")
+
+    @property
+    def image_path(self):
+        """Site-relative path of the article's hero image."""
+        return f"Articles/Article_Images/{self.image}"
+
+    @property
+    def short_summary(self):
+        """The summary truncated to 1-2 sentences for blog.html."""
+        summary_sentences = self.summary.split(". ")
+        short_summary = ". ".join(summary_sentences[:2]).strip()
+        if short_summary and not short_summary.endswith("."):
+            short_summary += "."
+        return short_summary
+
+    def to_metadata(self):
+        """Return the articles_metadata.json record for this article.
+
+        parsed_date is kept as an ISO string, which sorts like the date itself.
+        """
+        try:
+            # Parse date for sorting (format: Month DD, YYYY)
+            parsed_date = datetime.strptime(self.date, "%B %d, %Y")
+        except ValueError:
+            print(f"⚠️ Warning: Invalid date format in {self.source}: {self.date}. Using fallback date.")
+            parsed_date = datetime.min
+
+        return {
+            "title": self.title,
+            "summary": self.short_summary,
+            "author": self.author,
+            "date": self.date,
+            "parsed_date": parsed_date.isoformat(),
+            "mins": self.mins,
+            "image": self.image_path,
+            "tags": self.tags,
+            "safe_title": self.safe_title  # Removed .html
+        }
+
+# "Key:" prefixes that set a single header field of an article
+HEADER_FIELDS = {
+    "Title": "title",
+    "Author": "author",
+    "Date": "date",
+    "ReadTime": "mins",
+    "Image": "image",
+}
 
-    # Extract metadata
-    title = ""
-    summary = ""
-    author = ""
-    date = ""
-    mins = ""
-    image = ""
-    sections = []
-    final = []
+def parse_article_lines(lines, source=""):
+    """Parse an article from any iterable of lines in a single pass.
+
+    Summary, section and final text are collected as lists of lines and
+    joined once at the end, so parsing is linear in the article's length.
+    """
+    article = Article(source=source)
+    summary = []
     current_section = None
     in_summary = False
     in_final = False
 
     for line in lines:
         line = line.strip()
-        if line.startswith("Title:"):
-            in_summary = False
-            in_final = False
-            title = line.replace("Title:", "").strip()
-        elif line.startswith("Summary:"):
-            in_summary = True
-            in_final = False
-            summary = line.replace("Summary:", "").strip()
-        elif line.startswith("Author:"):
-            in_summary = False
-            in_final = False
-            author = line.replace("Author:", "").strip()
-        elif line.startswith("Date:"):
+        key, colon, value = line.partition(":")
+        if colon and key in HEADER_FIELDS:
             in_summary = False
             in_final = False
-            date = line.replace("Date:", "").strip()
-        elif line.startswith("ReadTime:"):
+            setattr(article, HEADER_FIELDS[key], value.strip())
+        elif colon and key == "Tags":
+            # Tags: QuickBooks, Tax Strategy
             in_summary = False
             in_final = False
-            mins = line.replace("ReadTime:", "").strip()
-        elif line.startswith("Image:"):
-            in_summary = False
+            article.tags = [tag.strip() for tag in value.split(",") if tag.strip()]
+        elif colon and key == "Summary":
+            in_summary = True
             in_final = False
-            image = line.replace("Image:", "").strip()
-        elif line.startswith("Section:"):
+            summary = [value.strip()]
+        elif colon and key == "Section":
             in_summary = False
             in_final = False
-            if current_section:
-                sections.append(current_section)
-            current_section = {"title": line.replace("Section:", "").strip(), "content": ""}
-        elif line.startswith("Final:"):
+            current_section = ArticleSection(value.strip())
+            article.sections.append(current_section)
+        elif colon and key == "Final":
             in_summary = False
             in_final = True
-            if current_section:
-                sections.append(current_section)
-                current_section = None
-        elif in_summary and line:
-            summary += " " + line
-        elif in_final and line:
+            current_section = None
+        elif not line:
+            continue
+        elif in_summary:
+            summary.append(line)
+        elif in_final:
             if line != "Final Thoughts":
-                final.append(line)
-        elif current_section and line:
-            current_section["content"] += line + "\n"
+                article.final.append(line)
+        elif current_section is not None:
+            current_section.paragraphs.append(line)
 
-    if current_section:
-        sections.append(current_section)
+    article.summary = " ".join(summary)
+    return article
 
-    # Join final content with newlines for rendering
-    final_content = "\n".join(final).strip()
+def parse_article(txt_file):
+    """Parse an article .txt file, streaming it line by line."""
+    if not os.path.exists(txt_file):
+        print(f"❌ Error: Input file {txt_file} not found")
+        sys.exit(1)
 
-    # Make sure HTML folder exists
-    output_folder = os.path.join(os.path.dirname(txt_file), "Article_HTMLs")
+    print(f"📄 Parsing article: {txt_file}")
+    try:
+        with open(txt_file, 'r', encoding='utf-8') as f:
+            return parse_article_lines(f, txt_file)
+    except Exception as e:
+        print(f"❌ Error reading {txt_file}: {e}")
+        sys.exit(1)
+
+def parse_article_metadata(txt_file):
+    """Parse metadata from a single article text file."""
+    metadata = parse_article(txt_file).to_metadata()
+    print(f"✅ Parsed metadata: {metadata}")
+    return metadata
+
+def article_output_path(txt_file, safe_title):
+    """Return the HTML path an article .txt file renders to."""
+    return os.path.join(os.path.dirname(txt_file), "Article_HTMLs", f"{safe_title}.html")
+
+def render_article_html(article, out, context, image_info=None):
+    """Stream a parsed article's HTML page to a file handle.
+
+    image_info describes the hero image's responsive variants, if any.
+    """
+    section_template = context.template("article_section.html", ARTICLE_PAGES_DIR)
+
+    def render_sections(out):
+        for section in article.sections:
+            section_template.render(
+                out,
+                title=section.title,
+                content="</p>\n<p>".join(section.paragraphs),
+            )
+
+    context.template("article.html", ARTICLE_PAGES_DIR).render(
+        out,
+        title=article.title,
+        summary=article.summary,
+        author=article.author,
+        date=article.date,
+        mins=article.mins,
+        image=article.image,
+        safe_title=article.safe_title,
+        stylesheets=lambda out: render_stylesheets(out, context.css_bundles["article"]),
+        third_party=context.third_party["article"],
+        hero_image=lambda out: render_picture(
+            out,
+            context.asset_url(article.image_path),
+            article.title,
+            image_info,
+            sizes=ARTICLE_IMAGE_SIZES,
+            css_class="article-image",
+            url=context.asset_url,
+        ),
+        sections=render_sections,
+        final_html="</p>\n<p>".join(article.final),
+    )
+
+def image_urls(path, info, context):
+    """Return the URLs of an image and its variants; fingerprinted URLs change with the files."""
+    variants = info["variants"] if info else {}
+    return [context.asset_url(p) for p in [path] + [v for sizes in variants.values() for _, v in sizes]]
+
+def article_page_inputs(manifest, txt_file, article, image_info, context):
+    """Return the manifest inputs hash of an article page."""
+    return manifest.inputs_hash(
+        manifest.hash_source(txt_file), image_info_key(image_info),
+        context.page_inputs(PAGE_TEMPLATES["article"], ARTICLE_PAGES_DIR, "article"),
+        image_urls(article.image_path, image_info, context),
+    )
+
+def generate_article_html(txt_file, manifest=None, image_info=None, context=None):
+    """Generate HTML for a single article and return the parsed Article.
+
+    With a build manifest the page is only rewritten if its content changed.
+    """
+    if context is None:
+        context = build_context(os.path.dirname(os.path.dirname(txt_file)))
+    article = parse_article(txt_file)
+    output_file = article_output_path(txt_file, article.safe_title)
+    make_output_folder(output_file)
+    print(f"📝 Generating article HTML for: {txt_file}")
+    sizes = []
+    render = context.page_renderer(
+        functools.partial(render_article_html, article, context=context, image_info=image_info), sizes
+    )
+
+    try:
+        if manifest is None:
+            with open(output_file, "w", encoding="utf-8") as f:
+                render(f)
+            print(f"✅ Article HTML written to: {output_file}")
+        elif manifest.write_output(
+            output_file, render, article_page_inputs(manifest, txt_file, article, image_info, context)
+        ):
+            print(f"✅ Article HTML written to: {output_file}")
+        else:
+            print(f"⏭️ Article HTML unchanged: {output_file}")
+    except Exception as e:
+        print(f"❌ Error writing {output_file}: {e}")
+        sys.exit(1)
+    print_minify_savings(output_file, sizes)
+
+    return article
+
+def make_output_folder(output_file):
+    """Make sure the folder an output file goes in exists."""
+    output_folder = os.path.dirname(output_file)
+    if not output_folder:
+        return
     try:
         os.makedirs(output_folder, exist_ok=True)
     except Exception as e:
         print(f"❌ Error creating directory {output_folder}: {e}")
         sys.exit(1)
 
-    # Generate safe file name (without .html for links, but keep .html for file output)
-    safe_title = title.replace(" ", "_").replace(":", "").replace("/", "_")
-    output_file = os.path.join(output_folder, f"{safe_title}.html")  # File still needs .html
-
-    # HTML template for article
-    html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta name="description" content="{summary}">
-    <meta name="keywords" content="bookkeeping, contractor vs employee, business finance, {author}">
-    <link rel="canonical" href="https://provisionbk.com/Articles/Article_HTMLs/{safe_title}">
-    <title>{title}</title>
-    <link rel="stylesheet" href="../../Styles/Header.css">
-    <link rel="stylesheet" href="../../Styles/Opening Picture.css">
-    <link rel="stylesheet" href="../../Styles/How_We_Differ.css">
-    <link rel="stylesheet" href="../../Styles/Welcome.css">
-    <link rel="stylesheet" href="../../Styles/How_It_Works.css">
-    <link rel="stylesheet" href="../../Styles/contact-us.css">
-    <link rel="stylesheet" href="../../Styles/Footer.css">
-    <link rel="stylesheet" href="../../Styles/About_Us.css">
-    <link rel="stylesheet" href="../../Styles/Blog.css">
-    <link rel="stylesheet" href="../../Styles/Articles.css">
-    <link href="https://fonts.googleapis.com/css2?family=Montserrat:wght@400;800&display=swap" rel="stylesheet">
-    <link href="https://fonts.g
-oogleapis.com/css2?family=Google+Sans+Code:ital,wght@0,300..800;1,300..800&display=swap" rel="stylesheet">
-    <link rel="icon" type="image/x-icon" href="/Images/Provision Bookkeeping Logo.ico">
-    <!-- Google tag (gtag.js) -->
-    <script async src="https://www.googletagmanager.com/gtag/js?id=G-V4S9TY013M"></script>
-    <script>
-      window.dataLayer = window.dataLayer || [];
-      function gtag(){{dataLayer.push(arguments);}}
-      gtag('js', new Date());
-      gtag('config', 'G-V4S9TY013M');
-    </script>
-
-
-<link href="https://assets.calendly.com/assets/external/widget.css" rel="stylesheet">
-<script src="https://assets.calendly.com/assets/external/widget.js" type="text/javascript" async></script>
-<script type="text/javascript">window.download = function() {{ Calendar.initBadgeWidget({{ url: 'https://calendly.com/provisionbk/15min', text: 'Schedule a Call', color: '#fa0062', textColor: '#00446f', branding: false }}); }}</script>
-
-    <!-- JSON-LD Schema -->
-    <script type="application/ld+json">
-    {{
-      "@context": "https://schema.org",
-      "@type": "BlogPosting",
-      "headline": "{title}",
-      "image": "https://provisionbk.com/Articles/Article_Images/{image}",
-      "author": {{
-        "@type": "Person",
-        "name": "{author}"
-      }},
-      "publisher": {{
-        "@type": "Organization",
-        "name": "Provision Bookkeeping LLC",
-        "logo": {{
-          "@type": "ImageObject",
-          "url": "https://provisionbk.com/Images/Provision Bookkeeping Logo.png"
-        }}
-      }},
-      "datePublished": "{date}",
-      "description": "{summary}"
-    }}
-    </script>
-</head>
-<body>
-    <header>
-        <div class="header-container">
-            <a href="/index" class="logo">
-                <img src="/Images/Provision Bookkeeping Logo.png" alt="Provision Bookkeeping LLC Logo">
-                <span>PROVISION BOOKKEEPING</span>
-            </a>
-            <nav class="nav-menu">
-                <a href="/index">Home</a>
-                <a href="/about-us">About</a>
-                <a href="/blog">Blog</a>
-                <a href="/contact-us">Contact</a>
-            </nav>
-            <button class="menu-toggle" aria-label="Toggle navigation">☰</button>
-        </div>
-    </header>
-    <main>
-        <section class="previous_page1">
-            <a href="/blog"><p>Back</p></a>
-        </section>
-        <section class="article-main">
-            <div class="article-title">
-                <h1>{title}</h1>
-            </div>
-        </section>
-        <div class="date-author">
-            <p>{author}</p>
-            <p>{date} - {mins} read</p>
-        </div>
-        <article>
-            <div class="article-image-summary">
-                <img src="../Article_Images/{image}" alt="{title}" class="article-image">
-                <div class="article-summary">{summary}</div>
-            </div>
-"""
-
-    for section in sections:
-        html += f"""
-            <section>
-                <h2>{section['title']}</h2>
-                <p>{section['content'].strip().replace('\n', '</p>\n<p>')}</p>
-            </section>
-"""
-
-    html += f"""
-            <section>
-                <h2>Final Thoughts</h2>
-                <p>{final_content.replace('\n', '</p>\n<p>')}</p>
-            </section>
-        </article>
-        <section class="previous_page2">
-            <a href="/blog"><p>Back</p></a>
-        </section>
-    </main>
-    <footer role="contentinfo">
-        <div class="footer-content">
-            <img src="/Images/Provision Bookkeeping Logo.png" alt="Provision Bookkeeping LLC Gilbert AZ" style="height: 20px;">
-            &copy; 2025 Provision Bookkeeping LLC
-            <a href="https://www.google.com/maps/search/?api=1&query=865+East+Baseline+Rd+%231091,+Gilbert,+AZ+85233" target="_blank" rel="noopener noreferrer">
-                865 East Baseline Rd #1091, Gilbert, AZ 85233
-            </a><br>
-            <a href="tel:+16027673829">602-767-3829</a> | <a href="mailto:contact@provisionbk.com">contact@provisionbk.com</a><br>
-            <div class="footer_icons">
-                <a href="https://g.co/kgs/SA8hz3A" aria-label="Google"><img src="/Images/google_logo.png" alt="Google"></a>
-                <a href="https://www.yelp.com/biz/provision-bookkeeping-mesa?uid=546ch3YcGUOeta71sLnMVg&utm_campaign=www_business_share_popup&utm_medium=copy_link&utm_source=(direct)" aria-label="Yelp"><img src="/Images/yelp_logo.png" alt="Yelp"></a>
-                <a href="https://linkedin.com/company/provisionbookkeeping" aria-label="LinkedIn"><img src="/Images/linkedin_logo.png" alt="LinkedIn"></a>
-                <a href="https://www.facebook.com/profile.php?id=61563494094507" aria-label="Facebook"><img src="/Images/facebook_logo.png" alt="Facebook"></a>
-                <a href="https://www.instagram.com/provision_bookkeeping/?igsh=MXhvcnBrdTI3OGF5cA%3D%3D&utm_source=qr" aria-label="Instagram"><img src="/Images/instagram_logo.png" alt="Instagram"></a>
-            </div>
-            <nav class="footer-nav">
-                <a href="/index" style="flex: 1; margin: 0 10px; padding: 0px 0px;">Home</a>
-                <a href="/about-us" style="flex: 1; margin: 0 10px; padding: 0px 0px;">About Us</a>
-                <a href="/blog" style="flex: 1; margin: 0 10px; padding: 0px 0px;">Blog</a>
-                <a href="/contact-us" style="flex: 1; margin: 0 10px; padding: 0px 0px;">Contact</a>
-                <a href="/sitemap" style="flex: 1; margin: 0 10px; padding: 0px 0px;">Sitemap</a>
-                <a href="/privacy-policy" style="flex: 1; margin: 0 10px; padding: 0px 0px;">Privacy Policy</a>
-                <a href="/terms-of-service" style="flex: 1; margin: 0 10px; padding: 0px 0px;">Terms of Service</a>
-            </nav>
-            <div class="cta">
-                <a href="" onclick="Calendly.initPopupWidget({{url: 'https://calendly.com/provisionbk/30min?hide_event_type_details=1&hide_gdpr_banner=1&text_color=00446f&primary_color=00446f'}});return false;">Schedule a FREE Meeting</a>
-            </div>
-            Expert <strong>bookkeeping services</strong>, <strong>small business bookkeeping</strong>, <strong>payroll processing</strong>, and <strong>QuickBooks services</strong> serving <strong>Phoenix</strong>, <strong>Scottsdale</strong>, <strong>Tempe</strong>, <strong>Gilbert</strong>, <strong>Queen Creek</strong>, <strong>Tucson</strong>, <strong>Mesa</strong>, <strong>Chandler</strong>, <strong>Glendale</strong>, <strong>Peoria</strong>, <strong>Surprise</strong>, and <strong>Yuma</strong>.
-        </div>
-    </footer>
-    <script>
-        const menuToggle = document.querySelector('.menu-toggle');
-        const navMenu = document.querySelector('.nav-menu');
-        menuToggle.addEventListener('click', () => {{
-            navMenu.classList.toggle('active');
-        }});
-        const currentPage = window.location.pathname.split('/').pop() || 'index';
-        const navLinks = document.querySelectorAll('.nav-menu a');
-        navLinks.forEach(link => {{
-            if (link.getAttribute('href') === currentPage) {{
-                link.classList.add('active');
-            }} else {{
-                link.classList.remove('active');
-            }}
-        }});
-    </script>
-</body>
-</html>
-"""
+def write_article_page(article, output_file, context, image_info=None):
+    """Render one article and write it if changed; safe to run in a worker process.
 
+    Returns (output_file, content_hash, written, sizes) for the parent to
+    record in the build manifest; sizes holds (before, after) bytes when
+    the page was minified.
+    """
+    make_output_folder(output_file)
+    print(f"📝 Generating article HTML for: {article.source}")
+    sizes = []
+    render = context.page_renderer(
+        functools.partial(render_article_html, article, context=context, image_info=image_info), sizes
+    )
     try:
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(html)
-        print(f"✅ Article HTML written to: {output_file}")
+        content_hash, written = render_if_changed(output_file, render)
     except Exception as e:
         print(f"❌ Error writing {output_file}: {e}")
         sys.exit(1)
+    print(f"{'✅ Article HTML written to' if written else '⏭️ Article HTML unchanged'}: {output_file}")
+    print_minify_savings(output_file, sizes)
+    return output_file, content_hash, written, sizes
 
-    return {
-        "title": title,
-        "summary": summary,
-        "author": author,
-        "date": date,
-        "mins": mins,
-        "image": image,
-        "safe_title": safe_title  # Without .html
-    }
+def write_article_pages(articles, output_files, image_infos, context, jobs=1):
+    """Render and write several articles, across a process pool when jobs > 1.
+
+    Results come back in input order, so the output is identical for any jobs.
+    """
+    contexts = [context] * len(articles)
+    if jobs <= 1 or len(articles) <= 1:
+        return list(map(write_article_page, articles, output_files, contexts, image_infos))
+
+    workers = min(jobs, len(articles))
+    chunksize = max(1, len(articles) // (workers * 4))
+    print(f"⚙️ Rendering {len(articles)} articles across {workers} processes")
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(
+            write_article_page, articles, output_files, contexts, image_infos, chunksize=chunksize
+        ))
 
 def initialize_articles_metadata(articles_dir):
     """Initialize articles_metadata.json with existing articles if it doesn't exist."""
@@ -414,299 +515,824 @@ def initialize_articles_metadata(articles_dir):
         sys.exit(1)
 
 def load_articles_metadata(articles_dir):
-    """Load articles metadata from JSON file."""
-    metadata_file = os.path.join(articles_dir, "articles_metadata.json")
-    print(f"📂 Attempting to load: {metadata_file}")
-
-    if not os.path.exists(metadata_file):
-        print(f"⚠️ {metadata_file} not found, initializing...")
+    """Load articles metadata into a MetadataStore, initializing the file if needed."""
+    store = MetadataStore(articles_dir)
+    if not os.path.exists(store.path):
+        print(f"⚠️ {store.path} not found, initializing...")
         initialize_articles_metadata(articles_dir)
-    
-    try:
-        with open(metadata_file, "r", encoding="utf-8") as f:
-            articles = json.load(f)
-    except Exception as e:
-        print(f"❌ Error reading {metadata_file}: {e}")
-        sys.exit(1)
-    
-    # Convert parsed_date strings back to datetime objects
-    for article in articles:
-        article["parsed_date"] = datetime.fromisoformat(article["parsed_date"])
-    
-    print(f"✅ Loaded {len(articles)} articles from {metadata_file}")
-    return articles
+    return store.load()
 
-def save_articles_metadata(articles_dir, articles):
-    """Save articles metadata to JSON file."""
-    metadata_file = os.path.join(articles_dir, "articles_metadata.json")
-    print(f"📝 Saving metadata to: {metadata_file}")
+def archive_page_name(base, page):
+    """File name, without .html, of a listing's archive page numbered from its oldest articles."""
+    return f"{base}_archive_{page}"
+
+def blog_pages(articles, base="blog", title=""):
+    """Split a newest-first listing into pages.
+
+    The base page (blog.html for the blog) lists the newest
+    ARTICLES_PER_PAGE articles. Longer listings also put every article on
+    an archive page numbered from the oldest article upward, so it keeps
+    the same page (and URL) for good. Publishing rewrites the base page and
+    the newest archive page, plus the page before it when the new article
+    starts a new archive page and it gains a link.
+
+    Returns (file name without .html, title suffix, articles, [(href, label)]) per page.
+    """
+    if len(articles) <= ARTICLES_PER_PAGE:
+        return [(base, title, articles, [])]
+    archive_count = math.ceil(len(articles) / ARTICLES_PER_PAGE)
+    oldest_first = articles[::-1]
+    # The archive page holding the newest article not on the base page
+    older = (len(articles) - ARTICLES_PER_PAGE - 1) // ARTICLES_PER_PAGE + 1
+    pages = [(base, title, articles[:ARTICLES_PER_PAGE], [(archive_page_name(base, older), "Older")])]
+
+    for page in range(1, archive_count + 1):
+        links = [(archive_page_name(base, page + 1) if page < archive_count else base, "Newer")]
+        if page > 1:
+            links.append((archive_page_name(base, page - 1), "Older"))
+        page_articles = oldest_first[(page - 1) * ARTICLES_PER_PAGE:page * ARTICLES_PER_PAGE][::-1]
+        suffix = f"{title}, Archive {page}" if title else f" - Archive {page}"
+        pages.append((archive_page_name(base, page), suffix, page_articles, links))
+    return pages
+
+def tag_slug(tag):
+    """URL-safe name of a tag, e.g. "Tax Strategy" -> "tax-strategy"."""
+    return re.sub(r"[^a-z0-9]+", "-", tag.lower()).strip("-")
 
-    # Convert datetime objects to ISO format for JSON serialization
-    articles_to_save = []
+def month_key(article):
+    """The YYYY-MM an article was published in, or None for an unparseable date."""
+    month = article["parsed_date"][:7]
+    return None if month.startswith("0001") else month
+
+def group_articles(articles):
+    """Group newest-first articles into tag and month listings in a single pass.
+
+    Returns {base file name: (title, articles newest first)}, e.g.
+    "tags/quickbooks" or "archive/2025-12".
+    """
+    groups = {}
     for article in articles:
-        article_copy = article.copy()
-        article_copy["parsed_date"] = article["parsed_date"].isoformat()
-        articles_to_save.append(article_copy)
-    
+        month = month_key(article)
+        if month:
+            label = datetime.strptime(month, "%Y-%m").strftime("%B %Y")
+            groups.setdefault(f"{ARCHIVE_DIR}/{month}", (label, []))[1].append(article)
+        for tag in article.get("tags", []):
+            groups.setdefault(f"{TAGS_DIR}/{tag_slug(tag)}", (tag, []))[1].append(article)
+    return groups
+
+def card_inputs(page_articles, images, context):
+    """Return what the blog cards of some articles depend on, as JSON-serializable lists."""
+    return [
+        [a["title"], a["summary"], a["date"], a["image"], a["safe_title"], a.get("tags", []),
+         image_info_key(images.get(a["image"])), image_urls(a["image"], images.get(a["image"]), context)]
+        for a in page_articles
+    ]
+
+def blog_page_inputs(page_suffix, page_articles, links, images, context, page_dir="", load_more=None):
+    """Return everything a blog page's HTML depends on, as a stable string."""
+    fields = card_inputs(page_articles, images, context)
+    page = context.page_inputs(PAGE_TEMPLATES["blog"], page_dir, "blog")
+    return json.dumps([page_suffix, links, fields, page, load_more], ensure_ascii=False)
+
+def render_blog_card(out, article, images, context, card_template, tag_template, lazy=True):
+    """Write one article's blog card."""
+    # Convert date to MM/DD/YYYY for display
     try:
-        with open(metadata_file, "w", encoding="utf-8") as f:
-            json.dump(articles_to_save, f, indent=2)
-        print(f"✅ Updated articles_metadata.json with {len(articles)} articles")
-    except Exception as e:
-        print(f"❌ Error writing {metadata_file}: {e}")
-        sys.exit(1)
+        display_date = datetime.strptime(article['date'], "%B %d, %Y").strftime("%m/%d/%Y")
+    except ValueError:
+        display_date = article['date']
+    card_template.render(
+        out,
+        safe_title=article['safe_title'],
+        title=article['title'],
+        display_date=display_date,
+        month_href=f"{ARCHIVE_DIR}/{month_key(article)}" if month_key(article) else "blog",
+        tags=functools.partial(render_tag_links, tags=article.get("tags", []), template=tag_template),
+        card_image=functools.partial(
+            render_picture,
+            src=context.asset_url(article['image']),
+            alt=article['title'],
+            info=images.get(article['image']),
+            sizes=BLOG_CARD_IMAGE_SIZES,
+            loading="lazy" if lazy else None,
+            url=context.asset_url,
+        ),
+        summary=article['summary'],
+    )
+
+def render_blog_page(out, page_suffix, page_articles, links, images, context, page_dir="", load_more=None):
+    """Stream one blog listing page to a file handle.
+
+    Only the first EAGER_BLOG_CARDS card images load eagerly; the rest are
+    below the fold on most screens and load lazily. page_dir is the folder
+    the page lives in, relative to the site root. load_more is the URL of
+    the card shard a "Load more" button fetches first, if the page has one.
+    """
+    card_template = context.template("blog_card.html", page_dir)
+    link_template = context.template("partials/pagination_link.html", page_dir)
+    tag_template = context.template("partials/tag_link.html", page_dir)
+    load_more_template = context.template("partials/load_more.html", page_dir)
+
+    def render_cards(out):
+        for index, article in enumerate(page_articles):
+            render_blog_card(out, article, images, context, card_template, tag_template, index >= EAGER_BLOG_CARDS)
+
+    def render_pagination_links(out):
+        for href, label in links:
+            link_template.render(out, href=href, label=label)
+
+    context.template("blog.html", page_dir).render(
+        out,
+        stylesheets=lambda out: render_stylesheets(out, context.css_bundles["blog"]),
+        third_party=context.third_party["blog"],
+        page_suffix=page_suffix,
+        cards=render_cards,
+        pagination_links=render_pagination_links,
+        load_more=(lambda out: load_more_template.render(out, shard=load_more)) if load_more else "",
+    )
+
+def render_tag_links(out, tags, template):
+    """Write a link to each tag's listing page."""
+    for tag in tags:
+        template.render(out, href=f"{TAGS_DIR}/{tag_slug(tag)}", label=tag)
+
+def remove_listing_page(output_dir, name, manifest=None):
+    """Delete a listing page that is no longer produced, with its compressed siblings."""
+    path = os.path.join(output_dir, *f"{name}.html".split("/"))
+    for stale in (path, f"{path}.gz", f"{path}.br"):
+        if os.path.exists(stale):
+            os.remove(stale)
+    if manifest is not None:
+        manifest.data["outputs"].pop(manifest.key(path), None)
+    print(f"🗑️ Removed stale blog page: {path}")
+
+def remove_stale_blog_pages(output_dir, page_names, manifest=None):
+    """Delete blog listing pages no longer produced: old newest-first blog_page_N
+    pages and archive pages past the last one."""
+    for pattern in ("blog_page_*.html", "blog_archive_*.html"):
+        for name in glob.glob(pattern, root_dir=output_dir or None):
+            if name[:-len(".html")] not in page_names:
+                remove_listing_page(output_dir, name[:-len(".html")], manifest)
+
+def write_listing_pages(pages, output_dir, manifest=None, force=False, images=None, context=None, load_more=None):
+    """Render and write listing pages as returned by blog_pages, skipping unchanged ones.
 
-def generate_blog_html(articles, output_dir):
-    """Generate blog.html and additional pages with up to 6 articles each."""
+    load_more maps page names to the URL of the card shard their "Load more"
+    button fetches first. Returns the (before, after) sizes of the pages
+    that were minified.
+    """
+    load_more = load_more or {}
+    minified = []
+    for name, page_suffix, page_articles, links in pages:
+        output_file = os.path.join(output_dir, *f"{name}.html".split("/"))
+        if manifest is not None:
+            inputs = manifest.inputs_hash(blog_page_inputs(
+                page_suffix, page_articles, links, images, context, os.path.dirname(name), load_more.get(name)
+            ))
+            if not force and manifest.is_current(output_file, inputs):
+                manifest.skip(output_file)
+                print(f"⏭️ Blog page unchanged: {output_file}")
+                continue
+        print(f"📝 Generating blog page: {output_file}")
+        make_output_folder(output_file)
+
+        sizes = []
+        render = context.page_renderer(functools.partial(
+            render_blog_page, page_suffix=page_suffix, page_articles=page_articles, links=links,
+            images=images, context=context, page_dir=os.path.dirname(name), load_more=load_more.get(name),
+        ), sizes)
+
+        try:
+            if manifest is None:
+                with open(output_file, "w", encoding="utf-8") as f:
+                    render(f)
+                print(f"✅ Blog page generated at: {output_file}")
+            elif manifest.write_output(output_file, render, inputs):
+                print(f"✅ Blog page generated at: {output_file}")
+            else:
+                print(f"⏭️ Blog page unchanged: {output_file}")
+        except Exception as e:
+            print(f"❌ Error writing {output_file}: {e}")
+            sys.exit(1)
+        print_minify_savings(output_file, sizes)
+        minified += sizes
+    return minified
+
+def shard_url(page):
+    """URL of the card shard for one of the blog's archive pages."""
+    return f"/{BLOG_SHARDS_DIR}/{page}.json"
+
+def render_card_shard(out, page_articles, next_url, images, context):
+    """Stream a card shard: {"cards": [{"href", "html"}, ...], "next": URL of the next older shard or null}."""
+    card_template = context.template("blog_card.html")
+    tag_template = context.template("partials/tag_link.html")
+    cards = []
+    for article in page_articles:
+        card = io.StringIO()
+        render_blog_card(card, article, images, context, card_template, tag_template)
+        html = card.getvalue().strip()
+        cards.append({
+            "href": f"/{ARTICLE_PAGES_DIR}/{article['safe_title']}",
+            "html": minify_html.minify_html(html) if context.minify else html,
+        })
+    out.write(json.dumps({"cards": cards, "next": next_url}, ensure_ascii=False, separators=(",", ":")))
+
+def write_card_shards(pages, output_dir, manifest=None, force=False, images=None, context=None):
+    """Write a JSON shard of blog cards per archive page of the blog, skipping unchanged ones.
+
+    pages is what blog_pages returns for the blog. Shards mirror the archive
+    pages, so like them a shard keeps its URL and content until one of its
+    own articles changes, and caches well. Shards past the last archive
+    page are removed. Returns the URL of the shard blog.html loads first,
+    or None when every article fits on blog.html.
+    """
+    archive = pages[1:]
+    shard_dir = os.path.join(output_dir, BLOG_SHARDS_DIR)
+    written = 0
+    for page, (_, _, page_articles, _) in enumerate(archive, start=1):
+        output_file = os.path.join(shard_dir, f"{page}.json")
+        next_url = shard_url(page - 1) if page > 1 else None
+        render = functools.partial(
+            render_card_shard, page_articles=page_articles, next_url=next_url, images=images, context=context
+        )
+        try:
+            if manifest is None:
+                make_output_folder(output_file)
+                with open(output_file, "w", encoding="utf-8") as f:
+                    render(f)
+                written += 1
+                continue
+            inputs = manifest.inputs_hash(
+                json.dumps([card_inputs(page_articles, images, context), next_url]),
+                context.page_inputs(BLOG_SHARD_TEMPLATES),
+            )
+            if not force and manifest.is_current(output_file, inputs):
+                manifest.skip(output_file)
+                continue
+            make_output_folder(output_file)
+            written += manifest.write_output(output_file, render, inputs)
+        except Exception as e:
+            print(f"❌ Error writing {output_file}: {e}")
+            sys.exit(1)
+
+    for name in glob.glob("*.json", root_dir=shard_dir) if os.path.isdir(shard_dir) else []:
+        if not name[:-len(".json")].isdigit() or int(name[:-len(".json")]) > len(archive):
+            path = os.path.join(shard_dir, name)
+            for stale in (path, f"{path}.gz", f"{path}.br"):
+                if os.path.exists(stale):
+                    os.remove(stale)
+            if manifest is not None:
+                manifest.data["outputs"].pop(manifest.key(path), None)
+            print(f"🗑️ Removed stale card shard: {path}")
+
+    print(f"✅ Card shards: {written} written, {len(archive) - written} unchanged in {shard_dir}")
+    if not archive:
+        return None
+    numbers = {archive_page_name("blog", page): page for page in range(1, len(archive) + 1)}
+    return shard_url(numbers[pages[0][3][0][0]])
+
+def generate_blog_html(articles, output_dir, manifest=None, force=False, images=None, context=None):
+    """Generate blog.html and the archive pages, up to ARTICLES_PER_PAGE articles each.
+
+    articles must already be newest first, as MetadataStore.newest_first()
+    returns them. See blog_pages for how articles are split into pages.
+
+    With a build manifest, pages whose articles, links and template are
+    unchanged are skipped; force re-renders them anyway. images maps image
+    paths to their responsive variants (see generate_images). The archive
+    pages' cards are also written as JSON shards (see write_card_shards)
+    that blog.html loads in place. Returns the (before, after) sizes of the
+    pages that were minified.
+    """
+    images = images or {}
+    if context is None:
+        context = build_context(output_dir)
     print(f"📝 Generating blog pages in: {output_dir}")
-    # Sort articles by date (newest first)
-    articles.sort(key=lambda x: x["parsed_date"], reverse=True)
-
-    # Calculate total pages (6 articles per page)
-    articles_per_page = 6
-    total_pages = math.ceil(len(articles) / articles_per_page)
-    print(f"📄 Total articles: {len(articles)}, Total pages: {total_pages}")
-
-    for page in range(1, total_pages + 1):
-        # Determine articles for this page
-        start_idx = (page - 1) * articles_per_page
-        end_idx = start_idx + articles_per_page
-        page_articles = articles[start_idx:end_idx]
-        
-        # Determine output file
-        output_file = os.path.join(output_dir, "blog.html" if page == 1 else f"blog_page_{page}.html")
-        print(f"📝 Generating page {page}: {output_file}")
-
-        # HTML template for blog page
-        blog_html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <script type="application/ld+json">
-    {{
-      "@context": "https://schema.org",
-      "@type": "LocalBusiness",
-      "name": "Provision Bookkeeping LLC",
-      "image": "/Images/Provision Bookkeeping Logo.png",
-      "url": "https://provisionbk.com",
-      "telephone": "+1-602-767-3829",
-      "address": {{
-        "@type": "PostalAddress",
-        "streetAddress": "865 East Baseline Rd #1091",
-        "addressLocality": "Gilbert",
-        "addressRegion": "AZ",
-        "postalCode": "85233",
-        "addressCountry": "US"
-      }},
-      "geo": {{
-        "@type": "GeoCoordinates",
-        "latitude": "33.3772794",
-        "longitude": "-111.8123101"
-      }},
-      "openingHours": "Mo-Fr 8:00-17:00",
-      "sameAs": [
-        "https://g.co/kgs/SA8hz3A",
-        "https://www.yelp.com/biz/provision-bookkeeping-mesa?uid=546ch3YcGUOeta71sLnMVg&utm_campaign=www_business_share_popup&utm_medium=copy_link&utm_source=(direct)",
-        "https://www.facebook.com/profile.php?id=61563494094507",
-        "https://www.instagram.com/provision_bookkeeping/?igsh=MXhvcnBrdTI3OGF5cA%3D%3D&utm_source=qr"
-      ]
-    }}
-    </script>
-    <script async src="https://www.googletagmanager.com/gtag/js?id=G-V4S9TY013M"></script>
-    <script>
-      window.dataLayer = window.dataLayer || [];
-      function gtag(){{dataLayer.push(arguments);}}
-      gtag('js', new Date());
-      gtag('config', 'G-V4S9TY013M');
-    </script>
-   
-
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta name="description" content="About Provision Bookkeeping LLC in AZ. Trusted bookkeeping experts for family-owned businesses. Learn more!">
-    <meta name="keywords" content="about bookkeeping, Chandler AZ bookkeeping, bookkeeping near me, family business financial services">
-    <title>Blog{' - Page ' + str(page) if page > 1 else ''}</title>
-    <link rel="stylesheet" href="/Styles/Header.css">
-    <link rel="icon" type="image/x-icon" href="/Images/Provision Bookkeeping Logo.ico">
-    <link rel="stylesheet" href="/Styles/Opening Picture.css">
-    <link rel="stylesheet" href="/Styles/How_We_Differ.css">
-    <link rel="stylesheet" href="/Styles/Welcome.css">
-    <link rel="stylesheet" href="/Styles/How_It_Works.css">
-    <link rel="stylesheet" href="/Styles/contact-us.css">
-    <link rel="stylesheet" href="/Styles/Footer.css">
-    <link rel="stylesheet" href="/Styles/About_Us.css">
-    <link rel="stylesheet" href="/Styles/Blog.css">
-    <link rel="stylesheet" href="/Styles/Articles.css">
-    <link href="https://fonts.googleapis.com/css2?family=Montserrat:wght@400;800&display=swap" rel="stylesheet">
-</head>
-<body>
-  <header>
-    <div class="header-container">
-      <a href="/index" class="logo">
-        <img src="/Images/Provision Bookkeeping Logo.png" alt="Provision Bookkeeping LLC Logo">
-        <span>PROVISION BOOKKEEPING</span>
-      </a>
-      <nav class="nav-menu">
-        <a href="/index">Home</a>
-        <a href="/about-us">About</a>
-        <a href="/blog">Blog</a>
-        <a href="/contact-us">Contact</a>
-      </nav>
-      <button class="menu-toggle" aria-label="Toggle navigation">☰</button>
-    </div>
-  </header>
-  <section class="Blog-main">
-    <div class="Blog-title">
-      <h1>Blog{' - Page ' + str(page) if page > 1 else ''}</h1>
-    </div>
-    <div class="blog-container">
-"""
-
-        # Add articles for this page
-        for article in page_articles:
-            # Convert date to MM/DD/YYYY for display
-            try:
-                display_date = datetime.strptime(article['date'], "%B %d, %Y").strftime("%m/%d/%Y")
-            except ValueError:
-                display_date = article['date']
-            
-            blog_html += f"""
-      <div class="blog-article">
-        <a href="/Articles/Article_HTMLs/{article['safe_title']}">
-          <h2>{article['title']}</h2>
-        </a>
-        <div class="meta">{display_date}<span class="highlight"></span></div>
-        <a href="/Articles/Article_HTMLs/{article['safe_title']}">
-          <img src="/{article['image']}" alt="{article['title']}">
-        </a>
-        <p>{article['summary']}</p>
-        <p>
-          <a href="/Articles/Article_HTMLs/{article['safe_title']}">
-            Read More
-          </a>
-        </p>
-      </div>
-"""
-
-        # Add pagination navigation
-        blog_html += """
-    </div>
-    <div class="pagination">
-"""
-        if page > 1:
-            prev_page = "blog" if page == 2 else f"blog_page_{page-1}"
-            blog_html += f"""
-      <a href="/{prev_page}" class="pagination-link">Previous</a>
-"""
-        if page < total_pages:
-            next_page = f"blog_page_{page+1}"
-            blog_html += f"""
-      <a href="/{next_page}" class="pagination-link">Next</a>
-"""
-        blog_html += """
-    </div>
-  </section>
-  <footer role="contentinfo">
-    <div class="footer-content">
-      <img src="/Images/Provision Bookkeeping Logo.png" alt="Provision Bookkeeping LLC Gilbert AZ" style="height: 20px;">
-      &copy; 2025 Provision Bookkeeping LLC
-      <a href="https://www.google.com/maps/search/?api=1&query=865+East+Baseline+Rd+%231091,+Gilbert,+AZ+85233" target="_blank" rel="noopener noreferrer">
-        865 East Baseline Rd #1091, Gilbert, AZ 85233
-      </a><br>
-      <a href="tel:+16027673829">602-767-3829</a> | <a href="mailto:contact@provisionbk.com">contact@provisionbk.com</a><br>
-      <div class="footer_icons">
-        <a href="https://g.co/kgs/SA8hz3A" aria-label="Google">
-          <img src="/Images/google_logo.png" alt="Google">
-        </a>
-        <a href="https://www.yelp.com/biz/provision-bookkeeping-mesa?uid=546ch3YcGUOeta71sLnMVg&utm_campaign=www_business_share_popup&utm_medium=copy_link&utm_source=(direct)" aria-label="Yelp">
-          <img src="/Images/yelp_logo.png" alt="Yelp">
-        </a>
-        <a href="https://linkedin.com/company/provisionbookkeeping" aria-label="LinkedIn">
-          <img src="/Images/linkedin_logo.png" alt="LinkedIn">
-        </a>
-        <a href="https://www.facebook.com/profile.php?id=61563494094507" aria-label="Facebook">
-          <img src="/Images/facebook_logo.png" alt="Facebook">
-        </a>
-        <a href="https://www.instagram.com/provision_bookkeeping/?igsh=MXhvcnBrdTI3OGF5cA%3D%3D&utm_source=qr" aria-label="Instagram">
-          <img src="/Images/instagram_logo.png" alt="Instagram">
-        </a>
-      </div>
-      <nav class="footer-nav">
-        <a href="/index" style="flex: 1; margin: 0 10px; padding: 0px 0px;">Home</a>
-        <a href="/about-us" style="flex: 1; margin: 0 10px; padding: 0px 0px;">About Us</a>
-        <a href="/blog" style="flex: 1; margin: 0 10px; padding: 0px 0px;">Blog</a>
-        <a href="/contact-us" style="flex: 1; margin: 0 10px; padding: 0px 0px;">Contact</a>
-        <a href="/sitemap" style="flex: 1; margin: 0 10px; padding: 0px 0px;">Sitemap</a>
-        <a href="/privacy-policy" style="flex: 1; margin: 0 10px; padding: 0px 0px;">Privacy Policy</a>
-        <a href="/terms-of-service" style="flex: 1; margin: 0 10px; padding: 0px 0px;">Terms of Service</a>
-      </nav>
-      <div class="cta">
-        <a href="" onclick="Calendly.initPopupWidget({url: 'https://calendly.com/provisionbk/30min?hide_event_type_details=1&hide_gdpr_banner=1&text_color=00446f&primary_color=00446f'});return false;">Schedule a FREE Meeting</a>
-      </div>
-      Expert <strong>bookkeeping services</strong>, <strong>small business bookkeeping</strong>, <strong>payroll processing</strong>, and <strong>QuickBooks services</strong> serving <strong>Phoenix</strong>, <strong>Scottsdale</strong>, <strong>Tempe</strong>, <strong>Gilbert</strong>, <strong>Queen Creek</strong>, <strong>Tucson</strong>, <strong>Mesa</strong>, <strong>Chandler</strong>, <strong>Glendale</strong>, <strong>Peoria</strong>, <strong>Surprise</strong>, and <strong>Yuma</strong>.
-    </div>
-  </footer>
-  <script>
-    const menuToggle = document.querySelector('.menu-toggle');
-    const navMenu = document.querySelector('.nav-menu');
-    menuToggle.addEventListener('click', () => {
-      navMenu.classList.toggle('active');
-    });
-    const currentPage = window.location.pathname.split('/').pop() || 'index';
-    const navLinks = document.querySelectorAll('.nav-menu a');
-    navLinks.forEach(link => {
-      if (link.getAttribute('href') === currentPage) {
-        link.classList.add('active');
-      } else {
-        link.classList.remove('active');
-      }
-    });
-  </script>
-</body>
-</html>
-"""
+    pages = blog_pages(articles)
+    print(f"📄 Total articles: {len(articles)}, Total pages: {len(pages)}")
+    first_shard = write_card_shards(pages, output_dir, manifest, force, images, context)
+    load_more = {"blog": first_shard} if first_shard else {}
+    minified = write_listing_pages(pages, output_dir, manifest, force, images, context, load_more)
+    remove_stale_blog_pages(output_dir, {name for name, *_ in pages}, manifest)
+    return minified
+
+def generate_archive_pages(articles, output_dir, manifest, force=False, images=None, context=None):
+    """Generate a paginated listing per tag and per month.
+
+    The articles are grouped in one pass. A group whose members (and their
+    cards) are unchanged since the last build is skipped without rendering
+    anything; listings of groups that no longer exist are removed.
+    Returns the (before, after) sizes of the pages that were minified.
+    """
+    images = images or {}
+    if context is None:
+        context = build_context(output_dir)
+    groups = group_articles(articles)
+    cache = manifest.data.setdefault("archives", {})
+    minified = []
+    regenerated = 0
+
+    for base, (label, members) in groups.items():
+        pages = blog_pages(members, base, f" - {label}")
+        names = [name for name, *_ in pages]
+        inputs = manifest.inputs_hash(blog_page_inputs(label, members, [], images, context, os.path.dirname(base)))
+        files = [os.path.join(output_dir, *f"{name}.html".split("/")) for name in names]
+        if not force and cache.get(base, {}).get("inputs") == inputs and all(map(os.path.exists, files)):
+            for output_file in files:
+                manifest.skip(output_file)
+            continue
+        minified += write_listing_pages(pages, output_dir, manifest, force, images, context)
+        for name in cache.get(base, {}).get("pages", []):
+            if name not in names:
+                remove_listing_page(output_dir, name, manifest)
+        cache[base] = {"inputs": inputs, "pages": names}
+        regenerated += 1
+
+    for base in sorted(cache.keys() - groups.keys()):
+        for name in cache.pop(base)["pages"]:
+            remove_listing_page(output_dir, name, manifest)
+        print(f"🗑️ Removed empty listing: {base}")
+    print(f"✅ Tag and month listings: {regenerated} regenerated, {len(groups) - regenerated} unchanged")
+    return minified
+
+def site_page_dir(path):
+    """Folder a site page lives in, relative to the site root."""
+    return path.rpartition("/")[0]
+
+def page_groups():
+    """Return {group: (templates, page_dir, page_type)} for every kind of page the build renders.
 
+    Pages in a group share their dependencies (see BuildContext.page_dependencies).
+    """
+    groups = {
+        "article": (PAGE_TEMPLATES["article"], ARTICLE_PAGES_DIR, "article"),
+        "blog": (PAGE_TEMPLATES["blog"], "", "blog"),
+        TAGS_DIR: (PAGE_TEMPLATES["blog"], TAGS_DIR, "blog"),
+        ARCHIVE_DIR: (PAGE_TEMPLATES["blog"], ARCHIVE_DIR, "blog"),
+        BLOG_SHARDS_DIR: (BLOG_SHARD_TEMPLATES, "", None),
+    }
+    for path, page_type in SITE_PAGES:
+        groups[path] = ([f"{SITE_PAGES_TEMPLATES_DIR}/{path}"], site_page_dir(path), page_type)
+    return groups
+
+def record_page_dependencies(manifest, context):
+    """Store the dependency graph in the build manifest and report the page groups whose dependencies changed."""
+    graph = manifest.data.setdefault("dependencies", {})
+    changed = []
+    for group, args in page_groups().items():
+        dependencies = context.page_dependencies(*args)
+        entry = {
+            "templates": dependencies["templates"],
+            "assets": sorted(dependencies["assets"]),
+            "inputs": context.page_inputs(*args),
+        }
+        if group in graph and graph[group] != entry:
+            changed.append(group)
+        graph[group] = entry
+    if changed:
+        print(f"🔗 Dependencies changed, rebuilding: {', '.join(changed)}")
+
+def site_image_sizes(img_tag):
+    """Return the sizes hint for a hand-written <img> tag, or None if it isn't a content image."""
+    match = IMG_CLASS.search(img_tag)
+    for name in match.group(1).split() if match else []:
+        if name in SITE_PAGE_IMAGE_SIZES:
+            return SITE_PAGE_IMAGE_SIZES[name]
+    return None
+
+def site_page_images(path):
+    """Return the site-relative paths of the raster content images on a site page."""
+    source = read_template_source(f"{SITE_PAGES_TEMPLATES_DIR}/{path}")
+    sources = (
+        asset_source(match.group(1), site_page_dir(path))
+        for match in IMG_TAG.finditer(source) if site_image_sizes(match.group(0))
+    )
+    return sorted({src for src in sources if src and src.lower().endswith(RESPONSIVE_EXTENSIONS)})
+
+def render_site_page(out, path, page_type, images, context):
+    """Stream one hand-maintained page from Templates/pages/ to a file handle."""
+    bundle = context.css_bundles.get(page_type)
+    context.template(f"{SITE_PAGES_TEMPLATES_DIR}/{path}", site_page_dir(path), images).render(
+        out,
+        stylesheets=(lambda out: render_stylesheets(out, bundle)) if bundle else "",
+        third_party=context.third_party.get(page_type, ""),
+    )
+
+def generate_site_pages(output_dir, manifest, force=False, images=None, context=None):
+    """Render the hand-maintained pages in site_config.SITE_PAGES, skipping unchanged ones.
+
+    A page is rebuilt when one of its templates (or a partial they include),
+    an asset it links to, its images' variants or its stylesheet bundle
+    changes. Returns the (before, after) sizes of the pages that were minified.
+    """
+    images = images or {}
+    if context is None:
+        context = build_context(output_dir)
+    minified = []
+    for path, page_type in SITE_PAGES:
+        output_file = os.path.join(output_dir, *path.split("/"))
+        inputs = manifest.inputs_hash(
+            context.page_inputs([f"{SITE_PAGES_TEMPLATES_DIR}/{path}"], site_page_dir(path), page_type),
+            [(image_info_key(images.get(src)), image_urls(src, images.get(src), context))
+             for src in site_page_images(path)],
+        )
+        if not force and manifest.is_current(output_file, inputs):
+            manifest.skip(output_file)
+            print(f"⏭️ Site page unchanged: {output_file}")
+            continue
+        make_output_folder(output_file)
+        sizes = []
+        render = context.page_renderer(
+            functools.partial(render_site_page, path=path, page_type=page_type, images=images, context=context),
+            sizes,
+        )
         try:
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(blog_html)
-            print(f"✅ Blog page {page} generated at: {output_file}")
+            if manifest.write_output(output_file, render, inputs):
+                print(f"✅ Site page generated at: {output_file}")
+            else:
+                print(f"⏭️ Site page unchanged: {output_file}")
         except Exception as e:
             print(f"❌ Error writing {output_file}: {e}")
             sys.exit(1)
+        print_minify_savings(output_file, sizes)
+        minified += sizes
+    return minified
 
-def generate_article_from_txt(txt_file):
-    """Main function to generate article HTML and update blog.html."""
-    # Verify input file
-    if not os.path.exists(txt_file):
-        print(f"❌ Error: Input file {txt_file} not found")
+def find_article_sources(articles_dir):
+    """Return every article .txt source in a directory, sorted by name."""
+    if not os.path.isdir(articles_dir):
+        print(f"❌ Error: Articles directory {articles_dir} not found")
+        sys.exit(1)
+
+    return sorted(
+        os.path.join(articles_dir, name)
+        for name in os.listdir(articles_dir)
+        if name.endswith(".txt")
+    )
+
+def generate_articles_from_txts(txt_files, force=False, jobs=1, delete=(), metadata=None, context=None,
+                                minify=False, metrics=None, max_page_bytes=MAX_PAGE_BYTES,
+                                max_page_requests=MAX_PAGE_REQUESTS, enforce_budgets=True, notify=False,
+                                third_party=DEFAULT_STRATEGY, compress=True):
+    """Generate HTML for a batch of articles and update blog.html once.
+
+    Articles already in the metadata are updated when their header changed,
+    and the safe_titles in delete are removed along with their pages. Outputs whose inputs are unchanged according to Articles/.build_manifest.json
+    are left alone; force rebuilds everything. Article pages are rendered
+    across jobs worker processes; metadata and blog pages are built afterwards
+    in this process. A MetadataStore and BuildContext kept from an earlier
+    build (see watch) are reused instead of being loaded and rebuilt. With
+    minify, pages are written minified and the bytes saved are reported.
+    third_party picks how pages load fonts, analytics and Calendly.
+    Stage timings and counters are recorded in metrics; returns the BuildMetrics.
+    Every generated page is then checked against the page-weight budgets,
+    failing the build if one is over and enforce_budgets is set; without
+    Pillow no image variants are made, and budgets only warn. sitemap.xml
+    is written from the same metadata and manifest; with notify, search
+    engines are told about the URLs whose content changed once the
+    page-weight check has passed. Without compress, no .gz/.br siblings are
+    written; the manifest keeps the hash each was made from, so the next
+    compressing build catches up.
+    """
+    if not txt_files:
+        print("❌ Error: No article .txt files to process")
+        sys.exit(1)
+
+    for txt_file in txt_files:
+        if not os.path.exists(txt_file):
+            print(f"❌ Error: Input file {txt_file} not found")
+            sys.exit(1)
+
+    # All sources in one batch share a single metadata file and blog output
+    articles_dirs = {os.path.dirname(txt_file) for txt_file in txt_files}
+    if len(articles_dirs) > 1:
+        print(f"❌ Error: All article files must be in the same directory, got: {sorted(articles_dirs)}")
         sys.exit(1)
+    articles_dir = articles_dirs.pop()
+    output_dir = os.path.dirname(articles_dir)
+
+    print(f"🚀 Starting processing for {len(txt_files)} article(s) in: {articles_dir or '.'}")
+    metrics = metrics or BuildMetrics()
+
+    # Phase 1: parse every article once
+    with metrics.stage("parse articles"):
+        parsed = [(txt_file, parse_article(txt_file)) for txt_file in txt_files]
+
+    # Phase 2: merge into the existing metadata and save it once
+    with metrics.stage("merge metadata"):
+        manifest = BuildManifest(articles_dir, TEMPLATE_VERSION)
+        if metadata is None:
+            metadata = load_articles_metadata(articles_dir)
+        counts = {"added": 0, "updated": 0, "unchanged": 0, "deleted": 0}
+        delete = [title_key(safe_title) for safe_title in delete]
+        for _, article in parsed:
+            if article.safe_title in delete:
+                print(f"⚠️ Article {article.title} is being deleted, not adding it back")
+                continue
+            result = metadata.upsert(article.to_metadata())
+            counts[result] += 1
+            if result == "updated":
+                print(f"🔄 Article {article.title} changed, metadata updated")
+        for safe_title in delete:
+            if not metadata.delete(safe_title):
+                print(f"⚠️ Article {safe_title} not found in metadata, nothing to delete")
+                continue
+            output_file = os.path.join(articles_dir, "Article_HTMLs", f"{safe_title}.html")
+            for stale in (output_file, f"{output_file}.gz", f"{output_file}.br"):
+                if os.path.exists(stale):
+                    os.remove(stale)
+            manifest.data["outputs"].pop(manifest.key(output_file), None)
+            counts["deleted"] += 1
+            print(f"🗑️ Deleted article: {safe_title}")
+        metadata.save()
+        articles = metadata.newest_first()
+        parsed = [(txt_file, article) for txt_file, article in parsed if article.safe_title not in delete]
+
+    # Phase 3: build responsive variants of every hero image that changed
+    with metrics.stage("image variants"):
+        image_paths = [a["image"] for a in articles] + [article.image_path for _, article in parsed]
+        image_paths += [src for path, _ in SITE_PAGES for src in site_page_images(path)]
+        images = generate_image_variants(image_paths, output_dir, manifest, force, jobs)
+
+    # Phase 4: fingerprint assets (including the new variants) and bundle the
+    # stylesheets every page links to; pages depend on both
+    with metrics.stage("assets and css"):
+        if context is None:
+            context = build_context(output_dir, minify, third_party)
+        manifest.set_template_version(hash_bytes(TEMPLATE_VERSION + context.version()))
+        record_page_dependencies(manifest, context)
 
-    print(f"🚀 Starting processing for: {txt_file}")
-    # Generate article HTML and get metadata
-    article_metadata = generate_article_html(txt_file)
-    articles_dir = os.path.dirname(txt_file)
+    # Phase 5: render the changed article pages, in parallel if requested
+    with metrics.stage("render articles"):
+        stale = []
+        for txt_file, article in parsed:
+            output_file = article_output_path(txt_file, article.safe_title)
+            image_info = images.get(article.image_path)
+            inputs = article_page_inputs(manifest, txt_file, article, image_info, context)
+            if not force and manifest.is_current(output_file, inputs):
+                manifest.skip(output_file)
+                print(f"⏭️ Article unchanged, skipping: {output_file}")
+                continue
+            stale.append((article, output_file, image_info, inputs))
+        results = write_article_pages(
+            [s[0] for s in stale], [s[1] for s in stale], [s[2] for s in stale], context, jobs
+        )
+        minified = []
+        for (*_, inputs), (output_file, content_hash, written, sizes) in zip(stale, results):
+            manifest.record(output_file, inputs, content_hash, written)
+            minified += sizes
 
-    # Load existing articles metadata
-    articles = load_articles_metadata(articles_dir)
+    # Phase 6: update the search index for the articles that changed
+    with metrics.stage("search index"):
+        generate_search_index(articles, [article for _, article in parsed], output_dir, manifest, force)
 
-    # Check if the new article is already in the metadata (to avoid duplicates)
-    new_article = parse_article_metadata(txt_file)
-    if not any(a["safe_title"] == new_article["safe_title"] for a in articles):
-        articles.append(new_article)
-        save_articles_metadata(articles_dir, articles)
-    else:
-        print(f"⚠️ Article {new_article['title']} already exists in metadata, skipping addition")
+    # Phase 7: rewrite the feeds if the newest articles changed
+    with metrics.stage("feeds"):
+        generate_feeds(articles, [article for _, article in parsed], output_dir, manifest, force)
 
-    # Generate blog.html and additional pages
+    # Phase 8: regenerate blog.html and additional pages once
+    with metrics.stage("generate blog"):
+        minified += generate_blog_html(articles, output_dir, manifest, force, images, context)
+
+    # Phase 9: regenerate the tag and month listings whose articles changed
+    with metrics.stage("listings"):
+        minified += generate_archive_pages(articles, output_dir, manifest, force, images, context)
+
+    # Phase 10: render the hand-maintained pages whose dependencies changed
+    with metrics.stage("site pages"):
+        minified += generate_site_pages(output_dir, manifest, force, images, context)
+
+    # Phase 11: write the sitemap from the loaded metadata and the pages written
+    with metrics.stage("sitemap"):
+        urls, changed_urls = generate_sitemap(
+            articles, manifest, os.path.join(output_dir, "sitemap.xml"), output_dir, manifest.written
+        )
+        if notify:
+            pending_urls = queue_notifications(manifest, changed_urls)
+
+    # Phase 12: write .gz/.br siblings of every output that changed
+    with metrics.stage("compress outputs"):
+        compressed = compress_outputs(find_compressible_outputs(output_dir), manifest, force, jobs) if compress else []
+        manifest.save()
+
+    # Phase 13: check every generated page's transfer size and request count.
+    # The budgets assume AVIF/WebP variants, so without Pillow they only warn.
+    with metrics.stage("page weight"):
+        if enforce_budgets and not supported_formats():
+            print("⚠️ Pillow with WebP/AVIF support not installed, page-weight budgets only warn")
+            enforce_budgets = False
+        checked, over_budget, missing = check_page_weights(
+            manifest, max_page_bytes, max_page_requests, enforce_budgets
+        )
+
+    # Search engines only hear about builds that passed the checks; until
+    # then the changed URLs stay queued in the manifest
+    if notify and over_budget:
+        print(f"⚠️ Pages over budget, not notifying search engines; {len(pending_urls)} URL(s) stay queued")
+    elif notify:
+        with metrics.stage("notify"):
+            notify_changed(pending_urls, metrics)
+            manifest.data["notify_pending"] = []
+            manifest.save()
+
+    metrics.count("files_parsed", len(txt_files))
+    for result in ("added", "updated", "deleted"):
+        metrics.count(f"articles_{result}", counts[result])
+    metrics.count("pages_written", len(manifest.written))
+    metrics.count("pages_skipped", len(manifest.skipped))
+    metrics.count("bytes_written", sum(os.path.getsize(path) for path in manifest.written if os.path.exists(path)))
+    metrics.count("sitemap_urls", urls)
+    metrics.count("sitemap_urls_changed", len(changed_urls))
+    metrics.count("files_compressed", len(compressed))
+    metrics.count("pages_checked", checked)
+    metrics.count("pages_over_budget", over_budget)
+    metrics.count("missing_references", missing)
+
+    print(f"✅ Process completed for {len(txt_files)} article(s): {counts['added']} added,"
+          f" {counts['updated']} updated, {counts['deleted']} deleted in metadata")
+    print(f"   {len(manifest.written)} page(s) written, {len(manifest.skipped)} unchanged")
+    if minified:
+        before, after = sum(b for b, _ in minified), sum(a for _, a in minified)
+        print(f"🗜️ Minified {len(minified)} page(s): {format_savings(before, after)}, {before - after} bytes saved")
+        metrics.count("bytes_saved_minify", before - after)
+    metrics.print_summary()
+    return metrics
+
+def generate_article_from_txt(txt_file, force=False):
+    """Main function to generate article HTML and update blog.html."""
+    generate_articles_from_txts([txt_file], force)
+
+# What watch mode polls, as (folder, extensions, recurse into subfolders).
+# Generated outputs (Styles/Bundles, Article_Images/Responsive, Assets) are
+# left out so a rebuild never triggers another one.
+WATCHED_SOURCES = [
+    ("Articles", (".txt",), False),
+    ("Styles", (".css",), False),
+    ("JS", (".js",), False),
+    ("Fonts", (".woff2",), False),
+    ("Templates", (".html",), True),
+    ("Images", None, False),
+    ("Articles/Article_Images", None, False),
+]
+WATCH_INTERVAL = 0.2
+
+def watched_files(root):
+    """Return {path: mtime_ns} for every source watch mode rebuilds from."""
+    files = {}
+    for folder, extensions, recursive in WATCHED_SOURCES:
+        for dirpath, dirs, names in os.walk(os.path.join(root, *folder.split("/"))):
+            if not recursive:
+                dirs.clear()
+            for name in names:
+                if extensions is None or name.endswith(extensions):
+                    path = os.path.join(dirpath, name)
+                    try:
+                        files[path] = os.stat(path).st_mtime_ns
+                    except FileNotFoundError:
+                        pass  # Deleted between listing and stat; the next poll sees it
+    return files
+
+def watch_build(txt_files, delete=(), **options):
+    """Run one watch-mode build; a failing build is reported instead of stopping the dev server.
+
+    The dev server never serves the .gz/.br siblings, so compression is
+    skipped along with page-weight enforcement.
+    """
+    try:
+        generate_articles_from_txts(txt_files, delete=delete, enforce_budgets=False, compress=False, **options)
+        return True
+    except SystemExit:
+        print("❌ Build failed, fix the error above; watching for the next change")
+    except Exception as e:
+        print(f"❌ Build failed: {e!r}; watching for the next change")
+    return False
+
+def source_titles(txt_files):
+    """Return {txt path: safe_title} for the article sources that parse."""
+    titles = {}
+    for txt_file in txt_files:
+        try:
+            titles[txt_file] = parse_article(txt_file).safe_title
+        except (SystemExit, Exception):
+            pass  # Reported by the build that reads it
+    return titles
+
+def watch(articles_dir, jobs=1, port=8000, force=False, minify=False, third_party=DEFAULT_STRATEGY):
+    """Build once, then serve the site and rebuild whatever a source change affects.
+
+    Metadata, compiled templates and the build context stay in memory. An
+    article edit re-renders just that article plus the blog pages and
+    search index; deleting an article's .txt removes it like --delete, and
+    so does changing its Title: for the old safe_title; a
+    template, stylesheet, script or image edit rebuilds the context and
+    every page whose dependencies changed. force only applies to the first
+    build; minify and third_party apply to every build. A failing build is
+    reported and the next change retried. Each rebuild reloads open
+    browser tabs.
+    """
     output_dir = os.path.dirname(articles_dir)
-    generate_blog_html(articles, output_dir)
+    server, notifier = start_dev_server(output_dir, port)
+    metadata = load_articles_metadata(articles_dir)
+    context = build_context(output_dir, minify, third_party)
+    options = {"jobs": jobs, "metadata": metadata, "minify": minify, "third_party": third_party}
+    watch_build(find_article_sources(articles_dir), force=force, context=context, **options)
+    titles = source_titles(find_article_sources(articles_dir))
+    sources = watched_files(output_dir)
+    print(f"👀 Watching {', '.join(folder for folder, *_ in WATCHED_SOURCES)} for changes (Ctrl+C to stop)")
 
-    print(f"✅ Article HTML generated at: {os.path.join(articles_dir, 'Article_HTMLs', article_metadata['safe_title'] + '.html')}")
-    print(f"✅ Process completed for: {txt_file}")
+    try:
+        while True:
+            time.sleep(WATCH_INTERVAL)
+            current = watched_files(output_dir)
+            changed = {path for path in current.keys() | sources.keys() if current.get(path) != sources.get(path)}
+            if not changed:
+                continue
+            sources = current
+            start = time.perf_counter()
+            print(f"🔄 Changed: {', '.join(sorted(changed))}")
+
+            rebuild = sorted(path for path in changed if path.endswith(".txt") and path in current)
+            delete = [titles.pop(path) for path in sorted(changed) if path in titles and path not in current]
+            edited = source_titles(rebuild)
+            delete += [titles[path] for path in edited if path in titles and titles[path] != edited[path]]
+            if delete or any(not path.endswith(".txt") for path in changed):
+                rebuild = find_article_sources(articles_dir)
+            if any(not path.endswith(".txt") for path in changed):
+                page_templates.clear_template_caches()
+                try:
+                    context = build_context(output_dir, minify, third_party)
+                except (SystemExit, Exception) as e:
+                    print(f"❌ Could not rebuild the build context: {e!r}; watching for the next change")
+                    continue
+            if delete and not rebuild:
+                print(f"⚠️ No articles left in {articles_dir}, not removing: {', '.join(delete)}")
+            elif rebuild:
+                watch_build(rebuild, delete, context=context, **options)
+                titles.update(edited)
+            print(f"⚡ Rebuilt in {(time.perf_counter() - start) * 1000:.0f} ms")
+            notifier.notify()
+    except KeyboardInterrupt:
+        print("👋 Stopping watch mode")
+        server.shutdown()
 
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
+    parser = argparse.ArgumentParser(description="Generate article pages and blog.html from article .txt files.")
+    parser.add_argument("txt_files", nargs="*", help="article .txt file(s) to process")
+    parser.add_argument("--all", metavar="DIR", dest="all_dir",
+                        help="process every .txt file in DIR (e.g. Articles)")
+    parser.add_argument("--force", action="store_true",
+                        help="ignore Articles/.build_manifest.json and rebuild every page")
+    parser.add_argument("--jobs", "-j", type=int, default=1, metavar="N",
+                        help="render articles across N worker processes (default: 1)")
+    parser.add_argument("--delete", action="append", default=[], metavar="SAFE_TITLE",
+                        help="remove an article from the metadata and delete its page (repeatable)")
+    parser.add_argument("--watch", metavar="DIR",
+                        help="build DIR, then serve the site and rebuild on every change (e.g. Articles)")
+    parser.add_argument("--port", type=int, default=8000,
+                        help="port for the --watch dev server (default: 8000)")
+    parser.add_argument("--minify", action="store_true",
+                        help="strip comments and insignificant whitespace from every page written")
+    parser.add_argument("--third-party", choices=sorted(LOADING_STRATEGIES), default=DEFAULT_STRATEGY,
+                        help="how pages load fonts, analytics and Calendly: eager loads them with the page,"
+                             f" deferred after load or on interaction (default: {DEFAULT_STRATEGY})")
+    parser.add_argument("--max-page-bytes", type=int, default=MAX_PAGE_BYTES, metavar="BYTES",
+                        help=f"fail the build if a page transfers more than this (default: {MAX_PAGE_BYTES});"
+                             " only warns without Pillow, whose image variants the default assumes")
+    parser.add_argument("--max-page-requests", type=int, default=MAX_PAGE_REQUESTS, metavar="N",
+                        help=f"fail the build if a page makes more local requests (default: {MAX_PAGE_REQUESTS})")
+    parser.add_argument("--notify", action="store_true",
+                        help="tell search engines about the sitemap URLs whose content changed")
+    parser.add_argument("--profile", nargs="?", const="build-profile", metavar="PREFIX",
+                        help="write cProfile stats to PREFIX.prof and a Chrome trace to PREFIX.trace.json"
+                             " (default PREFIX: build-profile)")
+    parser.add_argument("--quiet", "-q", action="store_true",
+                        help="print only errors, warnings and one summary line")
+    args = parser.parse_args()
+
+    if args.watch:
+        watch(os.path.normpath(args.watch), args.jobs, args.port, args.force, args.minify, args.third_party)
+        sys.exit(0)
+
+    # Normalize paths to handle different OS separators and spaces
+    txt_files = [os.path.normpath(path) for path in args.txt_files]
+    if args.all_dir:
+        txt_files += find_article_sources(os.path.normpath(args.all_dir))
+
+    if not txt_files:
         print("Usage: python generate_article.py Articles\\new_article.txt")
+        print("       python generate_article.py --all Articles")
         sys.exit(1)
-    else:
-        # Normalize path to handle different OS separators and spaces
-        txt_file = os.path.normpath(sys.argv[1])
-        generate_article_from_txt(txt_file)
\ No newline at end of file
+
+    metrics = BuildMetrics()
+    if args.profile:
+        metrics.start_profile()
+    with quiet_output(args.quiet):
+        generate_articles_from_txts(
+            txt_files, args.force, args.jobs, args.delete, minify=args.minify, metrics=metrics,
+            max_page_bytes=args.max_page_bytes, max_page_requests=args.max_page_requests, notify=args.notify,
+            third_party=args.third_party,
+        )
+    if args.quiet:
+        print(metrics.summary_line())
+    if args.profile:
+        metrics.write_profile(args.profile)
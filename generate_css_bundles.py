@@ -0,0 +1,260 @@
+import os
+import re
+import sys
+from dataclasses import dataclass
+
+from build_manifest import hash_bytes, write_if_changed
+from page_templates import read_template_source
+from fingerprint_assets import rewrite_css_urls
+
+BUNDLES_DIR = "Styles/Bundles"
+
+# Stylesheets each page type used to link one by one, in cascade order
+SITE_PAGE_STYLESHEETS = [
+    "Header.css", "Opening Picture.css", "How_We_Differ.css", "Welcome.css", "How_It_Works.css",
+    "contact-us.css", "Footer.css", "Articles.css",
+]
+PAGE_STYLESHEETS = {
+    "article": [
+        "Header.css", "Opening Picture.css", "How_We_Differ.css", "Welcome.css", "How_It_Works.css",
+        "contact-us.css", "Footer.css", "About_Us.css", "Blog.css", "Articles.css",
+    ],
+    "blog": [
+        "Header.css", "Opening Picture.css", "How_We_Differ.css", "Welcome.css", "How_It_Works.css",
+        "contact-us.css", "Footer.css", "About_Us.css", "Blog.css", "Articles.css",
+    ],
+    "index": SITE_PAGE_STYLESHEETS,
+    "about-us": SITE_PAGE_STYLESHEETS[:-1] + ["About_Us.css", "Articles.css"],
+    "contact-us": SITE_PAGE_STYLESHEETS,
+    "privacy-policy": SITE_PAGE_STYLESHEETS,
+    "terms-of-service": ["Header.css", "Footer.css", "Articles.css"],
+    "sitemap": SITE_PAGE_STYLESHEETS,
+}
+
+# Templates each page type is rendered from; rules for classes that appear
+# in none of them are dropped from that page type's bundle
+PAGE_TEMPLATES = {
+    "article": ["article.html", "article_section.html"],
+    "blog": [
+        "blog.html", "blog_card.html", "partials/pagination_link.html", "partials/tag_link.html",
+        "partials/load_more.html",
+    ],
+    "index": ["pages/index.html"],
+    "about-us": ["pages/about-us.html"],
+    "contact-us": ["pages/contact-us.html"],
+    "privacy-policy": ["pages/privacy-policy.html"],
+    "terms-of-service": ["pages/terms-of-service.html"],
+    "sitemap": ["pages/sitemap.html"],
+}
+
+# The markup visible before scrolling: (template, marker it ends at). Rules
+# that only touch this markup are inlined in <head> as critical CSS.
+ABOVE_THE_FOLD = {
+    "article": [("article.html", "<article>")],
+    "blog": [("blog.html", '<div class="pagination">'), ("blog_card.html", None)],
+    "index": [("pages/index.html", '<section class="Welcome-main">')],
+    "about-us": [("pages/about-us.html", '<div class="side-text">')],
+    "contact-us": [("pages/contact-us.html", '<div class="form-container">')],
+    "privacy-policy": [("pages/privacy-policy.html", "<h2>1. Information We Collect</h2>")],
+    "terms-of-service": [("pages/terms-of-service.html", "<h2>1. Services</h2>")],
+    "sitemap": [("pages/sitemap.html", '<div class="sitemap-section">')],
+}
+
+# Web fonts are loaded from each page's <head> (see third_party.py), so
+# @imports of these stylesheets are left out of the bundles
+DROPPED_IMPORTS = ("fonts.googleapis.com",)
+# font-family declarations, in the bundled CSS and in a page's inline <style>s
+FONT_FAMILY = re.compile(r'font-family\s*:\s*([^;}]+)')
+
+# Classes added at runtime by the nav script in partials/nav_script.html
+# and by JS/Opening Picture.js
+SCRIPT_CLASSES = {"active", "parallax-image"}
+
+CLASS_ATTR = re.compile(r'class="([^"{}]*)"')
+ID_ATTR = re.compile(r'id="([^"{}]*)"')
+TAG_NAME = re.compile(r'<([a-zA-Z][\w-]*)')
+SELECTOR_CLASS = re.compile(r'\.(-?[_a-zA-Z][\w-]*)')
+SELECTOR_ID = re.compile(r'#(-?[_a-zA-Z][\w-]*)')
+SELECTOR_TAG = re.compile(r'(?:^|[\s>+~,(])([a-zA-Z][\w-]*)')
+# Parts of a selector that never need to match the page: attribute tests,
+# negations and pseudo-class/element names
+SELECTOR_NOISE = re.compile(r'\[[^\]]*\]|:not\([^)]*\)|::?[\w-]+(\([^)]*\))?')
+
+@dataclass
+class CssBundle:
+    """A page type's minified stylesheet bundle plus its inlined critical rules.
+
+    font_families lists every family the page type's styles name, so its
+    <head> only loads the web fonts it uses.
+    """
+    page_type: str
+    href: str
+    critical_css: str
+    content_hash: str
+    font_families: tuple = ()
+
+def markup_names(markup):
+    """Return the (classes, ids, tags) used in some HTML markup."""
+    classes = {name for attr in CLASS_ATTR.findall(markup) for name in attr.split()}
+    ids = set(ID_ATTR.findall(markup))
+    tags = {tag.lower() for tag in TAG_NAME.findall(markup)}
+    return classes | SCRIPT_CLASSES, ids, tags | {"html", "body"}
+
+def selector_names(selector):
+    """Return the (classes, ids, tags) a single selector requires."""
+    core = SELECTOR_NOISE.sub("", selector)
+    classes = set(SELECTOR_CLASS.findall(core))
+    ids = set(SELECTOR_ID.findall(core))
+    tags = {tag.lower() for tag in SELECTOR_TAG.findall(SELECTOR_CLASS.sub("", SELECTOR_ID.sub("", core)))}
+    return classes, ids, tags
+
+def selector_matches(selector, names, check_tags):
+    """True when every class/id (and optionally tag) in selector is in names."""
+    classes, ids, tags = selector_names(selector)
+    page_classes, page_ids, page_tags = names
+    if not (classes <= page_classes and ids <= page_ids):
+        return False
+    return not check_tags or tags <= page_tags
+
+def parse_css(css):
+    """Split CSS into (prelude, body) pairs; body is None for statements like @import."""
+    rules = []
+    start = depth = 0
+    body_start = None
+    prelude = ""
+    quote = None
+    for i, ch in enumerate(css):
+        if quote:
+            if ch == quote and css[i - 1] != "\\":
+                quote = None
+        elif ch in "\"'":
+            quote = ch
+        elif ch == "{":
+            if depth == 0:
+                prelude = css[start:i].strip()
+                body_start = i + 1
+            depth += 1
+        elif ch == "}":
+            if depth == 0:
+                # Stray closing brace: skip it like a browser would
+                start = i + 1
+                continue
+            depth -= 1
+            if depth == 0:
+                rules.append((prelude, css[body_start:i]))
+                start = i + 1
+        elif ch == ";" and depth == 0:
+            statement = css[start:i].strip()
+            if statement:
+                rules.append((statement, None))
+            start = i + 1
+    return rules
+
+def minify_selector(selector):
+    """Collapse whitespace in a selector, including around combinators."""
+    selector = " ".join(selector.split())
+    return re.sub(r'\s*([>+~,])\s*', r'\1', selector)
+
+def minify_declarations(body):
+    """Minify a declaration block's contents."""
+    declarations = []
+    for declaration in body.split(";"):
+        prop, colon, value = declaration.partition(":")
+        if colon and prop.strip():
+            declarations.append(f"{prop.strip()}:{' '.join(value.split())}")
+    return ";".join(declarations)
+
+def filter_rules(rules, names, check_tags, imports):
+    """Return minified CSS for the rules whose selectors match names.
+
+    @import statements are collected into imports, since they have to lead
+    the bundle, unless they load something in DROPPED_IMPORTS. @media/@supports blocks are filtered recursively; other
+    at-rules (@font-face, @keyframes) are kept as they are.
+    """
+    output = []
+    for prelude, body in rules:
+        if body is None:
+            if prelude.startswith("@import") and not any(host in prelude for host in DROPPED_IMPORTS):
+                imports.append(" ".join(prelude.split()))
+            continue
+        if prelude.startswith(("@media", "@supports")):
+            inner = filter_rules(parse_css(body), names, check_tags, imports)
+            if inner:
+                output.append(f"{' '.join(prelude.split())}{{{inner}}}")
+        elif prelude.startswith("@"):
+            if not check_tags:
+                output.append(f"{' '.join(prelude.split())}{{{' '.join(body.split())}}}")
+        else:
+            selectors = [s for s in prelude.split(",") if s.strip() and selector_matches(s, names, check_tags)]
+            declarations = minify_declarations(body)
+            if selectors and declarations:
+                output.append(f"{minify_selector(','.join(selectors))}{{{declarations}}}")
+    return "".join(output)
+
+def font_families(*sources):
+    """Return the font families named in CSS or HTML sources, in first-use order."""
+    families = (
+        family.strip(" '\"") for source in sources
+        for declaration in FONT_FAMILY.findall(source) for family in declaration.split(",")
+    )
+    return tuple(dict.fromkeys(family for family in families if family))
+
+def read_stylesheets(styles_dir, file_names, assets):
+    """Parse every stylesheet of a bundle, comments stripped and url()s fingerprinted."""
+    rules = []
+    for file_name in file_names:
+        path = os.path.join(styles_dir, file_name)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                css = f.read()
+        except Exception as e:
+            print(f"❌ Error reading {path}: {e}")
+            sys.exit(1)
+        css = rewrite_css_urls(re.sub(r"/\*.*?\*/", "", css, flags=re.S), "Styles", assets)
+        rules.extend(parse_css(css))
+    return rules
+
+def build_css_bundle(page_type, root, assets=None):
+    """Bundle, prune and minify one page type's stylesheets. Returns a CssBundle.
+
+    assets maps source paths to fingerprinted copies (see fingerprint_assets).
+    """
+    page_markup = "".join(read_template_source(name) for name in PAGE_TEMPLATES[page_type])
+    fold_markup = ""
+    for name, marker in ABOVE_THE_FOLD[page_type]:
+        source = read_template_source(name)
+        fold_markup += source.split(marker, 1)[0] if marker else source
+
+    rules = read_stylesheets(os.path.join(root, "Styles"), PAGE_STYLESHEETS[page_type], assets or {})
+    imports = []
+    css = filter_rules(rules, markup_names(page_markup), False, imports)
+    css = "".join(f"{statement};" for statement in dict.fromkeys(imports)) + css
+    critical_css = filter_rules(rules, markup_names(fold_markup), True, [])
+
+    content_hash = hash_bytes(css)
+    file_name = f"{page_type}.{content_hash[:10]}.css"
+    bundles_dir = os.path.join(root, *BUNDLES_DIR.split("/"))
+    os.makedirs(bundles_dir, exist_ok=True)
+    _, written = write_if_changed(os.path.join(bundles_dir, file_name), css)
+
+    # Drop this page type's bundles from earlier builds, compressed siblings included
+    for old_name in os.listdir(bundles_dir):
+        if old_name.startswith(f"{page_type}.") and not old_name.startswith(file_name):
+            os.remove(os.path.join(bundles_dir, old_name))
+
+    source_size = sum(os.path.getsize(os.path.join(root, "Styles", f)) for f in PAGE_STYLESHEETS[page_type])
+    print(f"{'✅' if written else '⏭️'} CSS bundle {file_name}: {source_size} → {len(css.encode('utf-8'))} bytes"
+          f" from {len(PAGE_STYLESHEETS[page_type])} stylesheets, {len(critical_css.encode('utf-8'))} bytes inlined")
+    return CssBundle(
+        page_type, f"/{BUNDLES_DIR}/{file_name}", critical_css, content_hash, font_families(css, page_markup)
+    )
+
+def build_css_bundles(root, assets=None):
+    """Build every page type's CSS bundle. Returns {page_type: CssBundle}."""
+    return {page_type: build_css_bundle(page_type, root, assets) for page_type in PAGE_STYLESHEETS}
+
+def render_stylesheets(out, bundle):
+    """Write a bundle's critical <style> and an async-loading <link> for the rest."""
+    out.write(f"<style>{bundle.critical_css}</style>\n")
+    out.write(f'    <link rel="preload" href="{bundle.href}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">\n')
+    out.write(f'    <noscript><link rel="stylesheet" href="{bundle.href}"></noscript>')
@@ -0,0 +1,169 @@
+import os
+import sys
+import json
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from urllib.parse import quote
+from xml.sax.saxutils import escape
+
+from build_manifest import hash_bytes
+from site_config import BASE_URL, article_url
+
+FEED_TITLE = "Provision Bookkeeping Blog"
+FEED_DESCRIPTION = "Bookkeeping, tax and QuickBooks advice for small and family-owned businesses."
+FEED_AUTHOR = "Provision Bookkeeping LLC"
+
+RSS_NAME = "feed.xml"
+ATOM_NAME = "atom.xml"
+JSON_FEED_NAME = "feed.json"
+
+# Newest articles included in every feed
+FEED_ITEMS = 20
+# Include each article's full text, not just its summary, when it is known
+FEED_FULL_CONTENT = True
+# Bump when the feed markup changes so unchanged windows are rewritten once
+FEED_VERSION = "1"
+
+def article_content(article):
+    """Return a parsed Article's text as HTML, the same markup its page uses."""
+    parts = [f"<p>{article.summary}</p>"]
+    for section in article.sections:
+        parts.append(f"<h2>{section.title}</h2>")
+        parts += [f"<p>{paragraph}</p>" for paragraph in section.paragraphs]
+    if article.final:
+        parts.append("<h2>Final Thoughts</h2>")
+        parts += [f"<p>{paragraph}</p>" for paragraph in article.final]
+    return "".join(parts)
+
+def published(item):
+    """A feed item's publish time in UTC; metadata dates have no time of day."""
+    return datetime.fromisoformat(item["date"]).replace(tzinfo=timezone.utc)
+
+def feed_items(articles, content, limit=FEED_ITEMS, full_content=FEED_FULL_CONTENT):
+    """Return the newest limit articles as plain feed item dicts."""
+    items = []
+    for record in articles[:limit]:
+        items.append({
+            "id": article_url(record["safe_title"]),
+            "title": record["title"],
+            "date": record["parsed_date"],
+            "author": record.get("author") or FEED_AUTHOR,
+            "summary": record["summary"],
+            "image": f"{BASE_URL}/{quote(record['image'])}" if record.get("image") else "",
+            "tags": record.get("tags", []),
+            "content": content.get(record["safe_title"], "") if full_content else "",
+        })
+    return items
+
+def write_rss(out, items):
+    """Stream an RSS 2.0 feed."""
+    updated = format_datetime(published(items[0])) if items else ""
+    out.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+    out.write('<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom"'
+              ' xmlns:content="http://purl.org/rss/1.0/modules/content/">\n<channel>\n')
+    out.write(f"<title>{escape(FEED_TITLE)}</title>\n<link>{BASE_URL}/blog</link>\n")
+    out.write(f"<description>{escape(FEED_DESCRIPTION)}</description>\n<language>en-us</language>\n")
+    out.write(f'<atom:link href="{BASE_URL}/{RSS_NAME}" rel="self" type="application/rss+xml"/>\n')
+    if updated:
+        out.write(f"<lastBuildDate>{updated}</lastBuildDate>\n")
+    for item in items:
+        url = escape(item["id"])
+        out.write(f"<item>\n<title>{escape(item['title'])}</title>\n<link>{url}</link>\n")
+        out.write(f'<guid isPermaLink="true">{url}</guid>\n')
+        out.write(f"<pubDate>{format_datetime(published(item))}</pubDate>\n")
+        for tag in item["tags"]:
+            out.write(f"<category>{escape(tag)}</category>\n")
+        out.write(f"<description>{escape(item['summary'])}</description>\n")
+        if item["content"]:
+            out.write(f"<content:encoded>{escape(item['content'])}</content:encoded>\n")
+        out.write("</item>\n")
+    out.write("</channel>\n</rss>\n")
+
+def write_atom(out, items):
+    """Stream an Atom 1.0 feed."""
+    updated = published(items[0]).isoformat() if items else "1970-01-01T00:00:00+00:00"
+    out.write('<?xml version="1.0" encoding="UTF-8"?>\n<feed xmlns="http://www.w3.org/2005/Atom">\n')
+    out.write(f"<id>{BASE_URL}/blog</id>\n<title>{escape(FEED_TITLE)}</title>\n")
+    out.write(f"<subtitle>{escape(FEED_DESCRIPTION)}</subtitle>\n<updated>{updated}</updated>\n")
+    out.write(f'<link href="{BASE_URL}/blog"/>\n<link rel="self" href="{BASE_URL}/{ATOM_NAME}"/>\n')
+    out.write(f"<author><name>{escape(FEED_AUTHOR)}</name></author>\n")
+    for item in items:
+        date = published(item).isoformat()
+        url = escape(item["id"], {chr(34): "&quot;"})
+        out.write(f"<entry>\n<id>{url}</id>\n<title>{escape(item['title'])}</title>\n")
+        out.write(f'<link href="{url}"/>\n<published>{date}</published>\n<updated>{date}</updated>\n')
+        out.write(f"<author><name>{escape(item['author'])}</name></author>\n")
+        for tag in item["tags"]:
+            out.write(f'<category term="{escape(tag, {chr(34): "&quot;"})}"/>\n')
+        out.write(f"<summary>{escape(item['summary'])}</summary>\n")
+        if item["content"]:
+            out.write(f'<content type="html">{escape(item["content"])}</content>\n')
+        out.write("</entry>\n")
+    out.write("</feed>\n")
+
+def write_json_feed(out, items):
+    """Stream a JSON Feed 1.1 document, one item at a time."""
+    header = {
+        "version": "https://jsonfeed.org/version/1.1",
+        "title": FEED_TITLE,
+        "home_page_url": f"{BASE_URL}/blog",
+        "feed_url": f"{BASE_URL}/{JSON_FEED_NAME}",
+        "description": FEED_DESCRIPTION,
+        "language": "en-US",
+        "authors": [{"name": FEED_AUTHOR}],
+    }
+    out.write(json.dumps(header, ensure_ascii=False)[:-1] + ', "items": [\n')
+    for index, item in enumerate(items):
+        entry = {
+            "id": item["id"],
+            "url": item["id"],
+            "title": item["title"],
+            "summary": item["summary"],
+            "date_published": published(item).isoformat(),
+            "authors": [{"name": item["author"]}],
+        }
+        if item["content"]:
+            entry["content_html"] = item["content"]
+        if item["image"]:
+            entry["image"] = item["image"]
+        if item["tags"]:
+            entry["tags"] = item["tags"]
+        out.write(("" if index == 0 else ",\n") + json.dumps(entry, ensure_ascii=False))
+    out.write("\n]}\n")
+
+FEEDS = [(RSS_NAME, write_rss), (ATOM_NAME, write_atom), (JSON_FEED_NAME, write_json_feed)]
+
+def generate_feeds(articles, parsed, output_dir, manifest, force=False):
+    """Write the RSS, Atom and JSON feeds for the newest FEED_ITEMS articles.
+
+    articles is the newest-first metadata; parsed holds the Articles built
+    this run, whose full text is cached in the build manifest for as long
+    as they are in the window. Feeds are only rewritten when the window of
+    items changes, so their Last-Modified stays put and readers keep
+    getting 304s.
+    """
+    state = manifest.data.setdefault("feeds", {})
+    content = state.setdefault("content", {})
+    window = {record["safe_title"] for record in articles[:FEED_ITEMS]}
+    for article in parsed:
+        if article.safe_title in window:
+            content[article.safe_title] = article_content(article)
+    for safe_title in content.keys() - window:
+        del content[safe_title]
+
+    items = feed_items(articles, content)
+    inputs = hash_bytes(json.dumps([FEED_VERSION, FEED_ITEMS, FEED_FULL_CONTENT, items], ensure_ascii=False))
+    outputs = [os.path.join(output_dir, name) for name, _ in FEEDS]
+    if not force and state.get("window") == inputs and all(map(os.path.exists, outputs)):
+        print(f"⏭️ Feeds unchanged: newest {len(items)} article(s) are the same")
+        return False
+
+    for output_file, (_, write_feed) in zip(outputs, FEEDS):
+        try:
+            written = manifest.write_output(output_file, lambda out: write_feed(out, items), inputs)
+        except Exception as e:
+            print(f"❌ Error writing {output_file}: {e}")
+            sys.exit(1)
+        print(f"{'✅ Feed written to' if written else '⏭️ Feed unchanged'}: {output_file}")
+    state["window"] = inputs
+    return True
@@ -0,0 +1,187 @@
+import os
+import concurrent.futures
+from html import escape
+
+from build_manifest import hash_file
+
+try:
+    from PIL import Image, ImageOps, features
+except ImportError:  # Pillow is optional; without it pages use the original images
+    Image = None
+
+# Width buckets for generated variants; originals narrower than a bucket are never upscaled
+IMAGE_WIDTHS = (480, 960, 1600)
+# Bump when the resize/encode settings change so cached variants are rebuilt
+ENCODER_VERSION = "1"
+VARIANTS_DIR = "Responsive"
+ENCODE_OPTIONS = {
+    "avif": ("AVIF", {"quality": 55}),
+    "webp": ("WEBP", {"quality": 78, "method": 6}),
+}
+# Browsers pick the first <source> they support, so best compression goes first
+FORMAT_ORDER = ("avif", "webp")
+
+# `sizes` hints matching the layouts in Styles/Articles.css and Styles/Blog.css
+ARTICLE_IMAGE_SIZES = "(max-width: 768px) 90vw, 50vw"
+BLOG_CARD_IMAGE_SIZES = "(max-width: 768px) 80vw, 460px"
+# `sizes` hints for the content images on site pages, by the class their
+# <img> has; images with none of these classes (logos, icons) are left as is
+SITE_PAGE_IMAGE_SIZES = {
+    "image": "(max-width: 850px) 85vw, 400px",        # Styles/How_It_Works.css
+    "side-image": "(max-width: 1000px) 80vw, 300px",  # Styles/About_Us.css
+    "QB": "40vw",                                     # Styles/Welcome.css
+}
+
+def supported_formats():
+    """Return the variant formats this Pillow build can encode."""
+    if Image is None:
+        return []
+    formats = []
+    for fmt in FORMAT_ORDER:
+        try:
+            if features.check(fmt):
+                formats.append(fmt)
+        except ValueError:
+            # Older Pillow releases don't know the feature name at all
+            pass
+    return formats
+
+def variant_path(image_path, width, fmt):
+    """Return the site-relative path of one resized variant of an image."""
+    folder, file_name = os.path.split(image_path)
+    stem = os.path.splitext(file_name)[0].replace(" ", "_")
+    return "/".join(filter(None, [folder, VARIANTS_DIR, f"{stem}-{width}.{fmt}"]))
+
+def encode_variants(source_file, image_path, root, formats):
+    """Resize one image into every width bucket and format. Returns its image info."""
+    with Image.open(source_file) as original:
+        original = ImageOps.exif_transpose(original)
+        width, height = original.size
+        if original.mode not in ("RGB", "RGBA"):
+            original = original.convert("RGBA" if "transparency" in original.info else "RGB")
+
+        variants = {fmt: [] for fmt in formats}
+        for bucket in sorted({min(w, width) for w in IMAGE_WIDTHS}):
+            resized = original
+            if bucket < width:
+                resized = original.resize((bucket, round(height * bucket / width)), Image.LANCZOS)
+            for fmt in formats:
+                rel_path = variant_path(image_path, bucket, fmt)
+                output_file = os.path.join(root, *rel_path.split("/"))
+                os.makedirs(os.path.dirname(output_file), exist_ok=True)
+                pil_format, options = ENCODE_OPTIONS[fmt]
+                resized.save(output_file, pil_format, **options)
+                variants[fmt].append([bucket, rel_path])
+
+    return {"width": width, "height": height, "variants": variants}
+
+def encode_image_job(job):
+    """Process-pool worker: encode one image, returning None if it can't be read."""
+    source_file, image_path, root, formats = job
+    print(f"🖼️ Generating variants for: {source_file}")
+    try:
+        return encode_variants(source_file, image_path, root, formats)
+    except Exception as e:
+        print(f"⚠️ Warning: Could not process {source_file}: {e}")
+        return None
+
+def generate_image_variants(image_paths, root, manifest, force=False, jobs=1):
+    """Build responsive variants for site-relative image paths.
+
+    Variants are cached in the build manifest by source hash, so unchanged
+    images are skipped; the rest are encoded across jobs processes. Returns
+    {image_path: info} for every image that has known dimensions; images
+    without info are rendered as plain <img> tags.
+    """
+    cache = manifest.data.setdefault("images", {})
+    formats = supported_formats()
+    if not formats:
+        print("⚠️ Pillow with WebP/AVIF support not installed, reusing cached image variants only")
+
+    images = {}
+    pending = []
+    for image_path in sorted(set(image_paths)):
+        source_file = os.path.join(root, *image_path.split("/"))
+        if not os.path.isfile(source_file):
+            print(f"⚠️ Warning: Image not found: {source_file}")
+            continue
+
+        source_hash = hash_file(source_file)
+        cached = cache.get(image_path)
+        up_to_date = (
+            cached
+            and cached.get("hash") == source_hash
+            and cached.get("encoder") == ENCODER_VERSION
+            and all(os.path.isfile(os.path.join(root, *p.split("/")))
+                    for sizes in cached["variants"].values() for _, p in sizes)
+        )
+        if up_to_date and (not force or not formats):
+            images[image_path] = cached
+            continue
+        if formats:
+            pending.append((image_path, source_hash, (source_file, image_path, root, formats)))
+
+    cached_count = len(images)
+    job_args = [job for *_, job in pending]
+    if jobs > 1 and len(pending) > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=min(jobs, len(pending))) as executor:
+            results = list(executor.map(encode_image_job, job_args))
+    else:
+        results = list(map(encode_image_job, job_args))
+
+    for (image_path, source_hash, _), info in zip(pending, results):
+        if info is None:
+            continue
+        info.update(hash=source_hash, encoder=ENCODER_VERSION)
+        cache[image_path] = info
+        images[image_path] = info
+
+    print(f"✅ Image variants: {len(images) - cached_count} generated, {cached_count} cached")
+    return images
+
+def render_picture(out, src, alt, info=None, sizes="100vw", css_class=None, loading=None, url=None):
+    """Write a <picture> with AVIF/WebP srcsets, or a plain <img> when there are no variants.
+
+    src is the URL of the original image, used as the fallback. url maps a
+    variant's site-relative path to its URL (by default "/" + path).
+    """
+    url = url or (lambda path: f"/{path}")
+    img_attributes = [f'src="{src}"', f'alt="{escape(alt)}"']
+    if info:
+        img_attributes.append(f'width="{info["width"]}" height="{info["height"]}"')
+    if loading:
+        img_attributes.append(f'loading="{loading}" decoding="async"')
+
+    variants = info["variants"] if info else {}
+    if not any(variants.values()):
+        if css_class:
+            img_attributes.append(f'class="{css_class}"')
+        out.write(f'<img {" ".join(img_attributes)}>')
+        return
+
+    out.write(f'<picture class="{css_class}">' if css_class else "<picture>")
+    out.write(picture_sources(variants, sizes, url))
+    out.write(f'<img {" ".join(img_attributes)}></picture>')
+
+def picture_sources(variants, sizes, url):
+    """Return the <source> tags for an image's variants, best compression first."""
+    return "".join(
+        f'<source type="image/{fmt}" srcset="{", ".join(f"{url(path)} {width}w" for width, path in variants[fmt])}"'
+        f' sizes="{sizes}">'
+        for fmt in FORMAT_ORDER if variants.get(fmt)
+    )
+
+def wrap_picture(img_tag, info, sizes="100vw", url=None):
+    """Wrap a hand-written <img> tag in a <picture> with its variants; the tag itself is kept as written."""
+    url = url or (lambda path: f"/{path}")
+    variants = info["variants"] if info else {}
+    if not any(variants.values()):
+        return img_tag
+    return f"<picture>{picture_sources(variants, sizes, url)}{img_tag}</picture>"
+
+def image_info_key(info):
+    """Return what the rendered markup depends on for an image, for manifest hashing."""
+    if not info:
+        return ""
+    return f"{info['width']}x{info['height']}:{info['variants']}"
+
@@ -0,0 +1,175 @@
+import os
+import re
+import sys
+import gzip
+import json
+import time
+
+from build_manifest import hash_bytes, write_if_changed
+
+SEARCH_INDEX_NAME = "search-index.json"
+# Bump when tokenizing, stemming or weighting changes so cached documents are re-indexed
+INDEX_VERSION = "1"
+
+# How much a term counts for, by where it appears in an article
+FIELD_WEIGHTS = {"title": 8, "summary": 3, "heading": 4, "body": 1}
+
+STOP_WORDS = set("""
+a about after all also an and any are as at be been but by can could do does for from had has
+have how i if in into is it its just more most my no not of on one or our out so some such than
+that the their them then there these they this to up us was we were what when which who why will
+with would you your
+""".split())
+
+WORD = re.compile(r"[a-z0-9]+")
+
+def stem(word):
+    """Strip common English suffixes so "saving", "saves" and "saved" match.
+
+    Deliberately small; JS/Search.js implements exactly the same rules.
+    """
+    if len(word) <= 3:
+        return word
+    if word.endswith("ies") and len(word) > 4:
+        word = word[:-3] + "y"
+    elif word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        word = word[:-1]
+    for suffix in ("ing", "ed", "ly"):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            word = word[:-len(suffix)]
+            if word[-1] == word[-2] and word[-1] not in "lsz":
+                word = word[:-1]
+            break
+    if word.endswith("e") and len(word) > 3:
+        word = word[:-1]
+    return word
+
+def tokenize(text):
+    """Lowercase, split into words, drop stop words and stem the rest."""
+    words = WORD.findall(text.lower().replace("'", "").replace("’", ""))
+    return [stem(word) for word in words if word not in STOP_WORDS]
+
+def document_terms(fields):
+    """Score every term of one document from (field, text) pairs. Returns {term: weight}."""
+    terms = {}
+    for field, text in fields:
+        weight = FIELD_WEIGHTS[field]
+        for term in tokenize(text):
+            terms[term] = terms.get(term, 0) + weight
+    return terms
+
+def article_fields(article):
+    """Return the (field, text) pairs indexed for a parsed Article."""
+    fields = [("title", article.title), ("summary", article.summary)]
+    for section in article.sections:
+        fields.append(("heading", section.title))
+        fields.extend(("body", paragraph) for paragraph in section.paragraphs)
+    fields.extend(("body", paragraph) for paragraph in article.final)
+    return fields
+
+def update_documents(cache, metadata, parsed):
+    """Bring the per-article term cache up to date and return how many were re-indexed.
+
+    cache maps safe_title -> {"hash", "terms"}. Articles parsed in this
+    build are indexed from their full text; only those whose text changed
+    are re-tokenized. Articles without a parsed source this build keep
+    their cached entry, or fall back to their title and summary.
+    """
+    reindexed = 0
+    for article in parsed:
+        fields = article_fields(article)
+        text_hash = hash_bytes(json.dumps([INDEX_VERSION, fields], ensure_ascii=False))
+        entry = cache.get(article.safe_title)
+        if not entry or entry.get("hash") != text_hash:
+            cache[article.safe_title] = {"hash": text_hash, "full": True, "terms": document_terms(fields)}
+            reindexed += 1
+
+    for article in metadata:
+        entry = cache.get(article["safe_title"])
+        if entry and entry.get("full"):
+            continue
+        fields = [("title", article["title"]), ("summary", article["summary"])]
+        text_hash = hash_bytes(json.dumps([INDEX_VERSION, fields], ensure_ascii=False))
+        if not entry or entry.get("hash") != text_hash:
+            cache[article["safe_title"]] = {"hash": text_hash, "full": False, "terms": document_terms(fields)}
+            reindexed += 1
+
+    # Drop articles that are no longer published
+    for safe_title in set(cache) - {a["safe_title"] for a in metadata}:
+        del cache[safe_title]
+    return reindexed
+
+def build_index(metadata, cache):
+    """Assemble the inverted index from the cached per-article terms.
+
+    metadata is newest first. docs lists [safe_title, title, date, summary]
+    in that order; terms maps each term to a flat [doc, weight, doc, weight,
+    ...] postings list.
+    """
+    docs = [[a["safe_title"], a["title"], a["date"], a["summary"]] for a in metadata]
+    postings = {}
+    for doc, article in enumerate(metadata):
+        for term, weight in cache[article["safe_title"]]["terms"].items():
+            postings.setdefault(term, []).extend((doc, weight))
+    return {"version": INDEX_VERSION, "docs": docs, "terms": dict(sorted(postings.items()))}
+
+def search(index, query):
+    """Return doc numbers matching every query word, best first; the last word matches as a prefix.
+
+    Mirrors the search in JS/Search.js; used to measure query latency.
+    """
+    words = tokenize(query)
+    if not words:
+        return []
+    scores = None
+    for position, word in enumerate(words):
+        if position == len(words) - 1:
+            matches = [postings for term, postings in index["terms"].items() if term.startswith(word)]
+        else:
+            matches = [index["terms"].get(word, [])]
+        word_scores = {}
+        for postings in matches:
+            for i in range(0, len(postings), 2):
+                word_scores[postings[i]] = word_scores.get(postings[i], 0) + postings[i + 1]
+        if scores is None:
+            scores = word_scores
+        else:
+            scores = {doc: score + word_scores[doc] for doc, score in scores.items() if doc in word_scores}
+    return sorted(scores, key=lambda doc: (-scores[doc], doc))
+
+def measure_query_latency(index, queries):
+    """Return the mean time in milliseconds to run the sample queries."""
+    if not queries:
+        return 0.0
+    start = time.perf_counter()
+    for query in queries:
+        search(index, query)
+    return (time.perf_counter() - start) * 1000 / len(queries)
+
+def generate_search_index(metadata, parsed, output_dir, manifest, force=False):
+    """Write search-index.json for every published article.
+
+    Per-article terms are cached in the build manifest, so a build only
+    re-tokenizes the articles whose text changed; force re-indexes all.
+    """
+    cache = {} if force else manifest.data.get("search", {})
+    reindexed = update_documents(cache, metadata, parsed)
+    manifest.data["search"] = cache
+
+    index = build_index(metadata, cache)
+    content = json.dumps(index, ensure_ascii=False, separators=(",", ":"))
+    output_file = os.path.join(output_dir, SEARCH_INDEX_NAME)
+    try:
+        _, written = write_if_changed(output_file, content)
+    except Exception as e:
+        print(f"❌ Error writing {output_file}: {e}")
+        sys.exit(1)
+
+    size = len(content.encode("utf-8"))
+    gzipped = len(gzip.compress(content.encode("utf-8")))
+    queries = [" ".join(doc[1].split()[:2]) for doc in index["docs"]] + [doc[1][:3] for doc in index["docs"]]
+    latency = measure_query_latency(index, queries)
+    print(f"{'✅' if written else '⏭️'} Search index {output_file}: {len(index['docs'])} articles"
+          f" ({reindexed} re-indexed), {len(index['terms'])} terms, {size} bytes ({gzipped} gzipped),"
+          f" {latency:.3f} ms per query")
+    return index
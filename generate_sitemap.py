@@ -1,126 +1,450 @@
 #!/usr/bin/env python3
 import os
 import json
-from datetime import datetime
+import time
+import glob
+import argparse
+import concurrent.futures
+from dataclasses import dataclass
+from datetime import date
+from xml.sax.saxutils import escape
+import urllib.error
+import urllib.parse
 import urllib.request
 
+from articles_metadata import MetadataStore
+from build_manifest import BuildManifest, hash_bytes, hash_file, replace_if_changed, write_if_changed
+from compress_outputs import compress_outputs
+from build_metrics import BuildMetrics, quiet_output
+from site_config import BASE_URL, SERVICE_AREAS, STATIC_PAGES, article_url
+
 # ----------------------------------------------------------------------
 # Configuration
 # ----------------------------------------------------------------------
-BASE_URL         = "https://provisionbk.com"
 PROJECT_ROOT     = os.getcwd()
 OUTPUT_PATH      = os.path.join(PROJECT_ROOT, "sitemap.xml")
-META_PATH        = os.path.join(PROJECT_ROOT, "Articles", "articles_metadata.json")
-HTML_DIR         = os.path.join(PROJECT_ROOT, "Articles", "Article_HTMLs")
+ARTICLES_DIR     = os.path.join(PROJECT_ROOT, "Articles")
 
-# Static pages
-STATIC_PAGES = [
-    "/", "/about-us", "/services", "/contact-us", "/blog",
-    "/privacy-policy", "/terms-of-service", "/sitemap"
-]
+# Limits per sitemap file from the sitemaps.org protocol; past either one
+# the URLs are split across files listed in a sitemap index
+MAX_URLS_PER_SITEMAP  = 50000
+MAX_BYTES_PER_SITEMAP = 50 * 1024 * 1024
 
-# Service areas
-SERVICE_AREAS = [
-    "gilbert-az-bookkeeping", "phoenix-az-bookkeeping", "scottsdale-az-bookkeeping",
-    "tempe-az-bookkeeping", "tucson-az-bookkeeping", "mesa-az-bookkeeping",
-    "chandler-az-bookkeeping", "glendale-az-bookkeeping", "peoria-az-bookkeeping",
-    "surprise-az-bookkeeping", "yuma-az-bookkeeping"
-]
+XML_HEADER   = '<?xml version="1.0" encoding="UTF-8"?>\n'
+URLSET_OPEN  = '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n\n'
+URLSET_CLOSE = '</urlset>\n'
 
 # ----------------------------------------------------------------------
-# Load metadata + get real file dates
+# lastmod tracking
 # ----------------------------------------------------------------------
-blog_entries = []
+class LastmodTracker:
+    """Dates each URL by when its content hash last changed, kept in the build manifest.
 
-if not os.path.isfile(META_PATH):
-    print(f"ERROR: Metadata file not found: {META_PATH}")
-else:
-    print(f"Found metadata: {META_PATH}")
-    try:
-        with open(META_PATH, "r", encoding="utf-8") as f:
-            articles = json.load(f)
-
-        for art in articles:
-            safe_title = art.get("safe_title", "").strip()
-            if not safe_title or not safe_title.lower().endswith(".html"):
-                safe_title = (safe_title or "unknown") + ".html" if not safe_title.lower().endswith(".html") else safe_title
-
-            html_path = os.path.join(HTML_DIR, safe_title)
-
-            # Use file mod time if exists
-            if os.path.isfile(html_path):
-                iso_date = datetime.fromtimestamp(os.path.getmtime(html_path)).date().isoformat()
-            else:
-                # Fallback to JSON
-                parsed = art.get("parsed_date", "").split("T")[0]
-                if parsed:
-                    iso_date = parsed
-                else:
-                    try:
-                        iso_date = datetime.strptime(art.get("date", ""), "%B %d, %Y").date().isoformat()
-                    except:
-                        iso_date = datetime.today().date().isoformat()
-                print(f"  Warning: HTML not found: {html_path} → using JSON date")
-
-            url_path = f"articles/{safe_title}"
-            blog_entries.append((url_path, iso_date))
-
-    except Exception as e:
-        print(f"ERROR parsing JSON: {e}")
+    Rebuilding a page without changing it keeps its lastmod, unlike file
+    mtimes, which every rebuild resets.
+    """
+
+    def __init__(self, manifest, today=None):
+        self.manifest = manifest
+        self.entries = manifest.data.setdefault("lastmod", {})
+        self.today = (today or date.today()).isoformat()
+        self.changed = []
+        self.seen = set()
+
+    def lastmod(self, loc, content_hash, first_seen=None):
+        """Return the lastmod for loc, moving it to today if content_hash changed.
+
+        first_seen dates a URL the tracker hasn't recorded yet (e.g. an
+        article's publish date); it defaults to today.
+        """
+        self.seen.add(loc)
+        entry = self.entries.get(loc)
+        if entry and entry["hash"] == content_hash:
+            return entry["date"]
+        lastmod = self.today if entry else (first_seen or self.today)
+        self.entries[loc] = {"hash": content_hash, "date": lastmod}
+        self.changed.append(f"{BASE_URL}/{loc.lstrip('/')}")
+        return lastmod
+
+    def prune(self):
+        """Forget URLs that are no longer in the sitemap, e.g. deleted articles."""
+        for loc in self.entries.keys() - self.seen:
+            del self.entries[loc]
+
+    def output_hash(self, loc, path, written=None):
+        """Return the content hash of the file served at loc.
+
+        Pages the build recorded come from the build manifest. Others are
+        only hashed when written (the paths the build wrote this run) says
+        they changed or they have no recorded hash yet; without written
+        every such file is hashed.
+        """
+        entry = self.manifest.data["outputs"].get(self.manifest.key(path))
+        if entry:
+            return entry["hash"]
+        if written is not None and loc in self.entries and self.manifest.key(path) not in written:
+            return self.entries[loc]["hash"]
+        return hash_file(path) if os.path.isfile(path) else ""
+
+def page_file(project_root, page):
+    """Return the HTML file a static page URL is served from."""
+    name = page.strip("/") or "index"
+    return os.path.join(project_root, f"{name}.html")
 
 # ----------------------------------------------------------------------
-# Write XML
+# Entries
 # ----------------------------------------------------------------------
-def write_url(f, loc, lastmod, changefreq, priority):
-    f.write("  <url>\n")
-    f.write(f"    <loc>{loc}</loc>\n")
-    f.write(f"    <lastmod>{lastmod}</lastmod>\n")
-    f.write(f"    <changefreq>{changefreq}</changefreq>\n")
-    f.write(f"    <priority>{priority:.1f}</priority>\n")
-    f.write("  </url>\n\n")
-
-os.makedirs(os.path.dirname(OUTPUT_PATH), exist_ok=True)
-today = datetime.today().date().isoformat()
+def article_entries(articles, tracker, project_root=PROJECT_ROOT):
+    """Yield (url path, lastmod) for every article record, without touching the article pages.
 
-with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
-    f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
-    f.write('<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n\n')
+    An article's content hash is the one the build recorded for its page;
+    one that was never built is dated by its metadata record instead.
+    """
+    outputs = tracker.manifest.data["outputs"]
+    for art in articles:
+        name = art["safe_title"].removesuffix(".html")
+        url_path = article_url(name).removeprefix(BASE_URL)
+        key = tracker.manifest.key(os.path.join(project_root, "Articles", "Article_HTMLs", f"{name}.html"))
+        entry = outputs.get(key)
+        content_hash = entry["hash"] if entry else hash_bytes(json.dumps(art, sort_keys=True))
+        yield url_path, tracker.lastmod(url_path, content_hash, art.get("parsed_date", "").split("T")[0] or None)
 
+def sitemap_entries(articles, tracker, project_root=PROJECT_ROOT, written=None):
+    """Yield (loc, lastmod, changefreq, priority) for every URL in the sitemap."""
     for page in STATIC_PAGES:
         prio = 1.0 if page == "/" else 0.9 if page in ("/services", "/blog") else 0.5
-        write_url(f, f"{BASE_URL}{page}", today, "weekly", prio)
+        lastmod = tracker.lastmod(page, tracker.output_hash(page, page_file(project_root, page), written))
+        yield f"{BASE_URL}{page}", lastmod, "weekly", prio
 
     for area in SERVICE_AREAS:
-        write_url(f, f"{BASE_URL}/{area}", today, "monthly", 0.8)
+        loc = f"/{area}"
+        lastmod = tracker.lastmod(loc, tracker.output_hash(loc, page_file(project_root, area), written))
+        yield f"{BASE_URL}{loc}", lastmod, "monthly", 0.8
+
+    for url_path, mod_date in article_entries(articles, tracker, project_root):
+        yield f"{BASE_URL}{url_path}", mod_date, "weekly", 0.9
+
+    yield f"{BASE_URL}/sitemap.xml", tracker.lastmod("/sitemap.xml", ""), "monthly", 0.3
+
+# ----------------------------------------------------------------------
+# Write XML
+# ----------------------------------------------------------------------
+def format_url(loc, lastmod, changefreq, priority):
+    """Return one <url> element, ready to be written in a single call."""
+    return (
+        f"  <url>\n"
+        f"    <loc>{escape(loc)}</loc>\n"
+        f"    <lastmod>{lastmod}</lastmod>\n"
+        f"    <changefreq>{changefreq}</changefreq>\n"
+        f"    <priority>{priority:.1f}</priority>\n"
+        f"  </url>\n\n"
+    )
+
+class SitemapWriter:
+    """Streams <url> elements into buffered sitemap files, starting a new shard at the size limits.
+
+    Shards are written to temp files and only moved into place by close(),
+    so a failed run leaves the previous sitemap intact.
+    """
+
+    def __init__(self, output_path, max_urls=MAX_URLS_PER_SITEMAP, max_bytes=MAX_BYTES_PER_SITEMAP):
+        self.output_path = output_path
+        self.max_urls = max_urls
+        self.max_bytes = max_bytes
+        self.shards = []  # (temp path, newest lastmod, url count)
+        self.file = None
+        self.total = 0
+
+    def shard_path(self, number):
+        stem, ext = os.path.splitext(self.output_path)
+        return f"{stem}-{number}{ext}"
+
+    def open_shard(self):
+        path = f"{self.shard_path(len(self.shards) + 1)}.tmp"
+        self.file = open(path, "w", encoding="utf-8", buffering=1 << 16)
+        self.file.write(XML_HEADER + URLSET_OPEN)
+        self.bytes = len(XML_HEADER) + len(URLSET_OPEN) + len(URLSET_CLOSE)
+        self.shards.append([path, "", 0])
+
+    def close_shard(self):
+        self.file.write(URLSET_CLOSE)
+        self.file.close()
+        self.file = None
+
+    def write(self, loc, lastmod, changefreq, priority):
+        """Write one URL, rolling over to a new shard if this one is full."""
+        element = format_url(loc, lastmod, changefreq, priority)
+        size = len(element.encode("utf-8"))
+        if self.file is not None and (self.shards[-1][2] >= self.max_urls or self.bytes + size > self.max_bytes):
+            self.close_shard()
+        if self.file is None:
+            self.open_shard()
+        self.file.write(element)
+        self.bytes += size
+        shard = self.shards[-1]
+        shard[1] = max(shard[1], lastmod)
+        shard[2] += 1
+        self.total += 1
 
-    for rel_path, mod_date in blog_entries:
-        write_url(f, f"{BASE_URL}/{rel_path}", mod_date, "weekly", 0.9)
+    def close(self):
+        """Finish the last shard and write the index if there is more than one.
 
-    write_url(f, f"{BASE_URL}/sitemap.xml", today, "monthly", 0.3)
+        Files whose content is unchanged are left alone, mtime included; their
+        .gz/.br siblings are written by compress_outputs. Returns the list of
+        sitemap files that changed.
+        """
+        if self.file is None:
+            self.open_shard()
+        self.close_shard()
 
-    f.write('</urlset>\n')
+        if len(self.shards) == 1:
+            targets = [self.output_path]
+        else:
+            targets = [self.shard_path(number) for number in range(1, len(self.shards) + 1)]
+        written = [path for (tmp_path, _, _), path in zip(self.shards, targets)
+                   if replace_if_changed(tmp_path, path)[1]]
+        if len(self.shards) > 1 and write_if_changed(self.output_path, self.index())[1]:
+            written.insert(0, self.output_path)
+
+        # Drop shards left over from an earlier, larger sitemap
+        number = len(self.shards) + 1 if len(self.shards) > 1 else 1
+        while os.path.exists(self.shard_path(number)):
+            stale = self.shard_path(number)
+            for path in (stale, f"{stale}.gz", f"{stale}.br"):
+                if os.path.exists(path):
+                    os.remove(path)
+            number += 1
+        return written
+
+    def index(self):
+        """Return the sitemap index listing every shard."""
+        base = os.path.dirname(self.output_path)
+        parts = [XML_HEADER, '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n']
+        for number, (_, lastmod, _) in enumerate(self.shards, start=1):
+            name = os.path.relpath(self.shard_path(number), base).replace(os.sep, "/")
+            parts.append(f"  <sitemap>\n    <loc>{escape(f'{BASE_URL}/{name}')}</loc>\n"
+                         f"    <lastmod>{lastmod}</lastmod>\n  </sitemap>\n")
+        parts.append("</sitemapindex>\n")
+        return "".join(parts)
+
+def write_sitemap(entries, output_path=OUTPUT_PATH):
+    """Stream entries into output_path (sharded if needed). Returns (files that changed, url count)."""
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    writer = SitemapWriter(output_path)
+    try:
+        for entry in entries:
+            writer.write(*entry)
+        return writer.close(), writer.total
+    finally:
+        if writer.file is not None:
+            writer.file.close()
+        for tmp_path, _, _ in writer.shards:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
 
 # ----------------------------------------------------------------------
-# Ping Google & Bing
+# Search engine notification
 # ----------------------------------------------------------------------
-def ping_search_engines():
-    sitemap_url = f"{BASE_URL}/sitemap.xml"
-    for url in [
-        f"https://www.google.com/ping?sitemap={sitemap_url}",
-        f"https://www.bing.com/ping?sitemap={sitemap_url}"
-    ]:
+# Sitemap ping URLs; {sitemap} is replaced by the sitemap's URL
+PING_ENDPOINTS = [
+    "https://www.google.com/ping?sitemap={sitemap}",
+    "https://www.bing.com/ping?sitemap={sitemap}",
+]
+INDEXNOW_ENDPOINT = "https://api.indexnow.org/indexnow"
+# IndexNow needs a key that is also served as {BASE_URL}/{key}.txt
+INDEXNOW_KEY      = os.environ.get("INDEXNOW_KEY", "")
+INDEXNOW_MAX_URLS = 10000
+
+NOTIFY_TIMEOUT = 5     # seconds per attempt
+NOTIFY_RETRIES = 2     # extra attempts after the first
+NOTIFY_BACKOFF = 0.5   # seconds before the first retry, doubled each time
+
+@dataclass
+class NotifyResult:
+    """Outcome of notifying one endpoint."""
+    endpoint: str
+    ok: bool
+    status: int = None
+    attempts: int = 0
+    error: str = ""
+    seconds: float = 0.0
+    started: float = 0.0  # time.perf_counter() when the first attempt began
+
+def send_notification(url, data=None, timeout=NOTIFY_TIMEOUT, retries=NOTIFY_RETRIES, backoff=NOTIFY_BACKOFF):
+    """GET url (or POST data as JSON), retrying timeouts, connection errors, 429s and 5xxs.
+
+    Returns a NotifyResult; never raises.
+    """
+    headers = {"User-Agent": "provisionbk-sitemap"}
+    if data is not None:
+        headers["Content-Type"] = "application/json; charset=utf-8"
+        data = json.dumps(data).encode("utf-8")
+    start = time.perf_counter()
+    result = NotifyResult(url, False, started=start)
+    for attempt in range(retries + 1):
+        result.attempts = attempt + 1
         try:
-            urllib.request.urlopen(url, timeout=10)
-            print(f"Pinged: {url}")
-        except:
-            print(f"Ping failed: {url}")
+            with urllib.request.urlopen(urllib.request.Request(url, data, headers), timeout=timeout) as response:
+                result.ok, result.status, result.error = True, response.status, ""
+                break
+        except urllib.error.HTTPError as e:
+            result.status, result.error = e.code, f"HTTP {e.code} {e.reason}"
+            if e.code != 429 and e.code < 500:
+                break
+        except (urllib.error.URLError, OSError) as e:
+            result.error = str(getattr(e, "reason", e))
+        if attempt < retries:
+            time.sleep(backoff * 2 ** attempt)
+    result.seconds = time.perf_counter() - start
+    return result
+
+def indexnow_payload(urls, key=INDEXNOW_KEY):
+    """Return the IndexNow JSON body for a batch of URLs on this site."""
+    return {
+        "host": urllib.parse.urlparse(BASE_URL).netloc,
+        "key": key,
+        "keyLocation": f"{BASE_URL}/{key}.txt",
+        "urlList": urls,
+    }
+
+def notify_search_engines(changed_urls, ping_endpoints=PING_ENDPOINTS, indexnow_endpoint=INDEXNOW_ENDPOINT,
+                          indexnow_key=INDEXNOW_KEY, timeout=NOTIFY_TIMEOUT, retries=NOTIFY_RETRIES):
+    """Ping every sitemap endpoint and submit changed_urls to IndexNow, all concurrently.
+
+    IndexNow is skipped without a key. Returns a NotifyResult per request.
+    """
+    sitemap_url = urllib.parse.quote(f"{BASE_URL}/sitemap.xml", safe="")
+    calls = [(endpoint.format(sitemap=sitemap_url), None) for endpoint in ping_endpoints]
+    if indexnow_key and indexnow_endpoint:
+        for i in range(0, len(changed_urls), INDEXNOW_MAX_URLS):
+            batch = changed_urls[i:i + INDEXNOW_MAX_URLS]
+            calls.append((indexnow_endpoint, indexnow_payload(batch, indexnow_key)))
+    if not calls:
+        return []
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(calls)) as executor:
+        results = list(executor.map(
+            lambda call: send_notification(*call, timeout=timeout, retries=retries), calls
+        ))
+    for result in results:
+        if result.ok:
+            print(f"Notified: {result.endpoint} (HTTP {result.status}, {result.seconds:.2f}s)")
+        else:
+            print(f"Notify failed: {result.endpoint} after {result.attempts} attempt(s): {result.error}")
+    return results
 
-ping_search_engines()
+def queue_notifications(manifest, changed_urls):
+    """Add changed_urls to the URLs waiting to be notified and return them all.
+
+    The queue is kept in the build manifest, so URLs from a build that fails
+    before notifying are sent by the next build that gets that far.
+    """
+    pending = manifest.data.setdefault("notify_pending", [])
+    pending += [url for url in changed_urls if url not in pending]
+    return list(pending)
+
+def notify_changed(changed_urls, metrics, ping_endpoints=PING_ENDPOINTS, indexnow_endpoint=INDEXNOW_ENDPOINT):
+    """Notify search engines about changed_urls, if there are any, and record each request in metrics."""
+    if not changed_urls:
+        print("No URLs changed since the last build, not notifying search engines")
+        return []
+    results = notify_search_engines(changed_urls, ping_endpoints, indexnow_endpoint)
+    print(f"Notified {sum(r.ok for r in results)}/{len(results)} endpoint(s) about {len(changed_urls)} changed URL(s)")
+    for lane, result in enumerate(results, start=1):
+        metrics.span(f"notify {urllib.parse.urlparse(result.endpoint).netloc}", result.started, result.seconds, lane)
+    metrics.count("notify_requests", len(results))
+    metrics.count("notify_failures", sum(not r.ok for r in results))
+    metrics.count("notify_retries", sum(r.attempts - 1 for r in results))
+    if results:
+        metrics.count("notify_max_ms", round(max(r.seconds for r in results) * 1000))
+    return results
 
 # ----------------------------------------------------------------------
-# Done
+# Main
 # ----------------------------------------------------------------------
-print(f"\nSitemap generated: {OUTPUT_PATH}")
-print(f"   {len(STATIC_PAGES)} static pages")
-print(f"   {len(SERVICE_AREAS)} service areas")
-print(f"   {len(blog_entries)} blog articles")
\ No newline at end of file
+def generate_sitemap(articles, manifest, output_path=OUTPUT_PATH, project_root=PROJECT_ROOT, written=None):
+    """Write the sitemap for the static pages, service areas and articles.
+
+    articles are the metadata records already loaded by the caller and
+    written the paths it wrote this run (see LastmodTracker.output_hash).
+    lastmod dates are tracked in the build manifest; the caller saves it.
+    Returns (number of URLs written, URLs whose content changed).
+    """
+    tracker = LastmodTracker(manifest)
+    written = None if written is None else {manifest.key(path) for path in written}
+    entries = sitemap_entries(articles, tracker, project_root, written)
+    files, total = write_sitemap(entries, output_path)
+    tracker.prune()
+    for path in files:
+        print(f"Sitemap written: {path}")
+    if not files:
+        print(f"Sitemap unchanged: {output_path}")
+    return total, tracker.changed
+
+def build_sitemap(args, metrics):
+    """Load the metadata, write and compress the sitemap, then notify search engines."""
+    with metrics.stage("load metadata"):
+        meta_path = os.path.join(ARTICLES_DIR, "articles_metadata.json")
+        articles = []
+        if not os.path.isfile(meta_path):
+            print(f"ERROR: Metadata file not found: {meta_path}")
+        else:
+            print(f"Found metadata: {meta_path}")
+            articles = MetadataStore(ARTICLES_DIR).load().newest_first()
+
+    with metrics.stage("write sitemap"):
+        manifest = BuildManifest(ARTICLES_DIR)
+        total, changed = generate_sitemap(articles, manifest)
+        pending = changed if args.no_notify else queue_notifications(manifest, changed)
+
+    with metrics.stage("compress sitemap"):
+        stem, ext = os.path.splitext(OUTPUT_PATH)
+        compressed = compress_outputs(sorted(glob.glob(f"{stem}*{ext}")), manifest)
+        manifest.save()
+
+    with metrics.stage("notify"):
+        if args.no_notify:
+            print("Skipping search engine notification (--no-notify)")
+        else:
+            notify_changed(pending, metrics, args.ping_endpoint or PING_ENDPOINTS, args.indexnow_endpoint)
+            manifest.data["notify_pending"] = []
+            manifest.save()
+
+    metrics.count("articles", len(articles))
+    metrics.count("urls", total)
+    metrics.count("urls_changed", len(changed))
+    metrics.count("files_compressed", len(compressed))
+
+    print(f"\nSitemap generated: {OUTPUT_PATH}")
+    print(f"   {len(STATIC_PAGES)} static pages")
+    print(f"   {len(SERVICE_AREAS)} service areas")
+    print(f"   {len(articles)} blog articles")
+    print(f"   {total} URLs")
+    metrics.print_summary()
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate sitemap.xml and notify search engines.")
+    parser.add_argument("--no-notify", action="store_true", help="skip search engine notification")
+    parser.add_argument("--ping-endpoint", action="append", metavar="URL",
+                        help="sitemap ping URL with a {sitemap} placeholder (repeatable; replaces the defaults)")
+    parser.add_argument("--indexnow-endpoint", default=INDEXNOW_ENDPOINT, metavar="URL",
+                        help=f"IndexNow API URL (default: {INDEXNOW_ENDPOINT}); needs INDEXNOW_KEY set")
+    parser.add_argument("--profile", nargs="?", const="sitemap-profile", metavar="PREFIX",
+                        help="write cProfile stats to PREFIX.prof and a Chrome trace to PREFIX.trace.json"
+                             " (default PREFIX: sitemap-profile)")
+    parser.add_argument("--quiet", "-q", action="store_true",
+                        help="print only errors, warnings and one summary line")
+    args = parser.parse_args()
+
+    metrics = BuildMetrics("sitemap")
+    if args.profile:
+        metrics.start_profile()
+    with quiet_output(args.quiet):
+        build_sitemap(args, metrics)
+    if args.quiet:
+        print(metrics.summary_line())
+    if args.profile:
+        metrics.write_profile(args.profile)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+import io
+import re
+import json
+
+# Whitespace next to these tags never renders, so it can be dropped entirely;
+# elsewhere a run of whitespace is collapsed to one space
+BLOCK_TAGS = {
+    "html", "head", "body", "title", "meta", "link", "script", "style", "noscript", "header", "footer",
+    "nav", "main", "section", "article", "aside", "div", "p", "h1", "h2", "h3", "h4", "h5", "h6",
+    "ul", "ol", "li", "form", "table", "thead", "tbody", "tr", "td", "th", "picture", "source", "br",
+    "hr", "iframe", "!doctype",
+}
+# Comments, <pre>/<textarea> kept byte for byte, <script>/<style> with their body, any other tag
+TOKEN = re.compile(
+    r"<!--.*?-->"
+    r"|<(pre|textarea)\b.*?</\1\s*>"
+    r"|<(script|style)\b([^>]*)>(.*?)</\2\s*>"
+    r"|<[^>]+>",
+    re.S | re.I,
+)
+TAG_NAME = re.compile(r"</?\s*([!\w-]+)")
+# An attribute value in quotes, or a run of anything else inside a tag
+TAG_PART = re.compile(r'"[^"]*"|\'[^\']*\'|[^"\']+')
+WHITESPACE = re.compile(r"\s+")
+
+def minify_tag(tag):
+    """Collapse whitespace between a tag's attributes, leaving quoted values untouched."""
+    parts = []
+    for part in TAG_PART.findall(tag):
+        if part[0] in "\"'":
+            parts.append(part)
+        else:
+            parts.append(WHITESPACE.sub(" ", part).replace(" >", ">").replace(" />", "/>").replace("< ", "<"))
+    return "".join(parts)
+
+# Characters after which a "/" starts a regex literal rather than a division
+REGEX_PRECEDERS = set("(,=:[!&|?{};+-*%<>~^")
+# Spaces around these JS punctuators can go
+JS_PUNCTUATION = set("{}();,=:<>&|!?[]")
+
+def minify_js(js):
+    """Conservatively minify inline JavaScript.
+
+    Comments are dropped, whitespace outside string/regex literals is
+    collapsed and removed around punctuation. Line breaks are kept unless
+    the previous or next character makes them redundant, so automatic
+    semicolon insertion still sees the same statements.
+    """
+    out = []
+    i, n = 0, len(js)
+    pending_space = pending_newline = False
+
+    def last_significant():
+        return out[-1][-1] if out else ""
+
+    def flush(next_char):
+        nonlocal pending_space, pending_newline
+        prev = last_significant()
+        if pending_newline and prev and prev not in "{;,(" and next_char not in "})":
+            out.append("\n")
+        elif (pending_space or pending_newline) and prev and prev not in JS_PUNCTUATION \
+                and next_char not in JS_PUNCTUATION:
+            out.append(" ")
+        pending_space = pending_newline = False
+
+    while i < n:
+        ch = js[i]
+        if ch in " \t\r\f\v":
+            pending_space = True
+            i += 1
+        elif ch == "\n":
+            pending_newline = True
+            i += 1
+        elif js.startswith("//", i):
+            end = js.find("\n", i)
+            i = n if end == -1 else end
+        elif js.startswith("/*", i):
+            end = js.find("*/", i + 2)
+            i = n if end == -1 else end + 2
+            pending_space = True
+        elif ch in "\"'`" or (ch == "/" and (last_significant() in REGEX_PRECEDERS or not out)):
+            # String, template or regex literal: copy up to the matching unescaped delimiter
+            flush(ch)
+            j = i + 1
+            in_class = False
+            while j < n:
+                if js[j] == "\\":
+                    j += 2
+                    continue
+                if ch == "/" and js[j] == "[":
+                    in_class = True
+                elif ch == "/" and js[j] == "]":
+                    in_class = False
+                elif js[j] == ch and not in_class:
+                    break
+                elif js[j] == "\n" and ch != "`":
+                    break
+                j += 1
+            out.append(js[i:j + 1])
+            i = j + 1
+        else:
+            flush(ch)
+            out.append(ch)
+            i += 1
+    return "".join(out).strip()
+
+def minify_script(attributes, body):
+    """Minify a <script> body: JSON-LD is re-serialized compactly, JS minified."""
+    if not body.strip():
+        return ""
+    if "ld+json" in attributes.lower():
+        try:
+            return json.dumps(json.loads(body), ensure_ascii=False, separators=(",", ":"))
+        except ValueError:
+            return body.strip()
+    if "type=" in attributes.lower() and "javascript" not in attributes.lower() and "module" not in attributes.lower():
+        return body  # Templates or other data blocks; leave them alone
+    return minify_js(body)
+
+def minify_style(body):
+    """Trim a <style> body's lines; the build's stylesheets are already minified."""
+    return "".join(line.strip() for line in body.splitlines())
+
+def is_block(tag):
+    match = TAG_NAME.match(tag)
+    return bool(match) and match.group(1).lower() in BLOCK_TAGS
+
+def minify_html(html):
+    """Return html with insignificant whitespace and comments removed.
+
+    <pre> and <textarea> content and attribute values are left untouched;
+    inline scripts, JSON-LD and styles are minified. Conditional comments
+    are kept.
+    """
+    out = io.StringIO()
+    position = 0
+    text = ""
+    previous_block = True
+    for match in TOKEN.finditer(html):
+        # Text on either side of a dropped comment is joined and collapsed as one run
+        text += html[position:match.start()]
+        token = match.group(0)
+        position = match.end()
+        if token.startswith("<!--") and not token.startswith("<!--[if"):
+            continue
+
+        next_block = is_block(token)
+        collapsed = WHITESPACE.sub(" ", text)
+        if previous_block:
+            collapsed = collapsed.lstrip()
+        if next_block:
+            collapsed = collapsed.rstrip()
+        out.write(collapsed)
+        text = ""
+
+        if match.group(1):  # <pre> / <textarea>
+            out.write(token)
+        elif match.group(2):  # <script> / <style>
+            open_tag = minify_tag(f"<{match.group(2)}{match.group(3)}>")
+            body = match.group(4)
+            if match.group(2).lower() == "script":
+                body = minify_script(match.group(3), body)
+            else:
+                body = minify_style(body)
+            out.write(f"{open_tag}{body}</{match.group(2)}>")
+        else:
+            out.write(minify_tag(token))
+        previous_block = next_block
+
+    tail = WHITESPACE.sub(" ", text + html[position:])
+    out.write(tail.strip() if previous_block else tail.rstrip())
+    return out.getvalue()
+
+def minifying(render, sizes):
+    """Wrap a render(out) function so its HTML is minified on the way out.
+
+    (bytes before, bytes after) is appended to sizes for every page.
+    """
+    def render_minified(out):
+        buffer = io.StringIO()
+        render(buffer)
+        html = buffer.getvalue()
+        minified = minify_html(html)
+        sizes.append((len(html.encode("utf-8")), len(minified.encode("utf-8"))))
+        out.write(minified)
+    return render_minified
+
+def format_savings(before, after):
+    """Describe a size reduction, e.g. "24310 → 18012 bytes (-25.9%)"."""
+    percent = (before - after) * 100 / before if before else 0.0
+    return f"{before} → {after} bytes (-{percent:.1f}%)"
@@ -0,0 +1,94 @@
+import os
+import re
+import hashlib
+import functools
+
+TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Templates")
+
+# {{ name }} is replaced by a per-page variable; {% include "partials/x.html" %}
+# is inlined when the template is compiled. A newline right after an include
+# tag is dropped so includes can sit on their own line.
+TAG_PATTERN = re.compile(r'\{\{\s*(\w+)\s*\}\}|\{%\s*include\s+"([^"]+)"\s*%\}\n?')
+
+class Template:
+    """A compiled template: literal text chunks interleaved with variable names.
+
+    Variables are written straight to the output file handle. A variable
+    whose value is callable is called with the handle instead, which is how
+    repeated blocks (sections, blog cards) stream into the same output.
+    """
+
+    def __init__(self, name, chunks):
+        self.name = name
+        self.chunks = chunks
+
+    def render(self, out, **context):
+        """Render the template to a file-like object."""
+        for literal, var in self.chunks:
+            out.write(literal)
+            if var is None:
+                continue
+            try:
+                value = context[var]
+            except KeyError:
+                raise KeyError(f"Template {self.name} needs a value for '{var}'") from None
+            if callable(value):
+                value(out)
+            else:
+                out.write(str(value))
+
+    def map_literals(self, func):
+        """Return a copy of the template with func applied to every literal chunk."""
+        return Template(self.name, [(func(literal), var) for literal, var in self.chunks])
+
+def read_template_source(name, including=()):
+    """Return a template's text with every include inlined."""
+    if name in including:
+        raise ValueError(f"Template include cycle: {' -> '.join(including + (name,))}")
+
+    with open(os.path.join(TEMPLATES_DIR, name), "r", encoding="utf-8") as f:
+        source = f.read()
+
+    def inline(match):
+        if match.group(2) is None:
+            return match.group(0)
+        return read_template_source(match.group(2), including + (name,))
+
+    return TAG_PATTERN.sub(inline, source)
+
+@functools.lru_cache(maxsize=None)
+def load_template(name):
+    """Compile a template from Templates/ once per process and cache it."""
+    source = read_template_source(name)
+    chunks = []
+    position = 0
+    for match in TAG_PATTERN.finditer(source):
+        chunks.append((source[position:match.start()], match.group(1)))
+        position = match.end()
+    chunks.append((source[position:], None))
+    return Template(name, chunks)
+
+@functools.lru_cache(maxsize=None)
+def template_includes(name):
+    """Return name and every template it includes, directly or not, each once in include order."""
+    with open(os.path.join(TEMPLATES_DIR, name), "r", encoding="utf-8") as f:
+        source = f.read()
+    names = [name]
+    for match in TAG_PATTERN.finditer(source):
+        if match.group(2) is not None:
+            names += [n for n in template_includes(match.group(2)) if n not in names]
+    return tuple(names)
+
+def templates_version(names):
+    """Hash the named templates, so an edit to any of them changes the version."""
+    digest = hashlib.sha256()
+    for name in names:
+        digest.update(name.encode("utf-8"))
+        with open(os.path.join(TEMPLATES_DIR, *name.split("/")), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def clear_template_caches():
+    """Forget compiled templates and include lists, e.g. after a template changed on disk."""
+    load_template.cache_clear()
+    template_includes.cache_clear()
@@ -0,0 +1,34 @@
+from urllib.parse import quote
+
+BASE_URL = "https://provisionbk.com"
+
+# Top-level pages, by URL path; each is served from <name>.html at the site root
+STATIC_PAGES = [
+    "/", "/about-us", "/services", "/contact-us", "/blog",
+    "/privacy-policy", "/terms-of-service", "/sitemap"
+]
+
+# Service area landing pages, by slug
+SERVICE_AREAS = [
+    "gilbert-az-bookkeeping", "phoenix-az-bookkeeping", "scottsdale-az-bookkeeping",
+    "tempe-az-bookkeeping", "tucson-az-bookkeeping", "mesa-az-bookkeeping",
+    "chandler-az-bookkeeping", "glendale-az-bookkeeping", "peoria-az-bookkeeping",
+    "surprise-az-bookkeeping", "yuma-az-bookkeeping"
+]
+
+# Hand-maintained pages, rendered from Templates/pages/<path> to <path> at the
+# site root, with the stylesheet bundle of their page type (None for none)
+SITE_PAGES = [
+    ("index.html", "index"),
+    ("about-us.html", "about-us"),
+    ("contact-us.html", "contact-us"),
+    ("privacy-policy.html", "privacy-policy"),
+    ("terms-of-service.html", "terms-of-service"),
+    ("sitemap.html", "sitemap"),
+    ("home/index.html", None),
+    ("contact/index.html", None),
+]
+
+def article_url(safe_title):
+    """Canonical URL of an article page, as in its <link rel="canonical">, percent-encoded."""
+    return f"{BASE_URL}/Articles/Article_HTMLs/{quote(safe_title.removesuffix('.html'))}"
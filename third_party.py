@@ -0,0 +1,138 @@
+from xml.sax.saxutils import escape
+
+# How each third-party embed is loaded on generated pages, per strategy:
+#   calendly:  "eager" loads the widget with the page; "interaction" loads it
+#              the first time a visitor hovers, focuses or touches a booking link
+#   analytics: "eager" loads gtag.js with the page; "idle" once the page has
+#              loaded and the browser is idle
+#   fonts:     "google" links the Google Fonts stylesheet; "local" serves the
+#              vendored subsets in Fonts/ (see vendor_fonts.py)
+LOADING_STRATEGIES = {
+    "eager": {"calendly": "eager", "analytics": "eager", "fonts": "google"},
+    "deferred": {"calendly": "interaction", "analytics": "idle", "fonts": "local"},
+}
+DEFAULT_STRATEGY = "deferred"
+
+GTAG_ID = "G-V4S9TY013M"
+GTAG_URL = f"https://www.googletagmanager.com/gtag/js?id={GTAG_ID}"
+# Longest the idle callback may wait before analytics loads anyway, in ms
+ANALYTICS_IDLE_TIMEOUT = 5000
+
+CALENDLY_ORIGIN = "https://assets.calendly.com"
+CALENDLY_SCRIPT = "JS/Calendly.js"
+# The floating booking badge, drawn by JS/Calendly.js without the widget
+CALENDLY_BADGE = {
+    "url": "https://calendly.com/provisionbk/15min",
+    "text": "Schedule a Call",
+    "color": "#fad962",
+    "text-color": "#00446f",
+}
+
+# Google Fonts family parameter of every web font the site uses. A page
+# only loads the families its stylesheets name (see CssBundle.font_families).
+GOOGLE_FONT_FAMILIES = {
+    "Montserrat": "Montserrat:wght@400..800",
+    "Google Sans Code": "Google+Sans+Code:ital,wght@0,300..800;1,300..800",
+}
+# Vendored Latin subsets as (family, style, weight range, site-relative path).
+# A page preloads the first of the ones it uses, since that sets most of its text.
+FONT_FACES = [
+    ("Montserrat", "normal", "400 800", "Fonts/montserrat-normal-latin.woff2"),
+    ("Google Sans Code", "normal", "300 800", "Fonts/google-sans-code-normal-latin.woff2"),
+    ("Google Sans Code", "italic", "300 800", "Fonts/google-sans-code-italic-latin.woff2"),
+]
+LATIN_UNICODE_RANGE = (
+    "U+0000-00FF,U+0131,U+0152-0153,U+02BB-02BC,U+02C6,U+02DA,U+02DC,U+0304,U+0308,U+0329,"
+    "U+2000-206F,U+20AC,U+2122,U+2191,U+2193,U+2212,U+2215,U+FEFF,U+FFFD"
+)
+
+def google_fonts_url(families):
+    """Return the Google Fonts stylesheet URL that loads families."""
+    params = "".join(f"family={GOOGLE_FONT_FAMILIES[family]}&" for family in families)
+    return f"https://fonts.googleapis.com/css2?{params}display=swap"
+
+# Every family at once, as vendor_fonts.py downloads them
+GOOGLE_FONTS_URL = google_fonts_url(GOOGLE_FONT_FAMILIES)
+
+def resolve_strategy(name, assets):
+    """Return the per-embed loading choices for a strategy name.
+
+    Local fonts fall back to Google Fonts while the vendored files are
+    missing from assets (the fingerprinted asset map).
+    """
+    if name not in LOADING_STRATEGIES:
+        raise ValueError(f"Unknown third-party loading strategy: {name}")
+    choices = dict(LOADING_STRATEGIES[name])
+    if choices["fonts"] == "local" and not all(path in assets for *_, path in FONT_FACES):
+        print("⚠️ Warning: Vendored fonts missing from Fonts/ (run python vendor_fonts.py), using Google Fonts")
+        choices["fonts"] = "google"
+    return choices
+
+def font_tags(choice, asset_url, families):
+    faces = [face for face in FONT_FACES if face[0] in families]
+    if not faces:
+        return []
+    if choice == "google":
+        return [
+            '<link rel="preconnect" href="https://fonts.googleapis.com">',
+            '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>',
+            f'<link rel="stylesheet" href="{google_fonts_url(dict.fromkeys(face[0] for face in faces))}">',
+        ]
+    rules = "".join(
+        f"@font-face{{font-family:'{family}';font-style:{style};font-weight:{weight};font-display:swap;"
+        f"src:url('{asset_url(path)}') format('woff2');unicode-range:{LATIN_UNICODE_RANGE}}}"
+        for family, style, weight, path in faces
+    )
+    return [
+        f'<link rel="preload" href="{asset_url(faces[0][3])}" as="font" type="font/woff2" crossorigin>',
+        f"<style>{rules}</style>",
+    ]
+
+def analytics_tags(choice):
+    queue = (
+        "window.dataLayer = window.dataLayer || [];\n"
+        "      function gtag(){dataLayer.push(arguments);}\n"
+        "      gtag('js', new Date());\n"
+        f"      gtag('config', '{GTAG_ID}');\n"
+    )
+    if choice == "eager":
+        return [f'<script async src="{GTAG_URL}"></script>', f"<script>\n      {queue}    </script>"]
+    # gtag() only queues onto dataLayer, so calls made before gtag.js arrives still count
+    return [
+        f"<script>\n      {queue}"
+        "      addEventListener('load', function () {\n"
+        "        function load() {\n"
+        "          var script = document.createElement('script');\n"
+        "          script.async = true;\n"
+        f"          script.src = '{GTAG_URL}';\n"
+        "          document.head.appendChild(script);\n"
+        "        }\n"
+        f"        if (window.requestIdleCallback) requestIdleCallback(load, {{timeout: {ANALYTICS_IDLE_TIMEOUT}}});\n"
+        "        else setTimeout(load, 1);\n"
+        "      });\n"
+        "    </script>"
+    ]
+
+def calendly_tags(choice, asset_url):
+    badge = "".join(
+        f' data-badge-{name}="{escape(value, {chr(34): "&quot;"})}"' for name, value in CALENDLY_BADGE.items()
+    )
+    if choice == "eager":
+        return [
+            f'<link rel="preconnect" href="{CALENDLY_ORIGIN}">',
+            f'<script src="{asset_url(CALENDLY_SCRIPT)}"{badge} data-load="eager" defer></script>',
+        ]
+    return [
+        f'<link rel="dns-prefetch" href="{CALENDLY_ORIGIN}">',
+        f'<script src="{asset_url(CALENDLY_SCRIPT)}"{badge} defer></script>',
+    ]
+
+def third_party_html(choices, asset_url, families=tuple(GOOGLE_FONT_FAMILIES)):
+    """Return the <head> tags that load fonts, analytics and Calendly the way choices say.
+
+    Only the web fonts among families (the ones a page's styles name) are loaded.
+    """
+    tags = font_tags(choices["fonts"], asset_url, families)
+    tags += analytics_tags(choices["analytics"])
+    tags += calendly_tags(choices["calendly"], asset_url)
+    return "\n    ".join(tags)
@@ -0,0 +1,57 @@
+#python vendor_fonts.py
+
+import os
+import re
+import sys
+import urllib.request
+
+from third_party import FONT_FACES, GOOGLE_FONTS_URL
+
+# Google Fonts only serves woff2 to browsers it knows support it
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0"
+
+# Each subset comes as its own @font-face block, preceded by a /* subset */ comment
+LATIN_FACE = re.compile(r"/\*\s*latin\s*\*/\s*@font-face\s*\{([^}]*)\}")
+DESCRIPTOR = re.compile(r"([\w-]+)\s*:\s*([^;]+);")
+FONT_URL = re.compile(r"url\(([^)]+\.woff2)\)")
+
+def fetch(url):
+    with urllib.request.urlopen(urllib.request.Request(url, headers={"User-Agent": USER_AGENT}), timeout=30) as r:
+        return r.read()
+
+def latin_faces(css):
+    """Return {(family, style): woff2 URL} for the Latin subset of every face in a Google Fonts stylesheet."""
+    faces = {}
+    for block in LATIN_FACE.findall(css):
+        descriptors = {name: value.strip().strip("'\"") for name, value in DESCRIPTOR.findall(block)}
+        url = FONT_URL.search(descriptors.get("src", ""))
+        if url:
+            faces[(descriptors.get("font-family"), descriptors.get("font-style", "normal"))] = url.group(1)
+    return faces
+
+def vendor_fonts(root="."):
+    """Download the Latin subset of every face in FONT_FACES into the site."""
+    try:
+        faces = latin_faces(fetch(GOOGLE_FONTS_URL).decode("utf-8"))
+    except Exception as e:
+        print(f"❌ Error fetching {GOOGLE_FONTS_URL}: {e}")
+        sys.exit(1)
+
+    for family, style, _, path in FONT_FACES:
+        url = faces.get((family, style))
+        if url is None:
+            print(f"❌ Error: Google Fonts has no Latin subset for {family} ({style})")
+            sys.exit(1)
+        output_file = os.path.join(root, *path.split("/"))
+        try:
+            data = fetch(url)
+            os.makedirs(os.path.dirname(output_file), exist_ok=True)
+            with open(output_file, "wb") as f:
+                f.write(data)
+        except Exception as e:
+            print(f"❌ Error downloading {url}: {e}")
+            sys.exit(1)
+        print(f"✅ {family} ({style}) vendored to: {output_file} ({len(data)} bytes)")
+
+if __name__ == "__main__":
+    vendor_fonts()